@@ -0,0 +1,79 @@
+"""
+Measure the cost of an Execution log poll as the number of logs grows.
+
+Runs fully in memory against a stand-in API object, so no credentials are
+needed. From the repository root:
+
+    python -m benchmarks.bench_log_polling
+    python benchmarks/bench_log_polling.py
+
+Each row adds a batch of new log lines on top of the logs already received
+and times a single poll. With incremental fetching and the hashed de-dup
+index the time per poll should stay flat instead of growing with the total.
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+if __package__ is None:  # Run as a script: make the repository importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yepcode_run.run.execution import Execution
+
+BATCH_SIZE = 100
+CHECKPOINTS = [1_000, 5_000, 10_000, 25_000, 50_000]
+
+
+class InMemoryApi:
+    def __init__(self):
+        self.logs: List[Dict[str, Any]] = []
+        self.start = datetime(2025, 1, 1)
+
+    def add_logs(self, count: int) -> None:
+        offset = len(self.logs)
+        self.logs.extend(
+            {
+                "timestamp": (self.start + timedelta(milliseconds=offset + i)).isoformat(),
+                "level": "INFO",
+                "message": f"Log line {offset + i}",
+            }
+            for i in range(count)
+        )
+
+    def get_execution_logs(self, id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        page, limit = params["page"], params["limit"]
+        return {
+            "data": self.logs[page * limit : (page + 1) * limit],
+            "hasNextPage": (page + 1) * limit < len(self.logs),
+        }
+
+
+class BenchExecution(Execution):
+    def _start(self) -> None:
+        pass  # Logs are polled by hand
+
+
+def main() -> None:
+    api = InMemoryApi()
+    execution = BenchExecution(api, "benchmark-execution")
+
+    print(f"{'logs received':>14} {'poll time (ms)':>15}")
+    for checkpoint in CHECKPOINTS:
+        while len(api.logs) < checkpoint - BATCH_SIZE:
+            api.add_logs(BATCH_SIZE)
+            execution._poll_logs()
+
+        api.add_logs(BATCH_SIZE)
+        started = time.perf_counter()
+        execution._poll_logs()
+        elapsed = (time.perf_counter() - started) * 1000
+
+        assert len(execution.logs) == len(api.logs)
+        print(f"{len(execution.logs):>14} {elapsed:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+import base64
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from yepcode_run import YepCodeApiConfig
+from yepcode_run.api.api_manager import YepCodeApiManager
+from yepcode_run.utils.config_manager import ConfigManager
+
+
+TEAM_ID = "test-team"
+CLIENT_ID = f"sa-{TEAM_ID}-abcd1234"
+
+
+def make_access_token(expires_in: float = 3600) -> str:
+    """Build an unsigned JWT-like token good enough for the SDK to parse."""
+
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    payload = {"client_id": CLIENT_ID, "exp": int(time.time() + expires_in)}
+    return f"{encode({'alg': 'none'})}.{encode(payload)}.signature"
+
+
+class FakeYepCodeApi:
+    """
+    Local stand-in for the YepCode REST API.
+
+    Routes are registered as (method, path regex) pairs and receive the parsed
+    request, returning a (status, body, headers) tuple.
+    """
+
+    def __init__(self):
+        self.routes = []
+        self.requests = []
+        self.connections = set()
+        self.auth_requests = 0
+        self.token_expires_in = 3600
+        self._lock = threading.Lock()
+        self.route("POST", r"/auth/token", self._auth)
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                parsed = urlparse(self.path)
+                path = re.sub(rf"^/api/{TEAM_ID}/rest", "", parsed.path)
+                request = {
+                    "method": self.command,
+                    "path": path,
+                    "params": {k: v[0] for k, v in parse_qs(parsed.query).items()},
+                    "headers": dict(self.headers),
+                    "body": raw_body,
+                    "time": time.monotonic(),
+                }
+                with fake._lock:
+                    fake.requests.append(request)
+                    fake.connections.add(self.client_address)
+                status, body, headers = fake._dispatch(request)
+                payload = (
+                    body
+                    if isinstance(body, bytes)
+                    else json.dumps(body).encode() if body is not None else b""
+                )
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    for key, value in (headers or {}).items():
+                        self.send_header(key, value)
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # The client timed out
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+        class Server(ThreadingHTTPServer):
+            # Room for the bursts of connections of the stress tests
+            request_queue_size = 512
+
+        self.server = Server(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def config(self, **kwargs) -> YepCodeApiConfig:
+        return YepCodeApiConfig(
+            api_host=self.url,
+            client_id=CLIENT_ID,
+            client_secret="secret",
+            timeout=5000,
+            **kwargs,
+        )
+
+    def route(self, method: str, path: str, handler) -> None:
+        self.routes.insert(0, (method, re.compile(f"^{path}$"), handler))
+
+    def requests_to(self, method: str, path: str):
+        pattern = re.compile(f"^{path}$")
+        return [
+            r for r in self.requests if r["method"] == method and pattern.match(r["path"])
+        ]
+
+    def install_process_routes(
+        self, statuses=("RUNNING", "FINISHED"), logs=(), return_value=None
+    ):
+        """
+        Emulate processes and executions in memory. Every execution reports
+        the given statuses in order, one per GET /executions/{id}.
+        """
+        self.processes = {}
+        self.executions = {}
+        self.sync_timeout = False
+        self.execution_script = {
+            "statuses": list(statuses),
+            "logs": list(logs),
+            "return_value": return_value,
+        }
+
+        def get_process(request, slug):
+            if slug in self.processes:
+                return self.processes[slug]
+            return 404, {"message": "Process not found"}
+
+        def create_process(request):
+            body = json.loads(request["body"])
+            process = {"id": f"process-{len(self.processes)}", "slug": body["name"]}
+            self.processes[body["name"]] = process
+            self.processes[process["id"]] = process
+            return process
+
+        def delete_process(request, id):
+            process = self.processes.pop(id, None)
+            if process:
+                self.processes.pop(process["slug"], None)
+            return 204, None
+
+        def execute(request, id):
+            if id not in self.processes:
+                return 404, {"message": "Process not found"}
+            execution_id = f"execution-{len(self.executions)}"
+            body = json.loads(request["body"] or b"{}")
+            self.executions[execution_id] = {
+                "processId": self.processes[id]["id"],
+                "parameters": body.get("parameters"),
+                "comment": body.get("comment"),
+                "polls": 0,
+                **self.execution_script,
+            }
+            return {"executionId": execution_id}
+
+        def execute_sync(request, id):
+            response = execute(request, id)
+            if isinstance(response, tuple):
+                return response
+            execution_id = response["executionId"]
+            execution = self.executions[execution_id]
+            headers = {"Yep-Execution-Id": execution_id}
+            if self.sync_timeout:
+                return 504, {"message": "Sync execution timeout"}, headers
+            execution["polls"] = len(execution["statuses"]) - 1
+            if execution["statuses"][-1] != "FINISHED":
+                return 500, {"message": "Execution failed"}, headers
+            return 200, execution["return_value"], headers
+
+        def poll_execution(id):
+            execution = self.executions[id]
+            statuses = execution["statuses"]
+            status = statuses[min(execution["polls"], len(statuses) - 1)]
+            execution["polls"] += 1
+            return {
+                "id": id,
+                "processId": execution["processId"],
+                "parameters": execution["parameters"],
+                "comment": execution["comment"],
+                "status": status,
+                "timeline": {"events": [{"status": status, "timestamp": "2025-01-01T00:00:00"}]},
+                "returnValue": (
+                    json.dumps(execution["return_value"])
+                    if status == "FINISHED" and execution["return_value"] is not None
+                    else None
+                ),
+            }
+
+        def get_execution(request, id):
+            if id not in self.executions:
+                return 404, {"message": "Execution not found"}
+            return poll_execution(id)
+
+        def get_executions(request):
+            # Every listed execution counts as a status poll
+            process_id = request["params"].get("processId")
+            page = int(request["params"].get("page", 0))
+            limit = int(request["params"].get("limit", 100))
+            ids = [
+                id
+                for id, execution in self.executions.items()
+                if process_id in (None, execution["processId"])
+            ]
+            return {
+                "data": [poll_execution(id) for id in ids[page * limit : (page + 1) * limit]],
+                "hasNextPage": (page + 1) * limit < len(ids),
+                "page": page,
+                "limit": limit,
+                "total": len(ids),
+            }
+
+        def get_logs(request, id):
+            logs = self.executions[id]["logs"]
+            page = int(request["params"].get("page", 0))
+            limit = int(request["params"].get("limit", 100))
+            return {
+                "data": logs[page * limit : (page + 1) * limit],
+                "hasNextPage": (page + 1) * limit < len(logs),
+                "page": page,
+                "limit": limit,
+                "total": len(logs),
+            }
+
+        def kill(request, id):
+            self.executions[id]["statuses"] = ["KILLED"]
+            return 204, None
+
+        self.route("GET", r"/processes/([^/]+)", get_process)
+        self.route("POST", r"/processes", create_process)
+        self.route("DELETE", r"/processes/([^/]+)", delete_process)
+        self.route("POST", r"/processes/([^/]+)/execute", execute)
+        self.route("POST", r"/processes/([^/]+)/execute-sync", execute_sync)
+        self.route("GET", r"/executions", get_executions)
+        self.route("GET", r"/executions/([^/]+)", get_execution)
+        self.route("GET", r"/executions/([^/]+)/logs", get_logs)
+        self.route("PUT", r"/executions/([^/]+)/kill", kill)
+
+    def _auth(self, request):
+        with self._lock:
+            self.auth_requests += 1
+        return 200, {"access_token": make_access_token(self.token_expires_in)}, None
+
+    def _dispatch(self, request):
+        for method, pattern, handler in self.routes:
+            if method == request["method"] and (match := pattern.match(request["path"])):
+                result = handler(request, *match.groups())
+                if not isinstance(result, tuple):
+                    return 200, result, None
+                return result + (None,) * (3 - len(result))
+        return 404, {"message": "Not found"}, None
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    # Keep real credentials from the environment away from the stand-in server
+    monkeypatch.setattr(
+        ConfigManager, "read_yepcode_env_config", staticmethod(YepCodeApiConfig)
+    )
+    api = FakeYepCodeApi()
+    api.start()
+    yield api
+    YepCodeApiManager.clear_instances()
+    api.stop()
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from yepcode_run import AsyncYepCodeRun, AsyncYepCodeApi, ExecutionStatus
+
+CODE = """def main():
+    print("hello")
+    return {"message": "hello"}"""
+
+LOGS = [
+    {"timestamp": "2025-01-01T00:00:01", "level": "INFO", "message": "Log message 1"},
+    {"timestamp": "2025-01-01T00:00:02", "level": "INFO", "message": "Log message 2"},
+]
+
+
+def test_run_and_wait_for_done(fake_api):
+    fake_api.install_process_routes(
+        statuses=["RUNNING", "FINISHED"], logs=LOGS, return_value={"message": "hello"}
+    )
+
+    async def main():
+        logs, finished = [], []
+
+        async def on_finish(return_value):
+            finished.append(return_value)
+
+        runner = AsyncYepCodeRun(fake_api.config())
+        execution = await runner.run(
+            CODE,
+            {
+                "language": "python",
+                "onLog": lambda log: logs.append(log.message),
+                "onFinish": on_finish,
+            },
+        )
+        await execution.wait_for_done()
+        await runner.yepcode_api.close()
+        return execution, logs, finished
+
+    execution, logs, finished = asyncio.run(main())
+
+    assert execution.status == ExecutionStatus.FINISHED
+    assert execution.return_value == {"message": "hello"}
+    assert logs == ["Log message 1", "Log message 2"]
+    assert finished == [{"message": "hello"}]
+
+
+def test_tracks_many_executions_concurrently(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "RUNNING", "FINISHED"])
+
+    async def main():
+        runner = AsyncYepCodeRun(fake_api.config())
+        executions = await asyncio.gather(
+            *[runner.run(CODE, {"language": "python"}) for _ in range(20)]
+        )
+        await asyncio.gather(*[e.wait_for_done() for e in executions])
+        await runner.yepcode_api.close()
+        return executions
+
+    executions = asyncio.run(main())
+
+    assert len({e.id for e in executions}) == 20
+    assert all(e.status == ExecutionStatus.FINISHED for e in executions)
+
+
+def test_remove_on_done_deletes_process(fake_api):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+
+    async def main():
+        runner = AsyncYepCodeRun(fake_api.config())
+        execution = await runner.run(
+            CODE, {"language": "python", "removeOnDone": True}
+        )
+        await execution.wait_for_done()
+        await runner.yepcode_api.close()
+
+    asyncio.run(main())
+
+    assert len(fake_api.requests_to("DELETE", r"/processes/.+")) == 1
+    assert fake_api.processes == {}
+
+
+def test_run_modes(fake_api):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    runner = AsyncYepCodeRun(fake_api.config())
+
+    async def main():
+        for mode in ("sync", "fast"):
+            with pytest.raises(ValueError):
+                await runner.run(CODE, {"language": "python", "mode": mode})
+        execution = await runner.run(CODE, {"language": "python", "mode": "auto"})
+        await execution.wait_for_done()
+
+    asyncio.run(main())
+    assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 1
+
+
+def test_raises_api_errors(fake_api):
+    async def main():
+        async with AsyncYepCodeApi(fake_api.config()) as api:
+            await api.get_execution("missing")
+
+    with pytest.raises(Exception) as exc_info:
+        asyncio.run(main())
+    assert exc_info.value.status == 404
+
+
+def test_iter_logs(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"], logs=LOGS)
+
+    async def main():
+        runner = AsyncYepCodeRun(fake_api.config())
+        execution = await runner.run(CODE, {"language": "python"})
+        messages = [log.message async for log in execution.iter_logs()]
+        await runner.yepcode_api.close()
+        return execution, messages
+
+    execution, messages = asyncio.run(main())
+
+    assert messages == ["Log message 1", "Log message 2"]
+    assert execution.status == ExecutionStatus.FINISHED
+
+
+
+def test_iter_logs_ends_when_polling_is_cancelled(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING"] * 100, logs=LOGS)
+
+    async def main():
+        runner = AsyncYepCodeRun(fake_api.config())
+        execution = await runner.run(CODE, {"language": "python"})
+        execution._task.cancel()
+        messages = [log.message async for log in execution.iter_logs()]
+        await runner.yepcode_api.close()
+        return messages
+
+    assert asyncio.run(main()) == []
+
+
+def test_closes_the_client_of_each_event_loop(fake_api):
+    fake_api.route("GET", r"/processes/([^/]+)", lambda request, id: {"id": id})
+    api = AsyncYepCodeApi(fake_api.config())
+    clients = []
+
+    async def main():
+        await api.get_process("process-0")
+        clients.append(await api._get_client())
+
+    asyncio.run(main())
+    asyncio.run(main())
+
+    assert clients[0] is not clients[1]
+    assert all(client.is_closed for client in clients)
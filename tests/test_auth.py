@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from yepcode_run import YepCodeApi
+from yepcode_run.api.yepcode_api import BaseYepCodeApi
+
+from conftest import make_access_token
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_parses_the_token_expiry_once(fake_api, monkeypatch):
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+    parsed = []
+    parse = BaseYepCodeApi._parse_access_token_expiry
+    monkeypatch.setattr(
+        BaseYepCodeApi,
+        "_parse_access_token_expiry",
+        staticmethod(lambda token: parsed.append(token) or parse(token)),
+    )
+
+    with YepCodeApi(fake_api.config()) as api:
+        for i in range(5):
+            api.get_process(f"process-{i}")
+
+    assert len(parsed) == 1
+
+
+def test_refreshes_the_token_before_it_expires(fake_api):
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+    fake_api.token_expires_in = 30
+
+    with YepCodeApi(fake_api.config(token_refresh_skew=60)) as api:
+        api.get_process("process-0")
+        first_token = api.access_token
+
+        # Slow auth: requests keep using the valid token meanwhile
+        auth = fake_api._auth
+        fake_api.route("POST", r"/auth/token", lambda r: time.sleep(0.5) or auth(r))
+        fake_api.token_expires_in = 3600
+        started_at = time.monotonic()
+        for i in range(3):
+            api.get_process(f"process-{i}")
+        assert time.monotonic() - started_at < 0.5
+
+        wait_for(lambda: api.access_token != first_token)
+        assert fake_api.auth_requests == 2
+        api.get_process("process-3")
+        assert fake_api.auth_requests == 2
+
+
+def test_expired_tokens_are_refreshed_before_the_request(fake_api):
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+
+    with YepCodeApi(fake_api.config()) as api:
+        api.access_token = make_access_token(expires_in=-10)
+        api.get_process("process-0")
+
+        assert fake_api.auth_requests == 1
+        (request,) = fake_api.requests_to("GET", r"/processes/.+")
+        assert request["headers"]["Authorization"] == f"Bearer {api.access_token}"
+
+
+def test_tokens_without_expiry_are_renewed_when_rejected(fake_api):
+    token = make_access_token().split(".")
+    token[1] = token[1][:-4]  # Truncated payload: no readable "exp"
+    unreadable_token = ".".join(token)
+    fake_api.route(
+        "GET",
+        r"/processes/(.+)",
+        lambda request, id: (
+            (401, {"message": "Unauthorized"})
+            if request["headers"]["Authorization"] == f"Bearer {unreadable_token}"
+            else {"id": id}
+        ),
+    )
+
+    with YepCodeApi(fake_api.config()) as api:
+        assert BaseYepCodeApi._parse_access_token_expiry(unreadable_token) is None
+        api.access_token = unreadable_token
+        for i in range(3):
+            api.get_process(f"process-{i}")
+
+    assert fake_api.auth_requests == 1
+    assert len(fake_api.requests_to("GET", r"/processes/.+")) == 4
+
+
+def test_static_access_tokens_are_not_refreshed(fake_api):
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+    config = fake_api.config(access_token=make_access_token(expires_in=30))
+    config.client_id = config.client_secret = None
+
+    with YepCodeApi(config) as api:
+        api.get_process("process-0")
+
+    assert fake_api.auth_requests == 0
+
+
+def run_concurrently(count, fn):
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def target(i):
+        barrier.wait()
+        try:
+            fn(i)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_concurrent_callers_share_one_auth_request(fake_api):
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+    auth = fake_api._auth
+    fake_api.route("POST", r"/auth/token", lambda r: time.sleep(0.2) or auth(r))
+
+    with YepCodeApi(fake_api.config(pool_maxsize=300)) as api:
+        api.access_token = make_access_token(expires_in=-10)
+        run_concurrently(300, lambda i: api.get_process(f"process-{i}"))
+
+    assert fake_api.auth_requests == 1
+    assert len(fake_api.requests_to("GET", r"/processes/.+")) == 300
+
+
+def test_concurrent_unauthorized_requests_share_one_auth_request(fake_api):
+    valid_tokens = []
+
+    def get_process(request, id):
+        if request["headers"]["Authorization"] not in valid_tokens:
+            return 401, {"message": "Unauthorized"}
+        return {"id": id}
+
+    def auth(request):
+        status, body, headers = fake_api._auth(request)
+        valid_tokens.append(f"Bearer {body['access_token']}")
+        time.sleep(0.2)
+        return status, body, headers
+
+    fake_api.route("GET", r"/processes/(.+)", get_process)
+    fake_api.route("POST", r"/auth/token", auth)
+
+    with YepCodeApi(fake_api.config(pool_maxsize=300)) as api:
+        # Revoked, but not expired yet
+        api.access_token = make_access_token(expires_in=1800)
+        run_concurrently(300, lambda i: api.get_process(f"process-{i}"))
+
+    assert fake_api.auth_requests == 1
+
+
+def test_concurrent_async_callers_share_one_auth_request(fake_api):
+    pytest.importorskip("httpx")
+    from yepcode_run import AsyncYepCodeApi
+
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+
+    async def main():
+        async with AsyncYepCodeApi(fake_api.config()) as api:
+            api.access_token = make_access_token(expires_in=-10)
+            await asyncio.gather(*(api.get_process(f"process-{i}") for i in range(100)))
+
+    asyncio.run(main())
+
+    assert fake_api.auth_requests == 1
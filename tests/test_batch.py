@@ -0,0 +1,128 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from yepcode_run import YepCodeRun, BatchResult, YepCodeExecutionError
+
+CODE = """def main(n):
+    return n * 2"""
+
+
+@pytest.fixture
+def batch_api(fake_api):
+    """Executions return n * 2, failing for n == 3."""
+    fake_api.install_process_routes()
+    execute = next(
+        handler for method, pattern, handler in fake_api.routes
+        if method == "POST" and pattern.pattern.endswith("/execute$")
+    )
+    running = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def execute_with_parameters(request, id):
+        response = execute(request, id)
+        n = json.loads(json.loads(request["body"])["parameters"])["n"]
+        fake_api.executions[response["executionId"]].update(
+            statuses=["RUNNING"] * (n % 4) + ["ERROR" if n == 3 else "FINISHED"],
+            return_value=n * 2,
+        )
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        return response
+
+    def on_done(_):
+        with lock:
+            running["now"] -= 1
+
+    fake_api.route("POST", r"/processes/([^/]+)/execute", execute_with_parameters)
+    fake_api.running = running
+    fake_api.on_done = on_done
+    return fake_api
+
+
+def test_run_many_reports_failures_without_aborting(batch_api):
+    runner = YepCodeRun(batch_api.config())
+
+    results = list(
+        runner.run_many(
+            CODE,
+            ({"n": n} for n in range(10)),
+            {"language": "python", "onFinish": batch_api.on_done, "onError": batch_api.on_done},
+            concurrency=3,
+        )
+    )
+
+    assert sorted(r.index for r in results) == list(range(10))
+    failed = [r for r in results if not r.ok]
+    assert [r.parameters for r in failed] == [{"n": 3}]
+    assert isinstance(failed[0].error, YepCodeExecutionError)
+    assert all(r.return_value == r.parameters["n"] * 2 for r in results if r.ok)
+    assert batch_api.running["max"] <= 3
+    # The process is looked up once for the whole batch
+    assert len(batch_api.requests_to("GET", r"/processes/[^/]+")) == 1
+
+
+def test_run_many_in_input_order(batch_api):
+    runner = YepCodeRun(batch_api.config())
+
+    results = list(
+        runner.run_many(CODE, [{"n": n} for n in range(8)], {"language": "python"}, ordered=True)
+    )
+
+    assert [r.index for r in results] == list(range(8))
+    assert all(isinstance(r, BatchResult) for r in results)
+
+
+def test_map(batch_api):
+    runner = YepCodeRun(batch_api.config())
+    parameters = [{"n": n} for n in range(6)]
+
+    values = list(
+        runner.map(CODE, parameters, {"language": "python"}, return_exceptions=True)
+    )
+    assert values[:3] == [0, 2, 4]
+    assert isinstance(values[3], YepCodeExecutionError)
+    assert values[4:] == [8, 10]
+
+    with pytest.raises(YepCodeExecutionError):
+        list(runner.map(CODE, parameters, {"language": "python"}))
+
+
+def test_remove_on_done_deletes_the_process_once(batch_api):
+    runner = YepCodeRun(batch_api.config())
+
+    list(runner.run_many(CODE, [{"n": 0}, {"n": 1}], {"language": "python", "removeOnDone": True}))
+
+    assert len(batch_api.requests_to("DELETE", r"/processes/[^/]+")) == 1
+
+
+def test_async_run_many(batch_api):
+    pytest.importorskip("httpx")
+    from yepcode_run import AsyncYepCodeRun
+
+    async def main():
+        runner = AsyncYepCodeRun(batch_api.config())
+        results = [
+            r
+            async for r in runner.run_many(
+                CODE, [{"n": n} for n in range(6)], {"language": "python"},
+                concurrency=2, ordered=True,
+            )
+        ]
+        values = [
+            v
+            async for v in runner.map(
+                CODE, [{"n": n} for n in range(3)], {"language": "python"}
+            )
+        ]
+        await runner.yepcode_api.close()
+        return results, values
+
+    results, values = asyncio.run(main())
+
+    assert [r.index for r in results] == list(range(6))
+    assert [r.ok for r in results] == [True, True, True, False, True, True]
+    assert values == [0, 2, 4]
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import socket
+import time
+
+import pytest
+import requests
+
+from yepcode_run import YepCodeRun, ExecutionCallbackListener, ExecutionStatus
+from yepcode_run.api.yepcode_api import YepCodeApiError
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+
+def get_callback_url(fake_api):
+    execute_request = fake_api.requests_to("POST", r"/processes/.+/execute")[-1]
+    return json.loads(execute_request["body"])["settings"]["callbackUrl"]
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def finish_execution(fake_api, execution):
+    # Once the first poll is done, so that only the callback can complete it
+    while execution.poll_attempts == 0:
+        time.sleep(0.01)
+    fake_api.executions[execution.id]["statuses"] = ["FINISHED"]
+
+
+def test_completes_on_callback(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING"], return_value={"message": "hello"})
+
+    port = get_free_port()
+    with ExecutionCallbackListener(
+        public_url=f"http://127.0.0.1:{port}", port=port, safety_poll_interval=60
+    ) as listener:
+        runner = YepCodeRun(fake_api.config(), callback_listener=listener)
+        execution = runner.run(CODE, {"language": "python", "settings": {"agentPoolSlug": "pool"}})
+        callback_url = get_callback_url(fake_api)
+        assert callback_url.startswith(f"http://127.0.0.1:{listener.port}/")
+
+        finish_execution(fake_api, execution)
+        assert requests.post(callback_url, json={"status": "FINISHED"}).status_code == 204
+
+        assert execution.result(timeout=5) == {"message": "hello"}
+        assert execution.poll_attempts <= 2
+        # The callback is released once the execution is done
+        assert requests.post(callback_url).status_code == 404
+
+    execute_request = fake_api.requests_to("POST", r"/processes/.+/execute")[-1]
+    assert json.loads(execute_request["body"])["settings"]["agentPoolSlug"] == "pool"
+
+
+def test_keeps_polling_as_safety_net(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"])
+    listener = ExecutionCallbackListener(
+        public_url="https://example.com/callbacks", safety_poll_interval=0.05
+    )
+
+    runner = YepCodeRun(fake_api.config(), callback_listener=listener)
+    execution = runner.run(CODE, {"language": "python"})
+
+    execution.wait_for_done(timeout=5)
+    assert execution.status == ExecutionStatus.FINISHED
+    assert get_callback_url(fake_api).startswith("https://example.com/callbacks/")
+
+
+def test_releases_the_callback_when_execute_fails(fake_api):
+    fake_api.install_process_routes()
+    fake_api.route(
+        "POST", r"/processes/([^/]+)/execute", lambda request, id: (400, {"message": "Bad"})
+    )
+    listener = ExecutionCallbackListener(public_url="https://example.com/callbacks")
+
+    runner = YepCodeRun(fake_api.config(), callback_listener=listener)
+    with pytest.raises(YepCodeApiError):
+        runner.run(CODE, {"language": "python"})
+
+    assert listener._executions == {}
+
+
+def test_public_url_is_required():
+    with pytest.raises(ValueError):
+        ExecutionCallbackListener(public_url="")
+
+
+def test_wsgi_app(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING"])
+    listener = ExecutionCallbackListener(
+        public_url="https://example.com/callbacks", safety_poll_interval=60
+    )
+    runner = YepCodeRun(fake_api.config(), callback_listener=listener)
+    execution = runner.run(CODE, {"language": "python"})
+    token = get_callback_url(fake_api).rsplit("/", 1)[-1]
+    statuses = []
+
+    def call(method, path):
+        listener.wsgi_app(
+            {"REQUEST_METHOD": method, "PATH_INFO": path},
+            lambda status, headers: statuses.append(status),
+        )
+
+    call("POST", "/callbacks/unknown")
+    call("GET", f"/callbacks/{token}")
+    finish_execution(fake_api, execution)
+    call("POST", f"/callbacks/{token}")
+
+    execution.wait_for_done(timeout=5)
+    assert statuses == ["404 Not Found", "405 Method Not Allowed", "204 No Content"]
+    assert execution.status == ExecutionStatus.FINISHED
+
+
+def test_asgi_app(fake_api):
+    pytest.importorskip("httpx")
+    from yepcode_run import AsyncYepCodeRun
+
+    fake_api.install_process_routes(statuses=["RUNNING"])
+    listener = ExecutionCallbackListener(
+        public_url="https://example.com/callbacks", safety_poll_interval=60
+    )
+
+    async def main():
+        runner = AsyncYepCodeRun(fake_api.config(), callback_listener=listener)
+        execution = await runner.run(CODE, {"language": "python"})
+        token = get_callback_url(fake_api).rsplit("/", 1)[-1]
+        fake_api.executions[execution.id]["statuses"] = ["FINISHED"]
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"{}"}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "path": f"/callbacks/{token}"}
+        await listener.asgi_app(scope, receive, send)
+        await asyncio.wait_for(execution.wait_for_done(), 5)
+        await runner.yepcode_api.close()
+        return execution, sent
+
+    execution, sent = asyncio.run(main())
+
+    assert sent[0]["status"] == 204
+    assert execution.status == ExecutionStatus.FINISHED
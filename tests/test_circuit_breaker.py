@@ -0,0 +1,172 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from yepcode_run import (
+    YepCodeApi,
+    CircuitBreaker,
+    CircuitState,
+    EndpointClass,
+    YepCodeCircuitOpenError,
+)
+from yepcode_run.api.yepcode_api import YepCodeApiError
+
+
+def unavailable(request, *args):
+    return 503, {"message": "Service unavailable"}
+
+
+def test_circuit_states():
+    breaker = CircuitBreaker(min_requests=4, failure_rate=0.5, reset_timeout=0.1)
+    circuit = breaker.get_circuit(EndpointClass.POLLING)
+
+    for failed in [False, True, False]:
+        assert circuit.acquire() == (None, None)
+        circuit.record(failed)
+    assert circuit.state is CircuitState.CLOSED
+    circuit.acquire()
+    circuit.record(True)
+    assert circuit.state is CircuitState.OPEN
+    retry_after, probe = circuit.acquire()
+    assert 0 < retry_after <= 0.1 and probe is None
+    assert breaker.get_states()["polling"] == "open"
+    assert not breaker.is_healthy()
+
+    time.sleep(0.1)
+    assert circuit.state is CircuitState.HALF_OPEN
+    retry_after, probe = circuit.acquire()
+    assert retry_after is None and probe is not None
+    assert circuit.acquire() == (0, None)  # Only one probe at a time
+    circuit.record(True, probe)
+    assert circuit.state is CircuitState.OPEN
+
+    time.sleep(0.1)
+    _, probe = circuit.acquire()
+    circuit.record(False, probe)
+    assert circuit.state is CircuitState.CLOSED
+    assert breaker.is_healthy()
+
+
+def test_only_probes_leave_the_half_open_state():
+    breaker = CircuitBreaker(min_requests=1, reset_timeout=0.05)
+    circuit = breaker.get_circuit(EndpointClass.POLLING)
+    circuit.acquire()  # Admitted before the circuit opened
+    circuit.acquire()
+    circuit.record(True)
+    time.sleep(0.05)
+    _, probe = circuit.acquire()
+
+    # The late outcome neither closes the circuit nor frees the probe slot
+    circuit.record(False)
+    assert circuit.state is CircuitState.HALF_OPEN
+    assert circuit.acquire() == (0, None)
+
+    circuit.record(False, probe)
+    assert circuit.state is CircuitState.CLOSED
+
+
+def test_invalid_circuit_breaker():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_rate=0)
+
+
+def test_fails_fast_while_the_api_is_degraded(fake_api):
+    fake_api.route("GET", r"/processes/([^/]+)", unavailable)
+    fake_api.route("GET", r"/executions/([^/]+)", lambda request, id: {"id": id})
+    breaker = CircuitBreaker(min_requests=4, reset_timeout=0.2)
+
+    with YepCodeApi(fake_api.config(max_retries=0), circuit_breaker=breaker) as api:
+        for i in range(4):
+            with pytest.raises(YepCodeApiError) as error:
+                api.get_process(f"process-{i}")
+            assert not isinstance(error.value, YepCodeCircuitOpenError)
+
+        with pytest.raises(YepCodeCircuitOpenError) as error:
+            api.get_process("process-4")
+        assert error.value.status == 503
+        assert 0 < error.value.retry_after <= 0.2
+        assert len(fake_api.requests_to("GET", r"/processes/.+")) == 4
+        assert api.get_circuit_states()["other"] == "open"
+
+        # Other endpoint classes aren't affected
+        assert api.get_execution("execution-0") == {"id": "execution-0"}
+        assert api.get_circuit_states()["polling"] == "closed"
+
+        # Once recovered, the probe closes the circuit
+        fake_api.route("GET", r"/processes/([^/]+)", lambda request, id: {"id": id})
+        time.sleep(0.2)
+        assert api.get_circuit_states()["other"] == "half_open"
+        assert api.get_process("process-5") == {"id": "process-5"}
+        assert api.get_circuit_states()["other"] == "closed"
+
+
+def test_stops_retrying_once_open(fake_api):
+    fake_api.route("GET", r"/processes/([^/]+)", unavailable)
+    breaker = CircuitBreaker(min_requests=2, reset_timeout=10)
+
+    with YepCodeApi(fake_api.config(retry_backoff=0.01), circuit_breaker=breaker) as api:
+        with pytest.raises(YepCodeCircuitOpenError):
+            api.get_process("process-0")
+
+    assert len(fake_api.requests_to("GET", r"/processes/.+")) == 2
+
+
+def test_execution_failures_dont_open_the_circuit(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "ERROR"])
+    fake_api.sync_timeout = True
+    breaker = CircuitBreaker(min_requests=2)
+
+    with YepCodeApi(fake_api.config(), circuit_breaker=breaker) as api:
+        api.create_process({"name": "my-process"})
+        for _ in range(3):
+            response = api.execute_process_sync_response("my-process")
+            assert response["status"] == 504
+
+    assert breaker.get_state(EndpointClass.EXECUTE) is CircuitState.CLOSED
+
+
+def test_sync_execution_read_timeouts_dont_open_the_circuit(fake_api):
+    def slow_execute_sync(request, id):
+        time.sleep(0.2)
+        return {"id": id}
+
+    fake_api.route("POST", r"/processes/([^/]+)/execute-sync", slow_execute_sync)
+    breaker = CircuitBreaker(min_requests=2)
+
+    with YepCodeApi(fake_api.config(), circuit_breaker=breaker) as api:
+        for _ in range(3):
+            with pytest.raises(requests.ReadTimeout):
+                api.execute_process_sync_response("my-process", timeout=50)
+
+    assert breaker.get_state(EndpointClass.EXECUTE) is CircuitState.CLOSED
+
+
+def test_can_be_disabled(fake_api):
+    with YepCodeApi(fake_api.config(circuit_breaker=False)) as api:
+        assert api.circuit_breaker is None
+        assert api.get_circuit_states() == {}
+
+
+def test_async_fails_fast(fake_api):
+    pytest.importorskip("httpx")
+    from yepcode_run import AsyncYepCodeApi
+
+    fake_api.route("GET", r"/processes/([^/]+)", unavailable)
+    config = fake_api.config(max_retries=0, circuit_reset_timeout=10)
+
+    async def main():
+        async with AsyncYepCodeApi(config) as api:
+            results = await asyncio.gather(
+                *(api.get_process(f"process-{i}") for i in range(20)),
+                return_exceptions=True,
+            )
+            with pytest.raises(YepCodeCircuitOpenError):
+                await api.get_process("process-20")
+            return results
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, YepCodeApiError) for result in results)
+    assert len(fake_api.requests_to("GET", r"/processes/.+")) < 21
@@ -0,0 +1,28 @@
+import pytest
+
+from yepcode_run import RateLimit
+from yepcode_run.utils.config_manager import ConfigManager
+
+
+def test_coerces_env_values():
+    config = ConfigManager._coerce_env_values(
+        {
+            "timeout": "5000",
+            "circuit_breaker": "false",
+            "circuit_failure_rate": "0.3",
+            "rate_limits": '{"polling": {"rate": 10, "burst": 5}}',
+        }
+    )
+
+    assert config["timeout"] == 5000
+    assert config["circuit_breaker"] is False
+    assert config["circuit_failure_rate"] == 0.3
+    assert config["rate_limits"] == {"polling": RateLimit(rate=10, burst=5)}
+
+
+@pytest.mark.parametrize(
+    "value", ["10", "not json", '{"polling": {"speed": 10}}', '{"polling": 10}']
+)
+def test_rejects_invalid_dict_values(value):
+    with pytest.raises(ValueError, match="YEPCODE_RATE_LIMITS"):
+        ConfigManager._coerce_env_values({"rate_limits": value})
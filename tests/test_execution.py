@@ -0,0 +1,298 @@
+import concurrent.futures
+import threading
+
+import pytest
+
+from yepcode_run import (
+    YepCodeRun,
+    Execution,
+    ExecutionStatus,
+    YepCodeExecutionError,
+    YepCodeExecutionTimeoutError,
+)
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+
+@pytest.fixture
+def runner(fake_api):
+    return YepCodeRun(fake_api.config())
+
+
+def test_run_returns_before_execution_finishes(fake_api, runner):
+    fake_api.install_process_routes(
+        statuses=["RUNNING", "RUNNING", "FINISHED"], return_value={"message": "hello"}
+    )
+
+    execution = runner.run(CODE, {"language": "python"})
+
+    assert not execution.done()
+    assert execution.result(timeout=5) == {"message": "hello"}
+    assert execution.done()
+    assert execution.status == ExecutionStatus.FINISHED
+
+
+def test_overlaps_many_executions(fake_api, runner):
+    fake_api.install_process_routes(statuses=["RUNNING", "RUNNING", "FINISHED"])
+
+    executions = [runner.run(CODE, {"language": "python"}) for _ in range(10)]
+
+    for execution in executions:
+        execution.wait_for_done(timeout=5)
+    assert all(e.status == ExecutionStatus.FINISHED for e in executions)
+
+
+def test_result_raises_for_failed_executions(fake_api, runner):
+    fake_api.install_process_routes(statuses=["ERROR"])
+    errors = []
+
+    execution = runner.run(CODE, {"language": "python", "onError": errors.append})
+
+    with pytest.raises(YepCodeExecutionError) as exc_info:
+        execution.result(timeout=5)
+    assert exc_info.value.status == ExecutionStatus.ERROR
+    assert isinstance(execution.exception(), YepCodeExecutionError)
+    assert len(errors) == 1
+
+
+def test_add_done_callback(fake_api, runner):
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"])
+    done = threading.Event()
+    called_with = []
+
+    execution = runner.run(CODE, {"language": "python"})
+    execution.add_done_callback(lambda e: (called_with.append(e), done.set()))
+
+    assert done.wait(5)
+    assert called_with == [execution]
+
+    # Callbacks added after completion are called right away
+    execution.add_done_callback(called_with.append)
+    assert called_with == [execution, execution]
+
+
+def test_cancel_kills_execution(fake_api, runner):
+    fake_api.install_process_routes(statuses=["RUNNING"])
+
+    execution = runner.run(CODE, {"language": "python"})
+
+    assert execution.cancel()
+    execution.wait_for_done(timeout=5)
+    assert execution.cancelled()
+    assert execution.status == ExecutionStatus.KILLED
+    assert len(fake_api.requests_to("PUT", r"/executions/.+/kill")) == 1
+    assert not execution.cancel()
+
+
+def test_polling_errors_are_raised_on_wait(fake_api, runner):
+    fake_api.install_process_routes()
+
+    execution = runner.get_execution("missing")
+
+    with pytest.raises(Exception) as exc_info:
+        execution.wait_for_done(timeout=5)
+    assert exc_info.value.status == 404
+
+
+def test_gives_up_after_timeout(fake_api, runner):
+    fake_api.install_process_routes(statuses=["RUNNING"])
+
+    execution = runner.run(CODE, {"language": "python", "timeout": 600})
+
+    with pytest.raises(YepCodeExecutionTimeoutError):
+        execution.wait_for_done(timeout=5)
+    assert execution.status == ExecutionStatus.RUNNING
+    assert not execution.is_polling
+
+
+def test_gives_up_after_max_polls(fake_api, runner):
+    fake_api.install_process_routes(statuses=["RUNNING"])
+
+    execution = runner.run(CODE, {"language": "python", "maxPolls": 3})
+
+    with pytest.raises(YepCodeExecutionTimeoutError):
+        execution.result(timeout=5)
+    assert len(fake_api.requests_to("GET", r"/executions/[^/]+")) == 3
+
+
+def test_long_polling_does_not_grow_the_stack(fake_api, runner, monkeypatch):
+    fake_api.install_process_routes(statuses=["RUNNING"] * 1500 + ["FINISHED"])
+    monkeypatch.setattr(Execution, "_get_polling_interval", lambda self: 0)
+
+    execution = runner.run(CODE, {"language": "python"})
+
+    execution.wait_for_done(timeout=30)
+    assert execution.status == ExecutionStatus.FINISHED
+    assert execution.poll_attempts == 1500
+
+
+def test_fetches_only_new_logs(fake_api, runner, monkeypatch):
+    fake_api.install_process_routes(statuses=["RUNNING"] * 5 + ["FINISHED"])
+    monkeypatch.setattr(Execution, "LOGS_PAGE_LIMIT", 3)
+    monkeypatch.setattr(Execution, "_should_poll_logs", lambda self: True)
+    monkeypatch.setattr(Execution, "_get_polling_interval", lambda self: 0)
+
+    def get_logs(request, id):
+        # Every logs request sees two more log lines
+        execution = fake_api.executions[id]
+        execution["logs"] += [
+            {
+                "timestamp": f"2025-01-01T00:00:{len(execution['logs']) + i:02d}",
+                "level": "INFO",
+                "message": f"Log {len(execution['logs']) + i}",
+            }
+            for i in range(2)
+        ]
+        page, limit = int(request["params"]["page"]), int(request["params"]["limit"])
+        logs = execution["logs"]
+        return {
+            "data": logs[page * limit : (page + 1) * limit],
+            "hasNextPage": (page + 1) * limit < len(logs),
+        }
+
+    fake_api.route("GET", r"/executions/([^/]+)/logs", get_logs)
+    received = []
+
+    execution = runner.run(
+        CODE, {"language": "python", "onLog": lambda log: received.append(log.message)}
+    )
+    execution.wait_for_done(timeout=5)
+
+    total = len(fake_api.executions[execution.id]["logs"])
+    assert received == [f"Log {i}" for i in range(total)]
+    pages = [int(r["params"]["page"]) for r in fake_api.requests_to("GET", r"/executions/.+/logs")]
+    # Pages are never requested again once complete
+    assert pages == sorted(pages)
+    assert len(pages) - len(set(pages)) <= 6
+
+
+def test_throttled_logs_are_fetched_later(fake_api, monkeypatch):
+    logs = [
+        {"timestamp": f"2025-01-01T00:00:0{i}", "level": "INFO", "message": f"Log {i}"}
+        for i in range(5)
+    ]
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"], logs=logs)
+    monkeypatch.setattr(Execution, "LOGS_PAGE_LIMIT", 2)
+    monkeypatch.setattr(Execution, "_should_poll_logs", lambda self: True)
+    monkeypatch.setattr(Execution, "_get_polling_interval", lambda self: 0)
+    get_logs = fake_api.routes[
+        [path.pattern for _, path, _ in fake_api.routes].index(
+            r"^/executions/([^/]+)/logs$"
+        )
+    ][2]
+    requests = []
+
+    def throttling_get_logs(request, id):
+        # Throttle a round midway through its pages, then the final round
+        requests.append(request)
+        if len(requests) in (2, 3):
+            return 429, {"message": "Too many requests"}, {"Retry-After": "0"}
+        return get_logs(request, id)
+
+    fake_api.route("GET", r"/executions/([^/]+)/logs", throttling_get_logs)
+    received = []
+
+    execution = YepCodeRun(fake_api.config(max_retries=0)).run(
+        CODE, {"language": "python", "onLog": lambda log: received.append(log.message)}
+    )
+
+    assert execution.wait_for_done(timeout=5) is None
+    assert execution.status == ExecutionStatus.FINISHED
+    assert received == [f"Log {i}" for i in range(5)]
+
+
+def test_rerun_keeps_the_run_settings(fake_api, runner):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+
+    def rerun(request, id):
+        execution_id = f"execution-{len(fake_api.executions)}"
+        fake_api.executions[execution_id] = {**fake_api.executions[id], "polls": 0}
+        return {"executionId": execution_id}
+
+    fake_api.route("POST", r"/executions/([^/]+)/rerun", rerun)
+    execution = runner.run(CODE, {"language": "python", "logRetention": 2})
+    execution.wait_for_done(timeout=5)
+
+    rerun_execution = execution.rerun()
+    rerun_execution.wait_for_done(timeout=5)
+
+    assert rerun_execution.id == "execution-1"
+    assert rerun_execution.process_id == execution.process_id
+    assert rerun_execution._log_store is not execution._log_store
+    assert rerun_execution._log_store._logs.maxlen == 2
+    assert runner.get_process_stats(execution.process_id).executions == 2
+
+
+# The error is still raised in the polling thread
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_stats_errors_dont_leave_executions_pending(fake_api, runner, monkeypatch):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    monkeypatch.setattr(
+        Execution, "_record_stats", lambda self: (_ for _ in ()).throw(ValueError())
+    )
+
+    execution = runner.run(CODE, {"language": "python"})
+
+    assert execution.wait_for_done(timeout=5) is None
+    assert execution.done()
+
+
+def test_skips_duplicated_logs(fake_api, runner):
+    log = {"timestamp": "2025-01-01T00:00:01", "level": "INFO", "message": "Repeated"}
+    other = {"timestamp": "2025-01-01T00:00:02", "level": "INFO", "message": "Other"}
+    fake_api.install_process_routes(statuses=["FINISHED"], logs=[log, log, other])
+    received = []
+
+    execution = runner.run(
+        CODE, {"language": "python", "onLog": lambda log: received.append(log.message)}
+    )
+    execution.wait_for_done(timeout=5)
+
+    assert received == ["Repeated", "Other"]
+    assert len(execution.logs) == 2
+
+
+def test_iter_logs_streams_until_done(fake_api, runner):
+    logs = [
+        {"timestamp": f"2025-01-01T00:00:0{i}", "level": "INFO", "message": f"Log {i}"}
+        for i in range(5)
+    ]
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"], logs=logs)
+
+    execution = runner.run(CODE, {"language": "python"})
+
+    assert [log.message for log in execution.iter_logs()] == [
+        f"Log {i}" for i in range(5)
+    ]
+    assert execution.done()
+    # Iterating a finished execution replays the logs it kept
+    assert len(list(execution.iter_logs())) == 5
+
+
+def test_iter_logs_applies_backpressure(fake_api, runner):
+    logs = [
+        {"timestamp": f"2025-01-01T00:00:{i:02d}", "level": "INFO", "message": f"Log {i}"}
+        for i in range(20)
+    ]
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"], logs=logs)
+
+    execution = runner.run(CODE, {"language": "python"})
+    stream = execution.iter_logs(max_buffer=2)
+    assert next(stream).message == "Log 0"
+
+    # Polling waits for the slow consumer instead of buffering every log
+    with pytest.raises(concurrent.futures.TimeoutError):
+        execution.wait_for_done(timeout=0.5)
+    assert [log.message for log in stream] == [f"Log {i}" for i in range(1, 20)]
+    assert execution.done()
+
+
+def test_iter_logs_raises_polling_errors(fake_api, runner):
+    fake_api.install_process_routes()
+
+    execution = runner.get_execution("missing")
+
+    with pytest.raises(Exception) as exc_info:
+        list(execution.iter_logs())
+    assert exc_info.value.status == 404
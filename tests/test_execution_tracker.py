@@ -0,0 +1,69 @@
+import pytest
+
+from yepcode_run import (
+    YepCodeRun,
+    ExecutionStatus,
+    ExecutionTracker,
+    YepCodeExecutionTimeoutError,
+)
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+
+@pytest.fixture
+def tracker_runner(fake_api):
+    runner = YepCodeRun(fake_api.config())
+    runner.tracker = ExecutionTracker(runner.yepcode_api, poll_interval=0.05)
+    yield runner
+    runner.tracker.close()
+
+
+def test_refreshes_statuses_in_bulk(fake_api, tracker_runner):
+    fake_api.install_process_routes(
+        statuses=["RUNNING", "RUNNING", "FINISHED"], return_value={"message": "hello"}
+    )
+
+    executions = [tracker_runner.run(CODE, {"language": "python"}) for _ in range(20)]
+
+    assert [e.result(timeout=5) for e in executions] == [{"message": "hello"}] * 20
+    assert all(e.status == ExecutionStatus.FINISHED for e in executions)
+    # Executions are only fetched by id once finished
+    assert len(fake_api.requests_to("GET", r"/executions/[^/]+")) == 20
+    assert len(fake_api.requests_to("GET", r"/executions")) <= 10
+    assert len(tracker_runner.tracker) == 0
+
+
+def test_polls_by_id_executions_of_unknown_process(fake_api, tracker_runner):
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"])
+    execution_id = tracker_runner.run(CODE, {"language": "python"}).id
+
+    execution = tracker_runner.get_execution(execution_id)
+    execution.wait_for_done(timeout=5)
+    assert execution.status == ExecutionStatus.FINISHED
+
+    missing = tracker_runner.get_execution("missing")
+    with pytest.raises(Exception) as exc_info:
+        missing.wait_for_done(timeout=5)
+    assert exc_info.value.status == 404
+
+
+def test_gives_up_after_max_polls(fake_api, tracker_runner):
+    fake_api.install_process_routes(statuses=["RUNNING"])
+
+    execution = tracker_runner.run(CODE, {"language": "python", "maxPolls": 3})
+
+    with pytest.raises(YepCodeExecutionTimeoutError):
+        execution.result(timeout=5)
+    assert not execution.is_polling
+
+
+def test_close_hands_executions_back(fake_api, tracker_runner):
+    fake_api.install_process_routes(statuses=["RUNNING"] * 3 + ["FINISHED"])
+    tracker_runner.tracker.poll_interval = 60
+
+    execution = tracker_runner.run(CODE, {"language": "python"})
+    tracker_runner.tracker.close()
+
+    execution.wait_for_done(timeout=10)
+    assert execution.status == ExecutionStatus.FINISHED
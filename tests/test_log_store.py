@@ -0,0 +1,125 @@
+import os
+from dataclasses import asdict
+
+import pytest
+
+from yepcode_run import (
+    Log,
+    LogStore,
+    RingLogStore,
+    LevelLogStore,
+    NullLogStore,
+    FileLogStore,
+    YepCodeRun,
+)
+
+
+def make_logs(count, level="INFO"):
+    return [
+        Log(timestamp=f"2025-01-01T00:00:{i:02d}", level=level, message=f"Log {i}")
+        for i in range(count)
+    ]
+
+
+def test_ring_store_keeps_last_logs():
+    store = RingLogStore(3)
+    for log in make_logs(5):
+        store.append(log)
+
+    assert [log.message for log in store.get_logs()] == ["Log 2", "Log 3", "Log 4"]
+
+
+def test_level_store_keeps_errors_and_warnings():
+    store = LevelLogStore()
+    for log in make_logs(2) + make_logs(2, "ERROR") + make_logs(1, "WARN"):
+        store.append(log)
+
+    assert [log.level for log in store.get_logs()] == ["ERROR", "ERROR", "WARN"]
+
+
+def test_null_store_keeps_nothing():
+    store = NullLogStore()
+    store.append(make_logs(1)[0])
+
+    assert store.get_logs() == []
+
+
+def test_file_store_spills_logs_to_disk():
+    store = FileLogStore()
+    logs = make_logs(10)
+    for log in logs:
+        store.append(log)
+
+    assert len(store) == 10
+    assert store.get_logs() == logs
+    # Appending after reading keeps adding to the end of the file
+    store.append(logs[0])
+    assert store.get_logs() == logs + [logs[0]]
+
+    # Once finished, the file is only open to read it
+    store.finish()
+    assert store._file is None
+    assert store.get_logs() == logs + [logs[0]]
+    store.close()
+    assert not os.path.exists(store.path)
+
+
+def test_executions_release_their_log_file(fake_api):
+    fake_api.install_process_routes(statuses=["FINISHED"], logs=[asdict(make_logs(1)[0])])
+
+    execution = YepCodeRun(fake_api.config()).run(
+        "def main():\n    return 1", {"language": "python", "logRetention": "file"}
+    )
+    execution.wait_for_done(timeout=5)
+
+    assert execution._log_store._file is None
+    assert [log.message for log in execution.logs] == ["Log 0"]
+
+
+def test_ring_store_requires_a_positive_size():
+    with pytest.raises(ValueError):
+        RingLogStore(0)
+
+
+@pytest.mark.parametrize(
+    "retention, store_class",
+    [
+        (None, LogStore),
+        ("all", LogStore),
+        (10, RingLogStore),
+        ("errors", LevelLogStore),
+        ("none", NullLogStore),
+        ("file", FileLogStore),
+    ],
+)
+def test_from_option(retention, store_class):
+    assert type(LogStore.from_option(retention)) is store_class
+
+
+def test_from_option_rejects_unknown_values():
+    with pytest.raises(ValueError):
+        LogStore.from_option("sometimes")
+
+
+def test_on_log_and_error_message_ignore_retention(fake_api):
+    logs = [
+        {"timestamp": "2025-01-01T00:00:01", "level": "ERROR", "message": "Boom"},
+        {"timestamp": "2025-01-01T00:00:02", "level": "INFO", "message": "Info"},
+    ]
+    fake_api.install_process_routes(statuses=["ERROR"], logs=logs)
+    received = []
+
+    execution = YepCodeRun(fake_api.config()).run(
+        "def main():\n    raise Exception('Boom')",
+        {
+            "language": "python",
+            "logRetention": "none",
+            "onLog": lambda log: received.append(log.message),
+        },
+    )
+    execution.wait_for_done(timeout=5)
+
+    assert received == ["Boom", "Info"]
+    assert execution.logs == []
+    # Timeline has no explanation, so the error comes from the last ERROR log
+    assert execution.error == "Boom"
@@ -0,0 +1,81 @@
+import pytest
+
+from yepcode_run import (
+    YepCodeRun,
+    AdaptivePolling,
+    FixedPolling,
+    ExecutionStatus,
+)
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+
+def test_adaptive_polling_backs_off_exponentially():
+    polling = AdaptivePolling(min_delay=0.2, max_delay=10, factor=1.5, jitter=0)
+
+    assert polling.get_delay(None, 0, 0) == 0.2
+    assert polling.get_delay(None, 5, 4) == 2
+    assert polling.get_delay(None, 50, 3600) == 10
+
+
+def test_adaptive_polling_jitter():
+    polling = AdaptivePolling(min_delay=1, jitter=0.2)
+
+    delays = {polling.get_delay(None, 0, 0) for _ in range(50)}
+
+    assert len(delays) > 1
+    assert all(0.8 <= delay <= 1.2 for delay in delays)
+
+
+def test_adaptive_polling_learns_durations():
+    polling = AdaptivePolling(min_delay=0.2, jitter=0, learning_rate=0.5)
+    polling.record_duration("process", 30)
+    polling.record_duration("process", 40)
+
+    assert polling.get_expected_duration("process") == 35
+    # Wait until the usual duration, then back off from there
+    assert polling.get_delay("process", 0, 0) == 10
+    assert polling.get_delay("process", 1, 34) == 1
+    assert polling.get_delay("process", 2, 37) == 1
+    assert polling.get_delay("other", 0, 0) == 0.2
+
+
+def test_runs_teach_the_runner_strategy(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"])
+    runner = YepCodeRun(fake_api.config(), polling_strategy=AdaptivePolling(min_delay=0.01))
+
+    execution = runner.run(CODE, {"language": "python"})
+    execution.wait_for_done(timeout=5)
+
+    assert runner.polling_strategy.get_expected_duration(execution.process_id) > 0
+
+
+def test_honors_retry_after(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"])
+    get_execution = next(
+        handler for method, pattern, handler in fake_api.routes
+        if method == "GET" and pattern.pattern == "^/executions/([^/]+)$"
+    )
+    throttled = []
+
+    def throttle_once(request, id):
+        if not throttled:
+            throttled.append(id)
+            return 429, {"message": "Too many requests"}, {"Retry-After": "0.3"}
+        return get_execution(request, id)
+
+    fake_api.route("GET", r"/executions/([^/]+)", throttle_once)
+    runner = YepCodeRun(fake_api.config(), polling_strategy=FixedPolling(0.01))
+
+    execution = runner.run(CODE, {"language": "python"})
+    execution.wait_for_done(timeout=5)
+
+    assert execution.status == ExecutionStatus.FINISHED
+    polls = [r["time"] for r in fake_api.requests_to("GET", r"/executions/[^/]+")]
+    assert polls[1] - polls[0] >= 0.3
+
+
+def test_invalid_adaptive_polling():
+    with pytest.raises(ValueError):
+        AdaptivePolling(factor=1)
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from yepcode_run import YepCodeRun, AsyncYepCodeRun, PrewarmedProcess
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+JS_CODE = """module.exports = async () => ({ message: "hello" });"""
+
+
+def test_snippets():
+    item = PrewarmedProcess.from_snippet({"code": CODE, "parameters": {"a": 1}})
+
+    assert item.language == "python"
+    assert item.get_run_options()["parameters"] == {"a": 1}
+    assert not item.ready
+    with pytest.raises(ValueError):
+        PrewarmedProcess.from_snippet({"language": "python"})
+
+
+def test_runs_use_the_prewarmed_processes(fake_api):
+    fake_api.install_process_routes()
+    runner = YepCodeRun(fake_api.config())
+
+    items = runner.prewarm([CODE, {"code": JS_CODE, "language": "javascript"}], wait=True)
+
+    assert all(item.ready for item in items)
+    assert len(fake_api.requests_to("POST", r"/processes")) == 2
+    lookups = len(fake_api.requests_to("GET", r"/processes/[^/]+"))
+
+    execution = runner.run(CODE, {"language": "python"})
+    execution.wait_for_done(timeout=5)
+
+    assert execution.process_id == items[0].process_id
+    assert len(fake_api.requests_to("GET", r"/processes/[^/]+")) == lookups
+    assert len(fake_api.requests_to("POST", r"/processes")) == 2
+
+
+def test_prewarm_in_background_with_execution(fake_api):
+    fake_api.install_process_routes()
+    runner = YepCodeRun(fake_api.config())
+
+    (item,) = runner.prewarm([{"code": CODE, "parameters": {"warmup": True}}], execute=True)
+
+    deadline = time.monotonic() + 5
+    while not item.done:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert item.ready
+    (execute,) = fake_api.requests_to("POST", r"/processes/[^/]+/execute")
+    assert json.loads(json.loads(execute["body"])["parameters"]) == {"warmup": True}
+
+
+def test_reports_failures(fake_api):
+    fake_api.install_process_routes()
+    fake_api.route("POST", r"/processes", lambda request: (500, {"message": "Boom"}))
+    runner = YepCodeRun(fake_api.config())
+
+    (item,) = runner.prewarm([CODE], wait=True)
+
+    assert item.done and not item.ready
+    assert item.error.status == 500
+
+
+def test_requires_the_process_cache(fake_api):
+    runner = YepCodeRun(fake_api.config(), process_cache=False)
+
+    with pytest.raises(ValueError):
+        runner.prewarm([CODE])
+
+
+def test_async_prewarm(fake_api):
+    pytest.importorskip("httpx")
+    fake_api.install_process_routes()
+    runner = AsyncYepCodeRun(fake_api.config())
+
+    async def main():
+        items = await runner.prewarm([CODE], execute=True, wait=True)
+        execution = await runner.run(CODE, {"language": "python"})
+        await execution.wait_for_done()
+        return items
+
+    (item,) = asyncio.run(main())
+
+    assert item.ready
+    assert len(fake_api.requests_to("POST", r"/processes")) == 1
+    assert len(fake_api.requests_to("POST", r"/processes/[^/]+/execute")) == 2
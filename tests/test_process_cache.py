@@ -0,0 +1,134 @@
+import multiprocessing
+
+import pytest
+
+from yepcode_run import YepCodeRun, ProcessCache, SqliteProcessRegistry
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+
+def test_lru_eviction():
+    cache = ProcessCache(max_size=2)
+    cache.set("a", "process-a")
+    cache.set("b", "process-b")
+    assert cache.get("a") == "process-a"
+
+    cache.set("c", "process-c")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "process-a"
+    assert len(cache) == 2
+
+
+def test_key_depends_on_language_and_manifest():
+    keys = {
+        ProcessCache.get_key(CODE, "python"),
+        ProcessCache.get_key(CODE, "javascript"),
+        ProcessCache.get_key(CODE, "python", {"dependencies": ["requests"]}),
+    }
+    assert len(keys) == 3
+
+
+def test_repeated_runs_skip_process_lookup(fake_api):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    runner = YepCodeRun(fake_api.config())
+
+    for _ in range(3):
+        runner.run(CODE, {"language": "python"}).wait_for_done(timeout=5)
+
+    assert len(fake_api.requests_to("GET", r"/processes/[^/]+")) == 1
+    assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 3
+
+
+def test_deleted_process_is_created_again(fake_api):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    runner = YepCodeRun(fake_api.config())
+    runner.run(CODE, {"language": "python"}).wait_for_done(timeout=5)
+    fake_api.processes.clear()
+
+    execution = runner.run(CODE, {"language": "python"})
+
+    execution.wait_for_done(timeout=5)
+    assert len(fake_api.requests_to("POST", r"/processes")) == 2
+    assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 3
+
+
+def test_remove_on_done_forgets_process(fake_api):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    runner = YepCodeRun(fake_api.config())
+
+    runner.run(CODE, {"language": "python", "removeOnDone": True}).wait_for_done(timeout=5)
+
+    assert len(runner.process_cache) == 0
+
+
+def test_persists_to_disk(fake_api, tmp_path):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    path = str(tmp_path / "cache" / "processes.json")
+    YepCodeRun(fake_api.config(), process_cache=path).run(
+        CODE, {"language": "python"}
+    ).wait_for_done(timeout=5)
+
+    runner = YepCodeRun(fake_api.config(), process_cache=path)
+    runner.run(CODE, {"language": "python"}).wait_for_done(timeout=5)
+
+    assert len(fake_api.requests_to("GET", r"/processes/[^/]+")) == 1
+
+
+def test_can_be_disabled(fake_api):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    runner = YepCodeRun(fake_api.config(), process_cache=False)
+
+    for _ in range(2):
+        runner.run(CODE, {"language": "python"}).wait_for_done(timeout=5)
+
+    assert runner.process_cache is None
+    assert len(fake_api.requests_to("GET", r"/processes/[^/]+")) == 2
+
+
+def test_invalid_option():
+    with pytest.raises(ValueError):
+        ProcessCache.from_option(42)
+
+
+def _register_processes(cache_dir, worker):
+    registry = SqliteProcessRegistry(cache_dir)
+    for i in range(20):
+        registry.set(f"worker-{worker}-{i}", f"process-{worker}-{i}")
+
+
+def test_registry_is_shared_between_processes(tmp_path):
+    workers = [
+        multiprocessing.Process(target=_register_processes, args=(str(tmp_path), worker))
+        for worker in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    registry = SqliteProcessRegistry(str(tmp_path))
+    assert all(
+        registry.get(f"worker-{worker}-{i}") == f"process-{worker}-{i}"
+        for worker in range(4)
+        for i in range(20)
+    )
+
+    registry.invalidate_process("process-0-0")
+    assert SqliteProcessRegistry(str(tmp_path)).get("worker-0-0") is None
+
+
+def test_cold_runner_uses_registry(fake_api, tmp_path):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    YepCodeRun(
+        fake_api.config(), process_cache=SqliteProcessRegistry(str(tmp_path))
+    ).run(CODE, {"language": "python"}).wait_for_done(timeout=5)
+
+    runner = YepCodeRun(
+        fake_api.config(), process_cache=SqliteProcessRegistry(str(tmp_path))
+    )
+    runner.run(CODE, {"language": "python"}).wait_for_done(timeout=5)
+
+    assert len(fake_api.requests_to("GET", r"/processes/[^/]+")) == 1
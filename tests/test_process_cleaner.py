@@ -0,0 +1,144 @@
+import gc
+import threading
+import time
+import weakref
+
+from yepcode_run import YepCodeRun, ProcessCleaner
+from yepcode_run.run import process_cleaner
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+
+class FakeApi:
+    def __init__(self):
+        self.deleted = []
+
+    def delete_process(self, process_id):
+        self.deleted.append(process_id)
+
+
+def test_deletes_after_the_grace_period():
+    api = FakeApi()
+    cleaner = ProcessCleaner(api, grace_period=0.05, interval=0.01)
+
+    cleaner.acquire("process-0")
+    cleaner.release("process-0", remove=True)
+    assert len(cleaner) == 1
+    assert api.deleted == []
+
+    deadline = time.monotonic() + 5
+    while not api.deleted:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert api.deleted == ["process-0"]
+    cleaner.close()
+
+
+def test_skips_processes_in_use():
+    api = FakeApi()
+    cleaner = ProcessCleaner(api, grace_period=60)
+
+    cleaner.acquire("process-0")
+    cleaner.acquire("process-0")
+    cleaner.release("process-0", remove=True)
+    assert len(cleaner) == 0
+
+    cleaner.release("process-0")
+    assert len(cleaner) == 1
+
+    # A new run reuses the process, cancelling its deletion
+    cleaner.acquire("process-0")
+    assert len(cleaner) == 0
+    cleaner.release("process-0")
+    assert len(cleaner) == 1
+
+    cleaner.acquire("process-1")
+    cleaner.release("process-1")
+    cleaner.close()
+    assert api.deleted == ["process-0"]
+
+
+def test_flushes_on_close():
+    api = FakeApi()
+    forgotten = []
+    cleaner = ProcessCleaner(api, grace_period=60)
+    cleaner.add_delete_callback(forgotten.append)
+    for process_id in ["process-0", "process-1"]:
+        cleaner.acquire(process_id)
+        cleaner.release(process_id, remove=True)
+
+    cleaner.close()
+
+    assert sorted(api.deleted) == ["process-0", "process-1"]
+    assert sorted(forgotten) == ["process-0", "process-1"]
+
+
+def test_processes_acquired_while_deleting():
+    api = FakeApi()
+    cleaner = ProcessCleaner(api, grace_period=60)
+    cleaner.acquire("process-0")
+    cleaner.release("process-0", remove=True)
+
+    # Acquired again after it was due: not deleted
+    due = cleaner._pop_due(force=True)
+    cleaner.acquire("process-0")
+    cleaner._delete(due)
+    assert api.deleted == []
+
+    # Acquired while its DELETE is in flight: waits for it
+    deleting = threading.Event()
+    acquired = []
+
+    def slow_delete_process(process_id):
+        deleting.set()
+        time.sleep(0.1)
+        assert acquired == []
+        api.deleted.append(process_id)
+
+    api.delete_process = slow_delete_process
+    cleaner.release("process-0", remove=True)
+    thread = threading.Thread(target=cleaner.flush)
+    thread.start()
+    deleting.wait(5)
+    cleaner.acquire("process-0")
+    acquired.append("process-0")
+    thread.join()
+    assert api.deleted == ["process-0"]
+    cleaner.close()
+
+
+def test_unused_cleaners_are_not_kept_alive():
+    api = FakeApi()
+    cleaner = ProcessCleaner(api, grace_period=60)
+    idle = weakref.ref(ProcessCleaner(api))
+
+    # Open cleaners are closed on exit, without keeping them alive
+    assert cleaner in process_cleaner._open_cleaners
+    gc.collect()
+    assert idle() is None
+
+    cleaner.close()
+    assert cleaner not in process_cleaner._open_cleaners
+
+
+def test_remove_on_done_runs_share_the_process(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"])
+    runner = YepCodeRun(fake_api.config(), process_cleaner=True)
+
+    for _ in range(3):
+        runner.run(CODE, {"language": "python", "removeOnDone": True}).wait_for_done(
+            timeout=5
+        )
+
+    # Released by the done callbacks, right after wait_for_done() returns
+    deadline = time.monotonic() + 5
+    while len(runner.process_cleaner) != 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert len(fake_api.requests_to("POST", r"/processes")) == 1
+    assert fake_api.requests_to("DELETE", r"/processes/[^/]+") == []
+
+    runner.process_cleaner.close()
+    assert len(fake_api.requests_to("DELETE", r"/processes/[^/]+")) == 1
+    assert len(runner.process_cache) == 0
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from yepcode_run import (
+    YepCodeRun,
+    AsyncYepCodeRun,
+    AdaptivePolling,
+    ProcessStatsCollector,
+    TimelineEvent,
+)
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+LOGS = [
+    {"timestamp": f"2025-01-01T00:00:0{i}", "level": "INFO", "message": f"line {i}"}
+    for i in range(3)
+]
+
+
+def test_percentiles_and_failure_rate():
+    stats = ProcessStatsCollector()
+    for duration in range(1, 21):
+        stats.record("process", float(duration), failed=duration % 4 == 0, log_lines=10)
+
+    process_stats = stats.get("process")
+    assert process_stats.executions == 20
+    assert process_stats.p50_duration == 10
+    assert process_stats.p95_duration == 19
+    assert process_stats.failure_rate == 0.25
+    assert process_stats.mean_log_lines == 10
+    assert stats.get("other") is None
+
+
+def test_keeps_a_rolling_window():
+    stats = ProcessStatsCollector(window=3)
+    for duration in [100, 1, 2, 3]:
+        stats.record("process", duration, failed=False)
+
+    assert stats.get("process").executions == 3
+    assert stats.get("process").p95_duration == 3
+    assert stats.get("process").mean_log_lines is None
+
+
+def test_timeline_duration():
+    timeline = [
+        TimelineEvent(status="CREATED", timestamp="2025-01-01T00:00:00Z"),
+        TimelineEvent(status="RUNNING", timestamp="2025-01-01T00:00:01Z"),
+        TimelineEvent(status="FINISHED", timestamp="2025-01-01T00:00:03.500Z"),
+    ]
+
+    assert ProcessStatsCollector.get_timeline_duration(timeline) == 3.5
+    assert ProcessStatsCollector.get_timeline_duration(timeline[:1]) is None
+
+
+def test_adaptive_polling_waits_for_the_median():
+    stats = ProcessStatsCollector()
+    polling = AdaptivePolling(min_delay=0.2, jitter=0, stats=stats)
+    polling.record_duration("process", 100)
+    for duration in [4, 5, 60]:
+        stats.record("process", duration, failed=False)
+
+    assert polling.get_expected_duration("process") == 5
+    assert polling.get_delay("process", 0, 1) == 4
+    assert polling.get_expected_duration("other") is None
+
+
+def test_runner_records_finished_executions(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "ERROR"], logs=LOGS)
+    runner = YepCodeRun(fake_api.config())
+
+    execution = runner.run(CODE, {"language": "python"})
+    execution.wait_for_done(timeout=5)
+
+    stats = runner.get_process_stats(execution.process_id)
+    assert stats.executions == 1
+    assert stats.failure_rate == 1
+    assert stats.mean_log_lines == 3
+    assert runner.get_process_stats() == {execution.process_id: stats}
+
+
+def test_async_runner_records_finished_executions(fake_api):
+    pytest.importorskip("httpx")
+    fake_api.install_process_routes(statuses=["RUNNING", "FINISHED"], logs=LOGS)
+    runner = AsyncYepCodeRun(fake_api.config())
+
+    async def main():
+        execution = await runner.run(CODE, {"language": "python"})
+        await execution.wait_for_done()
+        return execution
+
+    execution = asyncio.run(main())
+    stats = runner.get_process_stats(execution.process_id)
+    assert stats.executions == 1
+    assert stats.failure_rate == 0
+    assert stats.mean_log_lines == 3
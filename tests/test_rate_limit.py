@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from yepcode_run import (
+    YepCodeApi,
+    YepCodeRun,
+    YepCodeStorage,
+    RateLimit,
+    RateLimiter,
+    EndpointClass,
+)
+from yepcode_run.api.api_manager import YepCodeApiManager
+from yepcode_run.api.rate_limit import TokenBucket
+from yepcode_run.api.yepcode_api import BaseYepCodeApi, YepCodeApiError
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0, 0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+    bucket.pause(1)
+    assert bucket.reserve() == pytest.approx(1.1, abs=0.01)
+
+
+def test_endpoint_classes():
+    get_class = BaseYepCodeApi._get_endpoint_class
+
+    assert get_class("/processes/my-process/execute") == EndpointClass.EXECUTE
+    assert get_class("processes/my-process/execute-sync") == EndpointClass.EXECUTE
+    assert get_class("executions/execution-0/rerun") == EndpointClass.EXECUTE
+    assert get_class("executions/execution-0") == EndpointClass.POLLING
+    assert get_class("executions") == EndpointClass.POLLING
+    assert get_class("executions/execution-0/logs") == EndpointClass.LOGS
+    assert get_class("storage/objects?name=file.txt") == EndpointClass.STORAGE
+    assert get_class("processes/my-process") == EndpointClass.OTHER
+
+
+def test_limits_the_request_rate(fake_api):
+    fake_api.route("GET", r"/executions/([^/]+)", lambda request, id: {"id": id})
+    fake_api.route("GET", r"/processes/([^/]+)", lambda request, id: {"id": id})
+    config = fake_api.config(rate_limits={"polling": RateLimit(rate=20, burst=1)})
+
+    with YepCodeApi(config) as api:
+        started_at = time.monotonic()
+        for i in range(5):
+            api.get_process(f"process-{i}")
+        assert time.monotonic() - started_at < 0.2
+        for i in range(5):
+            api.get_execution(f"execution-{i}")
+
+    polls = [r["time"] for r in fake_api.requests_to("GET", r"/executions/[^/]+")]
+    assert polls[-1] - polls[0] >= 0.19
+
+
+def test_limits_the_requests_in_flight(fake_api):
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_execute(request, id):
+        with lock:
+            in_flight.append(id)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(id)
+        return {"executionId": f"execution-{id}"}
+
+    fake_api.route("POST", r"/processes/([^/]+)/execute", slow_execute)
+    config = fake_api.config(
+        pool_maxsize=10, rate_limits={"execute": RateLimit(max_in_flight=2)}
+    )
+
+    with YepCodeApi(config) as api:
+        threads = [
+            threading.Thread(target=api.execute_process_async, args=(f"process-{i}",))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(peak) == 8
+    assert max(peak) == 2
+
+
+def test_async_requests_in_flight(fake_api):
+    pytest.importorskip("httpx")
+    from yepcode_run import AsyncYepCodeApi
+
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_get_process(request, id):
+        with lock:
+            in_flight.append(id)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(id)
+        return {"id": id}
+
+    fake_api.route("GET", r"/processes/([^/]+)", slow_get_process)
+    config = fake_api.config(rate_limits={"other": RateLimit(max_in_flight=3)})
+
+    async def main():
+        async with AsyncYepCodeApi(config) as api:
+            await asyncio.gather(*(api.get_process(f"process-{i}") for i in range(9)))
+
+    asyncio.run(main())
+
+    assert len(peak) == 9
+    assert max(peak) <= 3
+
+
+def test_waiting_for_a_token_does_not_hold_a_slot():
+    limiter = RateLimiter({"execute": RateLimit(rate=5, burst=1, max_in_flight=1)})
+    with limiter.limit(EndpointClass.EXECUTE):
+        pass
+
+    def send():
+        with limiter.limit(EndpointClass.EXECUTE):
+            pass
+
+    waiting = threading.Thread(target=send)
+    waiting.start()
+    time.sleep(0.05)
+    semaphore = limiter._semaphores[EndpointClass.EXECUTE]
+    assert semaphore.acquire(blocking=False)
+    semaphore.release()
+    waiting.join()
+
+
+def test_throttled_requests_hold_the_bucket(fake_api):
+    throttled = []
+
+    def throttle_once(request, id):
+        if not throttled:
+            throttled.append(id)
+            return 429, {"message": "Too many requests"}, {"Retry-After": "0.3"}
+        return {"id": id}
+
+    fake_api.route("GET", r"/executions/([^/]+)", throttle_once)
+    limiter = RateLimiter({EndpointClass.POLLING: RateLimit(rate=100)})
+
+    with YepCodeApi(fake_api.config(max_retries=0), rate_limiter=limiter) as api:
+        with pytest.raises(YepCodeApiError):
+            api.get_execution("execution-0")
+        api.get_execution("execution-1")
+
+    first, second = fake_api.requests_to("GET", r"/executions/[^/]+")
+    assert second["time"] - first["time"] >= 0.3
+
+
+def test_shared_by_the_cached_instances_of_the_team(fake_api):
+    limits = {"polling": RateLimit(rate=10)}
+    run = YepCodeRun(fake_api.config(rate_limits=limits))
+    storage = YepCodeStorage(fake_api.config(rate_limits=limits))
+    other = YepCodeApiManager.get_instance(
+        fake_api.config(rate_limits=limits, max_retries=1)
+    )
+
+    assert run.yepcode_api.rate_limiter is not None
+    assert run.yepcode_api.rate_limiter is storage._api.rate_limiter
+    assert run.yepcode_api.rate_limiter is other.rate_limiter
+    assert YepCodeRun(fake_api.config()).yepcode_api.rate_limiter is None
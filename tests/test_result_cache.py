@@ -0,0 +1,154 @@
+import asyncio
+import time
+
+import pytest
+
+from yepcode_run import (
+    YepCodeRun,
+    AsyncYepCodeRun,
+    ResultCache,
+    MemoryResultCache,
+    FileResultCache,
+    ExecutionStatus,
+)
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+LOGS = [{"timestamp": "2025-01-01T00:00:00", "level": "INFO", "message": "hello"}]
+
+
+def age(cache, key, seconds):
+    result = cache.get(key)
+    result.stored_at = time.time() - seconds
+    cache._store(key, result)
+
+
+def test_key_is_canonical():
+    key = ResultCache.get_key(CODE, "python", parameters={"a": 1, "b": [1, 2]})
+
+    assert key == ResultCache.get_key(CODE, "python", parameters={"b": [1, 2], "a": 1})
+    assert key != ResultCache.get_key(CODE, "python", parameters={"a": 2, "b": [1, 2]})
+    assert key != ResultCache.get_key(CODE, "javascript", parameters={"a": 1, "b": [1, 2]})
+
+
+@pytest.mark.parametrize("backend", ["memory", "file"])
+def test_ttl_and_stale_ttl(backend, tmp_path):
+    cache = (
+        MemoryResultCache(ttl=10, stale_ttl=20)
+        if backend == "memory"
+        else FileResultCache(str(tmp_path), ttl=10, stale_ttl=20)
+    )
+    cache.set("key", {"value": 1}, "execution-0", "process-0")
+
+    result = cache.get("key")
+    assert result.return_value == {"value": 1}
+    assert result.execution_id == "execution-0"
+    assert not cache.is_stale(result)
+
+    age(cache, "key", 15)
+    assert cache.is_stale(cache.get("key"))
+
+    age(cache, "key", 31)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("backend", ["memory", "file"])
+def test_evicts_least_recently_used(backend, tmp_path):
+    cache = (
+        MemoryResultCache(max_size=2)
+        if backend == "memory"
+        else FileResultCache(str(tmp_path), max_size=2)
+    )
+    cache.set("a", 1)
+    time.sleep(0.01)
+    cache.set("b", 2)
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a").return_value == 1
+
+
+def test_file_cache_is_shared(tmp_path):
+    FileResultCache(str(tmp_path)).set("key", [1, 2, 3])
+
+    assert FileResultCache(str(tmp_path)).get("key").return_value == [1, 2, 3]
+
+
+def test_from_option(tmp_path):
+    assert ResultCache.from_option(None) is None
+    assert isinstance(ResultCache.from_option(True), MemoryResultCache)
+    assert isinstance(ResultCache.from_option(str(tmp_path)), FileResultCache)
+    with pytest.raises(ValueError):
+        ResultCache.from_option(1)
+
+
+def test_repeated_runs_return_the_cached_result(fake_api):
+    fake_api.install_process_routes(return_value={"value": 1}, logs=LOGS)
+    runner = YepCodeRun(fake_api.config(), result_cache=True)
+    options = {"language": "python", "parameters": {"a": 1}}
+    finished = []
+
+    first = runner.run(CODE, options)
+    assert first.result(timeout=5) == {"value": 1}
+    cached = runner.run(CODE, {**options, "onFinish": finished.append})
+
+    assert cached.done()
+    assert cached.status == ExecutionStatus.FINISHED
+    assert cached.result() == {"value": 1}
+    assert cached.id == first.id
+    assert finished == [{"value": 1}]
+    assert [log.message for log in cached.logs] == ["hello"]
+    assert len(fake_api.requests_to("POST", r"/processes/[^/]+/execute")) == 1
+
+    runner.run(CODE, {**options, "parameters": {"a": 2}}).wait_for_done(timeout=5)
+    runner.run(CODE, {**options, "memoize": False}).wait_for_done(timeout=5)
+    assert len(fake_api.requests_to("POST", r"/processes/[^/]+/execute")) == 3
+
+
+def test_failed_runs_are_not_cached(fake_api):
+    fake_api.install_process_routes(statuses=["RUNNING", "ERROR"])
+    runner = YepCodeRun(fake_api.config(), result_cache=True)
+
+    runner.run(CODE, {"language": "python"}).wait_for_done(timeout=5)
+
+    assert len(runner.result_cache) == 0
+
+
+def test_stale_results_are_refreshed_in_background(fake_api):
+    fake_api.install_process_routes(return_value={"value": 1})
+    runner = YepCodeRun(
+        fake_api.config(), result_cache=MemoryResultCache(ttl=10, stale_ttl=60)
+    )
+    runner.run(CODE, {"language": "python"}).wait_for_done(timeout=5)
+    (key,) = runner.result_cache._entries
+    age(runner.result_cache, key, 20)
+    fake_api.execution_script["return_value"] = {"value": 2}
+
+    assert runner.run(CODE, {"language": "python"}).result() == {"value": 1}
+
+    deadline = time.monotonic() + 5
+    while runner.result_cache.get(key).return_value != {"value": 2}:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert not runner.result_cache.is_stale(runner.result_cache.get(key))
+
+
+def test_async_runs_return_the_cached_result(fake_api):
+    pytest.importorskip("httpx")
+    fake_api.install_process_routes(return_value={"value": 1})
+    runner = AsyncYepCodeRun(fake_api.config(), result_cache=True)
+
+    async def main():
+        first = await runner.run(CODE, {"language": "python"})
+        await first.wait_for_done()
+        cached = await runner.run(CODE, {"language": "python"})
+        return await cached.result()
+
+    assert asyncio.run(main()) == {"value": 1}
+    assert len(fake_api.requests_to("POST", r"/processes/[^/]+/execute")) == 1
@@ -0,0 +1,176 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from yepcode_run import YepCodeApi, RetryPolicy
+from yepcode_run.api.types import CreateStorageObjectInput
+from yepcode_run.api.yepcode_api import YepCodeApiError
+
+from conftest import make_access_token
+
+
+def failing(statuses, body=None, headers=None):
+    """Handler answering with each of statuses, then with body."""
+    statuses = list(statuses)
+
+    def handler(request, *args):
+        if statuses:
+            return statuses.pop(0), {"message": "Unavailable"}, headers
+        return body if body is not None else {"id": args[0] if args else None}
+
+    return handler
+
+
+def test_policy_delays():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=0)
+
+    assert [policy.get_delay(retries) for retries in range(4)] == [1, 2, 4, 5]
+    assert policy.get_delay(0, retry_after=3) == 3
+    assert policy.get_delay(0, retry_after=6) is None
+    assert 0.8 <= RetryPolicy(backoff=1, jitter=0.2).get_delay(0) <= 1.2
+
+
+def test_policy_is_idempotency_aware():
+    policy = RetryPolicy(max_retries=2)
+
+    assert policy.should_retry_status(503, 0, idempotent=True)
+    assert not policy.should_retry_status(503, 2, idempotent=True)
+    assert not policy.should_retry_status(500, 0, idempotent=True)
+    assert not policy.should_retry_status(503, 0, idempotent=False)
+    assert policy.should_retry_status(429, 0, idempotent=False)
+    assert policy.should_retry_error(0, idempotent=False, connect_error=True)
+    assert not policy.should_retry_error(0, idempotent=False, connect_error=False)
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+
+def test_retries_transient_errors(fake_api):
+    fake_api.route("GET", r"/processes/(.+)", failing([503, 502]))
+
+    with YepCodeApi(fake_api.config(retry_backoff=0.01)) as api:
+        assert api.get_process("process-0") == {"id": "process-0"}
+
+    assert len(fake_api.requests_to("GET", r"/processes/.+")) == 3
+
+
+def test_gives_up_after_max_retries(fake_api):
+    fake_api.route("GET", r"/processes/(.+)", failing([503] * 10))
+
+    with YepCodeApi(fake_api.config(max_retries=2, retry_backoff=0.01)) as api:
+        with pytest.raises(YepCodeApiError) as error:
+            api.get_process("process-0")
+
+    assert error.value.status == 503
+    assert len(fake_api.requests_to("GET", r"/processes/.+")) == 3
+
+
+def test_honors_retry_after(fake_api):
+    fake_api.route(
+        "GET", r"/processes/(.+)", failing([429], headers={"Retry-After": "0.3"})
+    )
+
+    with YepCodeApi(fake_api.config(retry_backoff=0.01)) as api:
+        api.get_process("process-0")
+
+    first, second = fake_api.requests_to("GET", r"/processes/.+")
+    assert second["time"] - first["time"] >= 0.3
+
+
+def test_raises_when_retry_after_is_too_long(fake_api):
+    fake_api.route(
+        "GET", r"/processes/(.+)", failing([429], headers={"Retry-After": "120"})
+    )
+
+    with YepCodeApi(fake_api.config()) as api:
+        started_at = time.monotonic()
+        with pytest.raises(YepCodeApiError) as error:
+            api.get_process("process-0")
+
+    assert time.monotonic() - started_at < 1
+    assert error.value.retry_after == 120
+
+
+def test_executions_are_only_retried_when_rejected(fake_api):
+    fake_api.route("POST", r"/processes/(.+)/execute", failing([503]))
+
+    with YepCodeApi(fake_api.config(retry_backoff=0.01)) as api:
+        with pytest.raises(YepCodeApiError):
+            api.execute_process_async("process-0")
+        assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 1
+
+        fake_api.route(
+            "POST",
+            r"/processes/(.+)/execute",
+            failing([429], body={"executionId": "execution-0"}),
+        )
+        assert api.execute_process_async("process-0") == {"executionId": "execution-0"}
+        assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 3
+
+
+def test_unauthorized_retries_are_bounded(fake_api):
+    fake_api.route(
+        "GET", r"/processes/(.+)", lambda request, id: (401, {"message": "Unauthorized"})
+    )
+
+    with YepCodeApi(fake_api.config()) as api:
+        with pytest.raises(YepCodeApiError) as error:
+            api.get_process("process-0")
+
+    assert error.value.status == 401
+    assert fake_api.auth_requests == 2
+    assert len(fake_api.requests_to("GET", r"/processes/.+")) == 2
+
+
+def test_retries_network_errors(fake_api, monkeypatch):
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+    api = YepCodeApi(fake_api.config(retry_backoff=0.01))
+    api.access_token = make_access_token()
+    request = api._transport.request
+    calls = []
+
+    def flaky_request(method, url, **kwargs):
+        calls.append(method)
+        if len(calls) == 1:
+            raise requests.ConnectionError("Connection reset")
+        return request(method, url, **kwargs)
+
+    monkeypatch.setattr(api._transport, "request", flaky_request)
+
+    assert api.get_process("process-0") == {"id": "process-0"}
+    # Not opening the connection is the only network error retried for POST
+    calls.clear()
+    with pytest.raises(Exception):
+        api.execute_process_async("process-0")
+    assert len(calls) == 1
+    api.close()
+
+
+def test_storage_requests_are_retried(fake_api):
+    fake_api.route("DELETE", r"/storage/objects/(.+)", failing([503], body={}))
+    fake_api.route(
+        "POST", r"/storage/objects", failing([429], body={"name": "file.txt", "size": 7})
+    )
+
+    with YepCodeApi(fake_api.config(retry_backoff=0.01)) as api:
+        api.delete_object("file.txt")
+        api.create_object(CreateStorageObjectInput(name="file.txt", file=b"content"))
+
+    assert len(fake_api.requests_to("DELETE", r"/storage/objects/.+")) == 2
+    first, second = fake_api.requests_to("POST", r"/storage/objects")
+    assert b"content" in second["body"]
+
+
+def test_async_retries(fake_api):
+    pytest.importorskip("httpx")
+    from yepcode_run import AsyncYepCodeApi
+
+    fake_api.route("GET", r"/processes/(.+)", failing([503, 504]))
+
+    async def main():
+        async with AsyncYepCodeApi(fake_api.config(retry_backoff=0.01)) as api:
+            return await api.get_process("process-0")
+
+    assert asyncio.run(main()) == {"id": "process-0"}
+    assert len(fake_api.requests_to("GET", r"/processes/.+")) == 3
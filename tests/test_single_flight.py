@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from yepcode_run import YepCodeRun
+from yepcode_run.utils.single_flight import SingleFlight, AsyncSingleFlight
+
+CODE = """def main():
+    return {"message": "hello"}"""
+
+
+def test_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        futures = [pool.submit(single_flight.do, "key", fn) for _ in range(20)]
+        while not calls:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["result"] * 20
+    assert len(calls) == 1
+    assert len(single_flight) == 0
+    # Completed calls run again
+    assert single_flight.do("key", lambda: "new") == "new"
+
+
+def test_shares_exceptions():
+    single_flight = SingleFlight()
+    with pytest.raises(ValueError):
+        single_flight.do("key", lambda: (_ for _ in ()).throw(ValueError()))
+    assert len(single_flight) == 0
+
+
+def test_async_coalesces_concurrent_calls():
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        single_flight = AsyncSingleFlight()
+        return await asyncio.gather(*[single_flight.do("key", fn) for _ in range(20)])
+
+    assert asyncio.run(main()) == ["result"] * 20
+    assert len(calls) == 1
+
+
+def test_async_callers_can_be_cancelled():
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        single_flight = AsyncSingleFlight()
+        leader = asyncio.ensure_future(single_flight.do("key", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("key", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+        result = await follower
+        await asyncio.sleep(0)
+        return leader.cancelled(), result, len(single_flight)
+
+    assert asyncio.run(main()) == (True, "result", 0)
+    assert len(calls) == 1
+
+
+def test_concurrent_runs_create_the_process_once(fake_api):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+    get_process = next(
+        handler for method, pattern, handler in fake_api.routes
+        if method == "GET" and pattern.pattern == "^/processes/([^/]+)$"
+    )
+
+    def slow_get_process(request, slug):
+        time.sleep(0.2)
+        return get_process(request, slug)
+
+    fake_api.route("GET", r"/processes/([^/]+)", slow_get_process)
+    runner = YepCodeRun(fake_api.config(), process_cache=False)
+
+    with ThreadPoolExecutor(max_workers=50) as pool:
+        process_ids = list(
+            pool.map(lambda _: runner.create_process(CODE, "python"), range(200))
+        )
+
+    assert len(set(process_ids)) == 1
+    assert len(fake_api.requests_to("POST", r"/processes")) == 1
@@ -0,0 +1,187 @@
+import json
+import time
+
+import pytest
+
+from yepcode_run import (
+    YepCodeRun,
+    ExecutionStatus,
+    YepCodeExecutionError,
+    YepCodeExecutionTimeoutError,
+)
+from yepcode_run.api.yepcode_api import YepCodeApiError
+
+CODE = """def main():
+    print("hello")
+    return {"message": "hello"}"""
+
+LOGS = [{"timestamp": "2025-01-01T00:00:01", "level": "INFO", "message": "hello"}]
+
+
+@pytest.fixture
+def runner(fake_api):
+    return YepCodeRun(fake_api.config())
+
+
+def test_sync_mode_returns_finished_execution(fake_api, runner):
+    fake_api.install_process_routes(logs=LOGS, return_value={"message": "hello"})
+    finished = []
+
+    execution = runner.run(
+        CODE, {"language": "python", "mode": "sync", "onFinish": finished.append}
+    )
+
+    assert execution.done()
+    assert execution.status == ExecutionStatus.FINISHED
+    assert execution.result() == {"message": "hello"}
+    assert finished == [{"message": "hello"}]
+    assert fake_api.requests_to("GET", r"/executions/.+") == []
+    # Logs are only fetched when needed
+    assert [log.message for log in execution.logs] == ["hello"]
+    assert [log.message for log in execution.iter_logs()] == ["hello"]
+    assert len(fake_api.requests_to("GET", r"/executions/.+/logs")) == 1
+
+
+def test_sync_timeout_falls_back_to_polling(fake_api, runner):
+    fake_api.install_process_routes(
+        statuses=["RUNNING", "FINISHED"], return_value={"message": "hello"}
+    )
+    fake_api.sync_timeout = True
+
+    execution = runner.run(CODE, {"language": "python", "mode": "sync"})
+
+    assert execution.result(timeout=5) == {"message": "hello"}
+    assert len(fake_api.requests_to("GET", r"/executions/[^/]+")) >= 1
+
+
+def test_sync_failures_are_tracked(fake_api, runner):
+    fake_api.install_process_routes(statuses=["ERROR"])
+
+    execution = runner.run(CODE, {"language": "python", "mode": "sync"})
+
+    with pytest.raises(YepCodeExecutionError):
+        execution.result(timeout=5)
+
+
+def get_route(fake_api, path):
+    patterns = [pattern.pattern for _, pattern, _ in fake_api.routes]
+    return fake_api.routes[patterns.index(f"^{path}$")][2]
+
+
+def test_client_timeout_keeps_tracking_the_execution(fake_api, runner):
+    fake_api.install_process_routes(statuses=["RUNNING"])
+    execute_sync = get_route(fake_api, r"/processes/([^/]+)/execute-sync")
+
+    def slow_execute_sync(request, id):
+        # Another run of the same process starts meanwhile
+        execute_sync({**request, "body": json.dumps({"parameters": '{"name": "bob"}'})}, id)
+        response = execute_sync(request, id)
+        time.sleep(0.5)
+        return response
+
+    fake_api.route("POST", r"/processes/([^/]+)/execute-sync", slow_execute_sync)
+
+    execution = runner.run(
+        CODE,
+        {"language": "python", "mode": "sync", "timeout": 200, "parameters": {"name": "alice"}},
+    )
+
+    assert execution.id == "execution-1"
+    with pytest.raises(YepCodeExecutionTimeoutError):
+        execution.result(timeout=5)
+    assert len(fake_api.requests_to("GET", r"/executions/[^/]+")) == 1
+
+
+def test_client_timeout_without_a_matching_execution(fake_api, runner):
+    fake_api.install_process_routes(statuses=["RUNNING"])
+    execute_sync = get_route(fake_api, r"/processes/([^/]+)/execute-sync")
+
+    def slow_execute_sync(request, id):
+        # Only someone else's execution is listed
+        execute_sync({**request, "body": json.dumps({"parameters": '{"name": "bob"}'})}, id)
+        time.sleep(0.5)
+        return 504, {"message": "Timeout"}
+
+    fake_api.route("POST", r"/processes/([^/]+)/execute-sync", slow_execute_sync)
+
+    with pytest.raises(YepCodeExecutionTimeoutError):
+        runner.run(
+            CODE,
+            {"language": "python", "mode": "sync", "timeout": 200, "parameters": {"name": "bob"}},
+        )
+
+
+def test_responses_without_the_execution_header(fake_api, runner):
+    fake_api.install_process_routes(return_value={"message": "hello"})
+    execute_sync = get_route(fake_api, r"/processes/([^/]+)/execute-sync")
+    fake_api.route(
+        "POST",
+        r"/processes/([^/]+)/execute-sync",
+        lambda request, id: execute_sync(request, id)[:2],
+    )
+
+    # Looked up by its comment and parameters
+    execution = runner.run(CODE, {"language": "python", "mode": "sync"})
+    assert execution.id == "execution-0"
+    assert execution.result() == {"message": "hello"}
+
+    # Or read from the body of error responses
+    fake_api.route(
+        "POST",
+        r"/processes/([^/]+)/execute-sync",
+        lambda request, id: (500, {"message": "Failed", "executionId": "execution-0"}),
+    )
+    assert runner.run(CODE, {"language": "python", "mode": "sync"}).id == "execution-0"
+
+    fake_api.route(
+        "POST", r"/processes/([^/]+)/execute-sync", lambda request, id: {"message": "hello"}
+    )
+    with pytest.raises(YepCodeApiError, match="didn't identify the execution"):
+        runner.run(CODE, {"language": "python", "mode": "sync"})
+
+
+def test_auto_mode(fake_api, runner):
+    fake_api.install_process_routes(statuses=["FINISHED"], logs=LOGS)
+
+    # Processes without known durations are tracked asynchronously
+    execution = runner.run(CODE, {"language": "python", "mode": "auto"})
+    execution.wait_for_done(timeout=5)
+    assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 1
+
+    runner.process_stats.record(execution.process_id, 1.0, False)
+    runner.run(CODE, {"language": "python", "mode": "auto"}).wait_for_done(timeout=5)
+    assert len(fake_api.requests_to("POST", r"/processes/.+/execute-sync")) == 1
+
+    # Streaming logs requires async tracking
+    logs = []
+    runner.run(
+        CODE, {"language": "python", "mode": "auto", "onLog": logs.append}
+    ).wait_for_done(timeout=5)
+    assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 2
+    assert len(logs) == 1
+
+    # So do slow processes
+    runner.process_stats.record(execution.process_id, 60.0, False)
+    runner.process_stats.record(execution.process_id, 60.0, False)
+    runner.run(CODE, {"language": "python", "mode": "auto"}).wait_for_done(timeout=5)
+    assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 3
+
+
+def test_batch_items_run_async(fake_api, runner):
+    fake_api.install_process_routes(statuses=["FINISHED"])
+
+    results = list(
+        runner.run_many(CODE, [{"n": 1}, {"n": 2}], {"language": "python", "mode": "sync"})
+    )
+
+    assert [result.error for result in results] == [None, None]
+
+    assert len(fake_api.requests_to("POST", r"/processes/.+/execute")) == 2
+    assert fake_api.requests_to("POST", r"/processes/.+/execute-sync") == []
+
+
+def test_invalid_mode(fake_api, runner):
+    fake_api.install_process_routes()
+
+    with pytest.raises(ValueError):
+        runner.run(CODE, {"language": "python", "mode": "fast"})
@@ -0,0 +1,63 @@
+from yepcode_run import YepCodeApi
+from yepcode_run.api.api_manager import YepCodeApiManager
+from yepcode_run.api.transport import YepCodeHttpTransport
+
+
+def test_reuses_connections_between_requests(fake_api):
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+
+    with YepCodeApi(fake_api.config()) as api:
+        for i in range(10):
+            assert api.get_process(f"process-{i}") == {"id": f"process-{i}"}
+
+    # auth + 10 requests over a single keep-alive connection
+    assert len(fake_api.requests) == 11
+    assert len(fake_api.connections) == 1
+
+
+def test_opens_new_connections_without_keep_alive(fake_api):
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+
+    with YepCodeApi(fake_api.config(keep_alive=False)) as api:
+        for i in range(3):
+            api.get_process(f"process-{i}")
+
+    assert len(fake_api.connections) == 4
+
+
+def test_applies_pool_settings_from_config(fake_api):
+    api = YepCodeApi(fake_api.config(pool_connections=3, pool_maxsize=25))
+    adapter = api._transport._session.get_adapter(fake_api.url)
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 25
+    api.close()
+    assert api._transport.closed
+
+
+def test_manager_shares_transport_between_instances(fake_api):
+    try:
+        api = YepCodeApiManager.get_instance(fake_api.config())
+        other_api = YepCodeApiManager.get_instance(fake_api.config(team_id="other"))
+
+        assert api is not other_api
+        assert api._transport is other_api._transport
+
+        # Closing a shared instance doesn't close the shared transport
+        api.close()
+        assert not api._transport.closed
+    finally:
+        YepCodeApiManager.clear_instances()
+
+    # Existing instances keep working
+    fake_api.route("GET", r"/processes/(.+)", lambda request, id: {"id": id})
+    assert api.get_process("process-0") == {"id": "process-0"}
+    assert YepCodeApiManager.get_instance(fake_api.config()) is not api
+
+
+def test_shared_transport_is_not_closed_by_api(fake_api):
+    with YepCodeHttpTransport(pool_maxsize=2) as transport:
+        api = YepCodeApi(fake_api.config(), transport=transport)
+        api.close()
+        assert not transport.closed
+    assert transport.closed
@@ -1,10 +1,47 @@
 from .run.yepcode_run import YepCodeRun
-from .run.execution import Execution
+from .run.execution import (
+    Execution,
+    YepCodeExecutionError,
+    YepCodeExecutionTimeoutError,
+)
+from .run.execution_tracker import ExecutionTracker
+from .run.callback_listener import ExecutionCallbackListener
+from .run.batch import BatchResult
+from .run.prewarm import PrewarmedProcess
+from .run.polling import PollingStrategy, AdaptivePolling, FixedPolling, LadderPolling
+from .run.process_cache import ProcessCache, SqliteProcessRegistry
+from .run.process_cleaner import ProcessCleaner
+from .run.process_stats import ProcessStats, ProcessStatsCollector
+from .run.result_cache import (
+    ResultCache,
+    MemoryResultCache,
+    FileResultCache,
+    CachedResult,
+)
+from .run.log_store import (
+    LogStore,
+    RingLogStore,
+    LevelLogStore,
+    NullLogStore,
+    FileLogStore,
+)
+from .run.async_yepcode_run import AsyncYepCodeRun
+from .run.async_execution import AsyncExecution
 from .api.yepcode_api import YepCodeApi
+from .api.transport import YepCodeHttpTransport
+from .api.retry import RetryPolicy
+from .api.rate_limit import RateLimiter
+from .api.circuit_breaker import CircuitBreaker, CircuitState
+from .api.yepcode_api import YepCodeCircuitOpenError
+from .api.async_yepcode_api import AsyncYepCodeApi
 from .env.yepcode_env import YepCodeEnv
+from .env.async_yepcode_env import AsyncYepCodeEnv
 from .storage.yepcode_storage import YepCodeStorage
+from .storage.async_yepcode_storage import AsyncYepCodeStorage
 from .api.types import (
     YepCodeApiConfig,
+    RateLimit,
+    EndpointClass,
     ExecutionStatus,
     Log,
     TimelineEvent,
@@ -21,7 +58,44 @@ __all__ = [
     "YepCodeEnv",
     "YepCodeStorage",
     "Execution",
+    "YepCodeExecutionError",
+    "YepCodeExecutionTimeoutError",
+    "ExecutionTracker",
+    "ExecutionCallbackListener",
+    "BatchResult",
+    "PrewarmedProcess",
+    "PollingStrategy",
+    "AdaptivePolling",
+    "FixedPolling",
+    "LadderPolling",
+    "ProcessCache",
+    "SqliteProcessRegistry",
+    "ProcessCleaner",
+    "ProcessStats",
+    "ProcessStatsCollector",
+    "ResultCache",
+    "MemoryResultCache",
+    "FileResultCache",
+    "CachedResult",
+    "LogStore",
+    "RingLogStore",
+    "LevelLogStore",
+    "NullLogStore",
+    "FileLogStore",
     "YepCodeApi",
+    "AsyncYepCodeRun",
+    "AsyncYepCodeEnv",
+    "AsyncYepCodeStorage",
+    "AsyncExecution",
+    "AsyncYepCodeApi",
+    "YepCodeHttpTransport",
+    "RetryPolicy",
+    "RateLimiter",
+    "RateLimit",
+    "EndpointClass",
+    "CircuitBreaker",
+    "CircuitState",
+    "YepCodeCircuitOpenError",
     "YepCodeApiConfig",
     "ExecutionStatus",
     "Log",
@@ -1,13 +1,19 @@
 import hashlib
 import json
-from typing import Dict, ClassVar
+from typing import Dict, ClassVar, Optional
 from .yepcode_api import YepCodeApi
-from .types import YepCodeApiConfig
+from .async_yepcode_api import AsyncYepCodeApi
+from .types import YepCodeApiConfig, EndpointClass
+from .transport import YepCodeHttpTransport
+from .rate_limit import RateLimiter
 from ..utils.config_manager import ConfigManager
 
 
 class YepCodeApiManager:
     _instances: ClassVar[Dict[str, YepCodeApi]] = {}
+    _async_instances: ClassVar[Dict[str, AsyncYepCodeApi]] = {}
+    _transports: ClassVar[Dict[str, YepCodeHttpTransport]] = {}
+    _rate_limiters: ClassVar[Dict[str, RateLimiter]] = {}
 
     @staticmethod
     def _get_config_hash(config: YepCodeApiConfig) -> str:
@@ -22,11 +28,58 @@ class YepCodeApiManager:
         }
 
         # Convert to JSON string and create hash
-        config_str = json.dumps(sorted_config, sort_keys=True)
+        config_str = json.dumps(sorted_config, sort_keys=True, default=repr)
         return hashlib.sha256(config_str.encode()).hexdigest()
 
+    @staticmethod
+    def _get_transport_key(config: YepCodeApiConfig) -> str:
+        return json.dumps(
+            [
+                config.pool_connections,
+                config.pool_maxsize,
+                config.pool_block,
+                config.keep_alive,
+            ]
+        )
+
     @classmethod
-    def get_instance(cls, config: YepCodeApiConfig = None) -> YepCodeApi:
+    def get_transport(cls, config: YepCodeApiConfig) -> YepCodeHttpTransport:
+        """
+        Get the pooled transport shared by every cached instance using the same
+        pool settings, so they all reuse the same keep-alive connections.
+        """
+        transport_key = cls._get_transport_key(config)
+        transport = cls._transports.get(transport_key)
+        if transport is None or transport.closed:
+            transport = YepCodeApi.create_transport(config)
+            cls._transports[transport_key] = transport
+        return transport
+
+    @staticmethod
+    def _get_rate_limiter_key(team_id: str, config: YepCodeApiConfig) -> str:
+        limits = {
+            EndpointClass(endpoint_class).value: repr(limit)
+            for endpoint_class, limit in config.rate_limits.items()
+        }
+        return json.dumps([team_id, limits], sort_keys=True)
+
+    @classmethod
+    def get_rate_limiter(
+        cls, team_id: str, config: YepCodeApiConfig
+    ) -> Optional[RateLimiter]:
+        """
+        Get the rate limiter shared by every cached instance, sync or async,
+        of the team using the same limits, so they are enforced team-wide.
+        """
+        if not config.rate_limits:
+            return None
+        key = cls._get_rate_limiter_key(team_id, config)
+        if key not in cls._rate_limiters:
+            cls._rate_limiters[key] = RateLimiter(config.rate_limits)
+        return cls._rate_limiters[key]
+
+    @staticmethod
+    def _merge_config(config: YepCodeApiConfig = None) -> YepCodeApiConfig:
         if config is None:
             config = YepCodeApiConfig()
 
@@ -39,15 +92,41 @@ class YepCodeApiManager:
         # Only update with non-None values from config
         merged_dict.update({k: v for k, v in config.__dict__.items() if v is not None})
 
-        merged_config = YepCodeApiConfig(**merged_dict)
+        return YepCodeApiConfig(**merged_dict)
+
+    @classmethod
+    def get_instance(cls, config: YepCodeApiConfig = None) -> YepCodeApi:
+        merged_config = cls._merge_config(config)
 
         config_hash = cls._get_config_hash(merged_config)
 
         if config_hash not in cls._instances:
-            cls._instances[config_hash] = YepCodeApi(merged_config)
+            api = YepCodeApi(merged_config, transport=cls.get_transport(merged_config))
+            api.rate_limiter = cls.get_rate_limiter(api.team_id, merged_config)
+            cls._instances[config_hash] = api
 
         return cls._instances[config_hash]
 
+    @classmethod
+    def get_async_instance(cls, config: YepCodeApiConfig = None) -> AsyncYepCodeApi:
+        merged_config = cls._merge_config(config)
+
+        config_hash = cls._get_config_hash(merged_config)
+
+        if config_hash not in cls._async_instances:
+            api = AsyncYepCodeApi(merged_config)
+            api.rate_limiter = cls.get_rate_limiter(api.team_id, merged_config)
+            cls._async_instances[config_hash] = api
+
+        return cls._async_instances[config_hash]
+
     @classmethod
     def clear_instances(cls) -> None:
+        """
+        Forget the cached instances, transports and rate limiters. They are
+        not closed, as existing clients may still use them.
+        """
         cls._instances.clear()
+        cls._async_instances.clear()
+        cls._rate_limiters.clear()
+        cls._transports.clear()
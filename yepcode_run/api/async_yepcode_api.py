@@ -0,0 +1,578 @@
+import asyncio
+import weakref
+from typing import Optional, Dict, Any, List, AsyncIterator
+from urllib.parse import quote
+
+from .types import (
+    YepCodeApiConfig,
+    Process,
+    Execution,
+    ExecutionId,
+    ExecutionsPaginatedResult,
+    ExecutionLogsPaginatedResult,
+    ProcessesPaginatedResult,
+    Schedule,
+    SchedulesPaginatedResult,
+    TeamVariable,
+    TeamVariablesPaginatedResult,
+    VersionedProcess,
+    VersionedProcessesPaginatedResult,
+    VersionedProcessAlias,
+    VersionedProcessAliasesPaginatedResult,
+    Module,
+    ModulesPaginatedResult,
+    VersionedModule,
+    VersionedModulesPaginatedResult,
+    VersionedModuleAlias,
+    VersionedModuleAliasesPaginatedResult,
+    CreateProcessInput,
+    UpdateProcessInput,
+    CreateTeamVariableInput,
+    UpdateTeamVariableInput,
+    CreateModuleInput,
+    UpdateModuleInput,
+    PublishProcessInput,
+    PublishModuleInput,
+    VersionedProcessAliasInput,
+    VersionedModuleAliasInput,
+    ScheduledProcessInput,
+    CreateStorageObjectInput,
+    StorageObject,
+    CreateSignedUrlInput,
+    SignedUrl,
+    ProgrammingLanguage,
+    ProgrammingLanguageManifest,
+    UpdateTeamDependenciesInput,
+    Team,
+    UpdateTeamInput,
+    Sandbox,
+    CreateSandboxInput,
+    UpdateSandboxInput,
+)
+from .circuit_breaker import CircuitBreaker
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .yepcode_api import BaseYepCodeApi, YepCodeApiError
+from ..utils.single_flight import AsyncSingleFlight
+
+
+class AsyncYepCodeApi(BaseYepCodeApi):
+    """
+    Asyncio counterpart of YepCodeApi.
+
+    Exposes the same methods as YepCodeApi as coroutines, backed by a
+    non-blocking httpx client, so a single event loop can drive thousands of
+    concurrent requests. Requires the optional ``httpx`` dependency
+    (``pip install yepcode-run[async]``).
+    """
+
+    def __init__(
+        self,
+        config: YepCodeApiConfig = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        super().__init__(config, retry_policy, rate_limiter, circuit_breaker)
+        # httpx clients are bound to the event loop they were first used in:
+        # one per loop, with the async generator closing it at loop shutdown
+        self._clients = weakref.WeakKeyDictionary()
+        self._token_refresh_task: Optional[asyncio.Task] = None
+        self._access_token_calls = AsyncSingleFlight()
+
+    def _create_client(self):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncYepCodeApi requires httpx. Install it with: pip install yepcode-run[async]"
+            ) from e
+
+        pool_maxsize = self._config.pool_maxsize or 100
+        keep_alive = self._config.keep_alive is not False
+        limits = httpx.Limits(
+            max_connections=pool_maxsize if self._config.pool_block else None,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+        )
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=httpx.Timeout(self.timeout / 1000, pool=None),
+        )
+
+    @staticmethod
+    async def _client_lifetime(client) -> AsyncIterator[None]:
+        """
+        Suspended until the event loop shuts its async generators down (ie:
+        at the end of asyncio.run()), closing the client with it.
+        """
+        try:
+            yield
+        finally:
+            await client.aclose()
+
+    async def _get_client(self):
+        loop = asyncio.get_running_loop()
+        if loop not in self._clients:
+            client = self._create_client()
+            lifetime = self._client_lifetime(client)
+            await lifetime.__anext__()
+            self._clients[loop] = (client, lifetime)
+        return self._clients[loop][0]
+
+    async def close(self) -> None:
+        """Close the HTTP client of the running event loop and its pooled connections."""
+        entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    async def __aenter__(self) -> "AsyncYepCodeApi":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _get_access_token(self) -> str:
+        """
+        Get a new access token. Concurrent calls share a single
+        authentication request.
+        """
+        return await self._access_token_calls.do(
+            "access_token", self._request_access_token
+        )
+
+    async def _renew_access_token(self, access_token: Optional[str]) -> None:
+        """Replace a missing, expired or rejected token, unless already replaced."""
+
+        async def renew() -> str:
+            # Checked within the flight: a renewal may have just finished
+            if self._has_replaced_access_token(access_token):
+                return self.access_token
+            return await self._request_access_token()
+
+        await self._access_token_calls.do("access_token", renew)
+
+    async def _request_access_token(self) -> str:
+        api_token = self._get_auth_api_token()
+        try:
+            client = await self._get_client()
+            response = await client.post(
+                self._get_auth_url(),
+                headers={
+                    "x-api-token": api_token,
+                },
+            )
+
+            if not response.is_success:
+                raise ValueError(f"HTTP error! status: {response.status_code}")
+
+            data = response.json()
+            self.access_token = data["access_token"]
+            if not self.access_token:
+                raise ValueError("No access token received from server")
+
+            return self.access_token
+
+        except Exception as error:
+            raise ValueError(f"Authentication failed: {str(error)}")
+
+    async def _ensure_access_token(self) -> None:
+        """
+        Get an access token if there is no valid one. A token about to expire
+        is refreshed in a background task, so requests don't wait for it.
+        """
+        access_token = self.access_token
+        if not access_token or self._is_access_token_expired(access_token):
+            await self._renew_access_token(access_token)
+        elif self._should_refresh_access_token() and (
+            self._token_refresh_task is None or self._token_refresh_task.done()
+        ):
+            self._token_refresh_task = asyncio.create_task(self._refresh_access_token())
+
+    async def _refresh_access_token(self) -> None:
+        try:
+            await self._get_access_token()
+        except Exception:
+            pass  # The current token is still valid: retried on next request
+
+    async def _send(
+        self, method: str, endpoint: str, options: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Send an authenticated request, returning the raw response. Failed
+        requests are retried as allowed by the retry_policy.
+        """
+        import httpx
+
+        if options is None:
+            options = {}
+
+        endpoint = endpoint.lstrip("/")
+        endpoint_class = self._get_endpoint_class(endpoint)
+        idempotent = self._is_idempotent_request(method, options)
+        retries = auth_retries = 0
+        while True:
+            await self._ensure_access_token()
+            access_token = self.access_token
+            probe = self._acquire_circuit(endpoint_class)
+            try:
+                client = await self._get_client()
+                async with self._limit_async_request(endpoint_class):
+                    response = await client.request(
+                        method,
+                        self._get_url(endpoint),
+                        **self._build_request_kwargs(options, access_token),
+                    )
+            except httpx.TransportError as error:
+                self._record_circuit(
+                    endpoint_class,
+                    None
+                    if isinstance(error, httpx.ReadTimeout)
+                    and self._is_sync_execution(endpoint)
+                    else True,
+                    probe,
+                )
+                connect_error = isinstance(
+                    error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+                )
+                delay = self._get_error_retry_delay(
+                    retries, idempotent, connect_error, options
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                self._record_circuit(endpoint_class, None, probe)
+                raise
+            else:
+                self._record_circuit(
+                    endpoint_class, self._is_api_failure(response), probe
+                )
+                if response.status_code == 401 and self._can_retry_auth(
+                    auth_retries, options
+                ):
+                    await self._renew_access_token(access_token)
+                    auth_retries += 1
+                    continue
+                self._throttle_requests(endpoint_class, response)
+                delay = self._get_response_retry_delay(
+                    response, retries, idempotent, options
+                )
+                if delay is None:
+                    return response
+
+            retries += 1
+            await asyncio.sleep(delay)
+
+    async def _request(
+        self, method: str, endpoint: str, options: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        response = await self._send(method, endpoint, options)
+
+        if not response.is_success:
+            raise YepCodeApiError(
+                f"HTTP error {response.status_code} in endpoint {method} {endpoint.lstrip('/')}: {self._get_response_error_message(response)}",
+                response.status_code,
+                retry_after=self._get_retry_after(response),
+            )
+
+        return self._get_response_body(response)
+
+    async def create_process(self, data: CreateProcessInput) -> Process:
+        return await self._request("POST", "/processes", {"data": data})
+
+    async def get_process(self, id: str) -> Process:
+        return await self._request("GET", f"/processes/{id}")
+
+    async def update_process(
+        self, process_identifier: str, data: UpdateProcessInput
+    ) -> Process:
+        return await self._request(
+            "PATCH", f"/processes/{process_identifier}", {"data": data}
+        )
+
+    async def delete_process(self, process_identifier: str) -> None:
+        await self._request("DELETE", f"/processes/{process_identifier}")
+
+    async def get_process_versions(
+        self, process_id: str, params: Optional[Dict[str, Any]] = None
+    ) -> VersionedProcessesPaginatedResult:
+        return await self._request(
+            "GET", f"/processes/{process_id}/versions", {"params": params or {}}
+        )
+
+    async def publish_process_version(
+        self, process_id: str, data: PublishProcessInput
+    ) -> VersionedProcess:
+        return await self._request(
+            "POST", f"/processes/{process_id}/versions", {"data": data}
+        )
+
+    async def get_process_version_aliases(
+        self, process_id: str, params: Optional[Dict[str, Any]] = None
+    ) -> VersionedProcessAliasesPaginatedResult:
+        return await self._request(
+            "GET", f"/processes/{process_id}/aliases", {"params": params or {}}
+        )
+
+    async def create_process_version_alias(
+        self, process_id: str, data: VersionedProcessAliasInput
+    ) -> VersionedProcessAlias:
+        return await self._request("POST", f"/processes/{process_id}/aliases", {"data": data})
+
+    async def get_processes(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> ProcessesPaginatedResult:
+        return await self._request("GET", "/processes", {"params": params or {}})
+
+    async def execute_process_async(
+        self,
+        process_id_or_slug: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> ExecutionId:
+        return await self._request(
+            "POST",
+            f"/processes/{process_id_or_slug}/execute",
+            self._build_execute_request(parameters, options),
+        )
+
+    async def execute_process_sync(
+        self,
+        process_id_or_slug: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        return await self._request(
+            "POST",
+            f"/processes/{process_id_or_slug}/execute-sync",
+            self._build_execute_request(parameters, options),
+        )
+
+    async def execute_process_sync_response(
+        self,
+        process_id_or_slug: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        response = await self._send(
+            "POST",
+            f"/processes/{process_id_or_slug}/execute-sync",
+            {**self._build_execute_request(parameters, options), "timeout": timeout},
+        )
+        return self._build_sync_execution_response(
+            response.status_code, response.headers, self._get_response_body(response)
+        )
+
+    async def create_schedule(
+        self, process_id_or_slug: str, data: ScheduledProcessInput
+    ) -> Schedule:
+        return await self._request(
+            "POST", f"/processes/{process_id_or_slug}/schedule", {"data": data}
+        )
+
+    async def get_executions(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> ExecutionsPaginatedResult:
+        return await self._request(
+            "GET",
+            "/executions",
+            {"params": self._sanitize_executions_params(params)},
+        )
+
+    async def get_execution(self, id: str) -> Execution:
+        return await self._request("GET", f"/executions/{id}")
+
+    async def get_execution_logs(
+        self, id: str, params: Optional[Dict[str, Any]] = None
+    ) -> ExecutionLogsPaginatedResult:
+        return await self._request("GET", f"/executions/{id}/logs", {"params": params or {}})
+
+    async def rerun_execution(self, id: str) -> str:
+        response = await self._request("POST", f"/executions/{id}/rerun")
+        return response["executionId"]
+
+    async def kill_execution(self, id: str) -> None:
+        await self._request("PUT", f"/executions/{id}/kill")
+
+    async def get_schedules(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> SchedulesPaginatedResult:
+        return await self._request("GET", "/schedules", {"params": params or {}})
+
+    async def get_schedule(self, id: str) -> Schedule:
+        return await self._request("GET", f"/schedules/{id}")
+
+    async def delete_schedule(self, id: str) -> None:
+        await self._request("DELETE", f"/schedules/{id}")
+
+    async def pause_schedule(self, id: str) -> None:
+        await self._request("PUT", f"/schedules/{id}/pause")
+
+    async def resume_schedule(self, id: str) -> None:
+        await self._request("PUT", f"/schedules/{id}/resume")
+
+    async def get_variables(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> TeamVariablesPaginatedResult:
+        return await self._request("GET", "/variables", {"params": params or {}})
+
+    async def create_variable(self, data: CreateTeamVariableInput) -> TeamVariable:
+        return await self._request("POST", "/variables", {"data": data})
+
+    async def update_variable(self, id: str, data: UpdateTeamVariableInput) -> TeamVariable:
+        return await self._request("PATCH", f"/variables/{id}", {"data": data})
+
+    async def delete_variable(self, id: str) -> None:
+        await self._request("DELETE", f"/variables/{id}")
+
+    async def get_modules(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> ModulesPaginatedResult:
+        return await self._request("GET", "/modules", {"params": params or {}})
+
+    async def create_module(self, data: CreateModuleInput) -> Module:
+        return await self._request("POST", "/modules", {"data": data})
+
+    async def get_module(self, id: str) -> Module:
+        return await self._request("GET", f"/modules/{id}")
+
+    async def update_module(self, id: str, data: UpdateModuleInput) -> Module:
+        return await self._request("PATCH", f"/modules/{id}", {"data": data})
+
+    async def delete_module(self, id: str) -> None:
+        await self._request("DELETE", f"/modules/{id}")
+
+    async def get_module_versions(
+        self, module_id: str, params: Optional[Dict[str, Any]] = None
+    ) -> VersionedModulesPaginatedResult:
+        return await self._request(
+            "GET", f"/modules/{module_id}/versions", {"params": params or {}}
+        )
+
+    async def publish_module_version(
+        self, module_id: str, data: PublishModuleInput
+    ) -> VersionedModule:
+        return await self._request("POST", f"/modules/{module_id}/versions", {"data": data})
+
+    async def get_module_version_aliases(
+        self, module_id: str, params: Optional[Dict[str, Any]] = None
+    ) -> VersionedModuleAliasesPaginatedResult:
+        return await self._request(
+            "GET", f"/modules/{module_id}/aliases", {"params": params or {}}
+        )
+
+    async def create_module_version_alias(
+        self, module_id: str, data: VersionedModuleAliasInput
+    ) -> VersionedModuleAlias:
+        return await self._request("POST", f"/modules/{module_id}/aliases", {"data": data})
+
+    async def get_module_version(self, module_id: str, version_id: str) -> VersionedModule:
+        return await self._request("GET", f"/modules/{module_id}/versions/{version_id}")
+
+    async def delete_module_version(self, module_id: str, version_id: str) -> None:
+        await self._request("DELETE", f"/modules/{module_id}/versions/{version_id}")
+
+    async def get_module_version_alias(
+        self, module_id: str, alias_id: str
+    ) -> VersionedModuleAlias:
+        return await self._request("GET", f"/modules/{module_id}/aliases/{alias_id}")
+
+    async def update_module_version_alias(
+        self, module_id: str, alias_id: str, data: VersionedModuleAliasInput
+    ) -> VersionedModuleAlias:
+        return await self._request(
+            "PATCH", f"/modules/{module_id}/aliases/{alias_id}", {"data": data}
+        )
+
+    async def delete_module_version_alias(self, module_id: str, alias_id: str) -> None:
+        await self._request("DELETE", f"/modules/{module_id}/aliases/{alias_id}")
+
+    async def get_process_version(
+        self, process_id: str, version_id: str
+    ) -> VersionedProcess:
+        return await self._request("GET", f"/processes/{process_id}/versions/{version_id}")
+
+    async def delete_process_version(self, process_id: str, version_id: str) -> None:
+        await self._request("DELETE", f"/processes/{process_id}/versions/{version_id}")
+
+    async def get_process_version_alias(
+        self, process_id: str, alias_id: str
+    ) -> VersionedProcessAlias:
+        return await self._request("GET", f"/processes/{process_id}/aliases/{alias_id}")
+
+    async def update_process_version_alias(
+        self, process_id: str, alias_id: str, data: VersionedProcessAliasInput
+    ) -> VersionedProcessAlias:
+        return await self._request(
+            "PATCH", f"/processes/{process_id}/aliases/{alias_id}", {"data": data}
+        )
+
+    async def delete_process_version_alias(self, process_id: str, alias_id: str) -> None:
+        await self._request("DELETE", f"/processes/{process_id}/aliases/{alias_id}")
+
+    async def update_schedule(self, id: str, data: ScheduledProcessInput) -> Schedule:
+        return await self._request("PATCH", f"/schedules/{id}", {"data": data})
+
+    async def get_team_dependencies(
+        self, language: ProgrammingLanguage
+    ) -> ProgrammingLanguageManifest:
+        return await self._request("GET", f"/dependencies/{language.value}")
+
+    async def update_team_dependencies(
+        self, language: ProgrammingLanguage, data: UpdateTeamDependenciesInput
+    ) -> ProgrammingLanguageManifest:
+        return await self._request(
+            "PUT", f"/dependencies/{language.value}", {"data": data}
+        )
+
+    async def install_team_dependencies(
+        self, language: ProgrammingLanguage
+    ) -> ProgrammingLanguageManifest:
+        return await self._request("POST", f"/dependencies/{language.value}/install")
+
+    async def discard_team_dependencies_installation(
+        self, language: ProgrammingLanguage
+    ) -> None:
+        await self._request("DELETE", f"/dependencies/{language.value}/install")
+
+    async def get_team(self) -> Team:
+        return await self._request("GET", "/team")
+
+    async def update_team(self, data: UpdateTeamInput) -> Team:
+        return await self._request("PATCH", "/team", {"data": data})
+
+    async def create_sandbox(self, data: CreateSandboxInput) -> Sandbox:
+        return await self._request("POST", "/sandboxes", {"data": data})
+
+    async def update_sandbox(self, sandbox_id: str, data: UpdateSandboxInput) -> Sandbox:
+        return await self._request("POST", f"/sandboxes/{sandbox_id}", {"data": data})
+
+    async def kill_sandbox(self, sandbox_id: str) -> None:
+        await self._request("POST", f"/sandboxes/{sandbox_id}/kill")
+
+    async def get_objects(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> List[StorageObject]:
+        response = await self._request(
+            "GET", "/storage/objects", {"params": params or {}}
+        )
+        return [StorageObject.from_dict(obj) for obj in response]
+
+    async def get_object(self, name: str):
+        response = await self._send("GET", f"/storage/objects/{name}")
+        response.raise_for_status()
+        return response
+
+    async def create_object(self, data: CreateStorageObjectInput) -> StorageObject:
+        request = self._build_create_object_request(data)
+        response = await self._request("POST", request.pop("endpoint"), request)
+        return StorageObject.from_dict(response)
+
+    async def delete_object(self, name: str) -> None:
+        await self._request("DELETE", f"/storage/objects/{quote(name)}")
+
+    async def create_signed_url(self, data: CreateSignedUrlInput) -> SignedUrl:
+        response = await self._request(
+            "POST", "/storage/signed-urls", {"data": self._build_signed_url_body(data)}
+        )
+        return SignedUrl.from_dict(response)
@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Optional, Set, Tuple
+
+from .types import EndpointClass, YepCodeApiConfig
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class Circuit:
+    """Failure tracking and state of the requests to one endpoint class."""
+
+    def __init__(
+        self,
+        failure_rate: float,
+        min_requests: int,
+        window: float,
+        reset_timeout: float,
+        half_open_probes: int,
+    ):
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        # Tokens of the probe requests in flight while half-open
+        self._probes: Set[int] = set()
+        self._last_probe = 0
+        # (timestamp, failed) of the requests within the window
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def _update_state(self) -> None:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes.clear()
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probes.clear()
+        self._outcomes.clear()
+        self._failures = 0
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def acquire(self) -> Tuple[Optional[float], Optional[int]]:
+        """
+        Register a request about to be sent. Returns a (retry_after, probe)
+        tuple: retry_after is None if it can be sent, or the seconds until
+        the circuit lets probe requests through. probe is the token of a
+        request sent as a probe while half-open, to pass to record().
+        """
+        with self._lock:
+            self._update_state()
+            if self._state is CircuitState.OPEN:
+                retry_after = self._opened_at + self.reset_timeout - time.monotonic()
+                return max(0.0, retry_after), None
+            if self._state is CircuitState.HALF_OPEN:
+                if len(self._probes) >= self.half_open_probes:
+                    return 0.0, None
+                self._last_probe += 1
+                self._probes.add(self._last_probe)
+                return None, self._last_probe
+            return None, None
+
+    def record(self, failed: Optional[bool], probe: Optional[int] = None) -> None:
+        """
+        Record the outcome of a request registered with acquire(), with its
+        probe token if any. None releases a probe without judging the API,
+        ie: for client errors. Only probes close or reopen a half-open
+        circuit: requests admitted before it opened don't count.
+        """
+        with self._lock:
+            if probe is not None:
+                if probe not in self._probes:
+                    return  # The circuit changed state meanwhile
+                self._probes.discard(probe)
+                if failed:
+                    self._open()
+                elif failed is False:
+                    self._state = CircuitState.CLOSED
+                    self._probes.clear()
+                return
+            if failed is None or self._state is not CircuitState.CLOSED:
+                return
+
+            now = time.monotonic()
+            self._outcomes.append((now, failed))
+            self._failures += failed
+            self._prune(now)
+            if (
+                len(self._outcomes) >= self.min_requests
+                and self._failures / len(self._outcomes) >= self.failure_rate
+            ):
+                self._open()
+
+    def get_failure_rate(self) -> float:
+        with self._lock:
+            self._prune(time.monotonic())
+            return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the API is degraded, instead of making every caller wait
+    for its requests to time out.
+
+    Requests are tracked per endpoint class. Once at least min_requests
+    were sent to a class within the last window seconds and failure_rate of
+    them failed (network errors and 502/503/504 responses), its circuit
+    opens and its requests fail right away. After reset_timeout seconds it
+    half-opens, letting half_open_probes requests through: the circuit
+    closes if they succeed and opens again if they fail.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: float = 30.0,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        """
+        Args:
+            failure_rate: Fraction of failed requests opening the circuit
+            min_requests: Requests within the window needed to open it
+            window: Seconds of requests considered
+            reset_timeout: Seconds the circuit stays open before probing
+            half_open_probes: Concurrent probe requests while half-open
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be within (0, 1]")
+        if min_requests < 1 or half_open_probes < 1:
+            raise ValueError("min_requests and half_open_probes must be positive")
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._circuits: Dict[EndpointClass, Circuit] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: YepCodeApiConfig) -> Optional["CircuitBreaker"]:
+        if config.circuit_breaker is False:
+            return None
+        kwargs = {
+            "failure_rate": config.circuit_failure_rate,
+            "reset_timeout": config.circuit_reset_timeout,
+        }
+        return cls(**{k: v for k, v in kwargs.items() if v is not None})
+
+    def get_circuit(self, endpoint_class: EndpointClass) -> Circuit:
+        with self._lock:
+            if endpoint_class not in self._circuits:
+                self._circuits[endpoint_class] = Circuit(
+                    self.failure_rate,
+                    self.min_requests,
+                    self.window,
+                    self.reset_timeout,
+                    self.half_open_probes,
+                )
+            return self._circuits[endpoint_class]
+
+    def get_state(self, endpoint_class: EndpointClass) -> CircuitState:
+        return self.get_circuit(endpoint_class).state
+
+    def get_states(self) -> Dict[str, str]:
+        """State of every endpoint class, ie: for health checks."""
+        return {
+            endpoint_class.value: self.get_state(endpoint_class).value
+            for endpoint_class in EndpointClass
+        }
+
+    def is_healthy(self) -> bool:
+        """Whether no circuit is open."""
+        return all(
+            self.get_state(endpoint_class) is not CircuitState.OPEN
+            for endpoint_class in EndpointClass
+        )
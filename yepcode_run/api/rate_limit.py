@@ -0,0 +1,155 @@
+import asyncio
+import math
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional, Union
+
+from .types import EndpointClass, RateLimit
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Callers reserve a token and wait the returned
+    delay, so concurrent callers are served in order at the given rate.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens, a second worth of them by default
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst or max(1, math.ceil(rate))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token, returning the seconds to wait before using it."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Don't hand out usable tokens for the next seconds."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimiter:
+    """
+    Client-side rate and concurrency limits of the requests sent to the API,
+    per endpoint class.
+
+    Requests to an endpoint class with a ``rate`` wait for a token of its
+    bucket, and those with a ``max_in_flight`` wait for a free slot. Buckets
+    are shared by every thread and event loop using the limiter, while
+    in-flight slots are counted separately for threads and for each event
+    loop, as their requests can't wait on each other.
+    """
+
+    def __init__(self, limits: Dict[Union[str, EndpointClass], RateLimit]):
+        """
+        Args:
+            limits: Limits of each endpoint class, by class or class name.
+                Requests to classes without limits aren't limited
+        """
+        self.limits: Dict[EndpointClass, RateLimit] = {
+            EndpointClass(endpoint_class): limit
+            for endpoint_class, limit in limits.items()
+        }
+        self._buckets = {
+            endpoint_class: TokenBucket(limit.rate, limit.burst)
+            for endpoint_class, limit in self.limits.items()
+            if limit.rate
+        }
+        self._semaphores = {
+            endpoint_class: threading.BoundedSemaphore(limit.max_in_flight)
+            for endpoint_class, limit in self.limits.items()
+            if limit.max_in_flight
+        }
+        # Semaphores of each event loop, by endpoint class
+        self._async_semaphores = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_option(
+        option: Union["RateLimiter", Dict[str, RateLimit], None],
+    ) -> Optional["RateLimiter"]:
+        if not option:
+            return None
+        if isinstance(option, RateLimiter):
+            return option
+        return RateLimiter(option)
+
+    def _reserve(self, endpoint_class: EndpointClass) -> float:
+        bucket = self._buckets.get(endpoint_class)
+        return bucket.reserve() if bucket else 0.0
+
+    def throttle(self, endpoint_class: EndpointClass, seconds: float) -> None:
+        """
+        Hold the requests to endpoint_class for the given seconds, ie: when
+        the API answered with a 429 and a Retry-After.
+        """
+        bucket = self._buckets.get(endpoint_class)
+        if bucket and seconds > 0:
+            bucket.pause(seconds)
+
+    @contextmanager
+    def limit(self, endpoint_class: EndpointClass) -> Iterator[None]:
+        """Wait until a request to endpoint_class can be sent, blocking."""
+        # Wait for the rate token first, so the requests waiting for it
+        # don't hold in-flight slots
+        delay = self._reserve(endpoint_class)
+        if delay:
+            time.sleep(delay)
+        semaphore = self._semaphores.get(endpoint_class)
+        if semaphore:
+            semaphore.acquire()
+        try:
+            yield
+        finally:
+            if semaphore:
+                semaphore.release()
+
+    def _get_async_semaphore(
+        self, endpoint_class: EndpointClass
+    ) -> Optional[asyncio.Semaphore]:
+        limit = self.limits.get(endpoint_class)
+        if not limit or not limit.max_in_flight:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._async_semaphores.setdefault(loop, {})
+            if endpoint_class not in semaphores:
+                semaphores[endpoint_class] = asyncio.Semaphore(limit.max_in_flight)
+            return semaphores[endpoint_class]
+
+    @asynccontextmanager
+    async def limit_async(self, endpoint_class: EndpointClass) -> AsyncIterator[None]:
+        """Wait until a request to endpoint_class can be sent, asynchronously."""
+        delay = self._reserve(endpoint_class)
+        if delay:
+            await asyncio.sleep(delay)
+        semaphore = self._get_async_semaphore(endpoint_class)
+        if semaphore:
+            await semaphore.acquire()
+        try:
+            yield
+        finally:
+            if semaphore:
+                semaphore.release()
@@ -0,0 +1,94 @@
+import random
+from typing import Iterable, Optional
+
+from .types import YepCodeApiConfig
+
+
+class RetryPolicy:
+    """
+    Decides which failed API requests are retried and how long to wait.
+
+    Requests failing with a transient status (429, 502, 503, 504) or a
+    network error are retried up to max_retries times, with an exponential
+    backoff spread by +/- jitter and never shorter than the Retry-After
+    asked by the API. A Retry-After longer than max_backoff isn't waited
+    for: the error is raised, with its retry_after, right away.
+
+    Only idempotent requests (GET, PUT, DELETE...) are retried after they
+    may have reached the API. Others, like POST execute, are only retried
+    when the API rejected them with a 429 or no connection could be opened.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    # Statuses meaning the request was rejected before being processed
+    REJECTED_STATUSES = frozenset({429})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        jitter: float = 0.2,
+        retry_statuses: Optional[Iterable[int]] = None,
+        max_auth_retries: int = 1,
+    ):
+        """
+        Args:
+            max_retries: Maximum number of retries of a request
+            backoff: Seconds to wait before the first retry, doubled on
+                each following one
+            max_backoff: Longest wait before a retry, in seconds
+            jitter: Fraction of the wait randomly added or removed
+            retry_statuses: Response statuses to retry
+            max_auth_retries: Times a request rejected with 401 is retried
+                with a new access token
+        """
+        if max_retries < 0 or max_auth_retries < 0:
+            raise ValueError("max_retries and max_auth_retries can't be negative")
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = (
+            frozenset(retry_statuses)
+            if retry_statuses is not None
+            else self.RETRY_STATUSES
+        )
+        self.max_auth_retries = max_auth_retries
+
+    @classmethod
+    def from_config(cls, config: Optional[YepCodeApiConfig]) -> "RetryPolicy":
+        kwargs = {
+            "max_retries": config.max_retries if config else None,
+            "backoff": config.retry_backoff if config else None,
+            "max_backoff": config.retry_max_backoff if config else None,
+        }
+        return cls(**{k: v for k, v in kwargs.items() if v is not None})
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def should_retry_status(self, status: int, retries: int, idempotent: bool) -> bool:
+        """Whether to retry a request answered with status after retries retries."""
+        if retries >= self.max_retries or status not in self.retry_statuses:
+            return False
+        return idempotent or status in self.REJECTED_STATUSES
+
+    def should_retry_error(self, retries: int, idempotent: bool, connect_error: bool) -> bool:
+        """
+        Whether to retry a request failed with a network error. connect_error
+        tells whether it failed before a connection was established.
+        """
+        return retries < self.max_retries and (idempotent or connect_error)
+
+    def get_delay(self, retries: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to wait before the retry number retries + 1, or None if the
+        API asks to wait longer than max_backoff.
+        """
+        if retry_after is not None and retry_after > self.max_backoff:
+            return None
+        delay = min(self.backoff * 2**retries, self.max_backoff)
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(delay, retry_after or 0.0)
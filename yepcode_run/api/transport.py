@@ -0,0 +1,79 @@
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class YepCodeHttpTransport:
+    """
+    Pooled HTTP transport used by YepCodeApi.
+
+    Wraps a requests.Session so that connections to the API host are kept
+    alive and reused between calls instead of paying a new TCP+TLS handshake
+    on every request. A single transport can be shared by several YepCodeApi
+    instances.
+    """
+
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        """
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept per host
+            pool_block: Whether to block when no free connection is available
+                for a host instead of opening an extra, non-pooled one
+            keep_alive: Whether to keep connections open between requests
+        """
+        self.pool_connections = pool_connections or self.DEFAULT_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or self.DEFAULT_POOL_MAXSIZE
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self._closed:
+            raise RuntimeError("Transport has been closed")
+        return self._session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Close every pooled connection. The transport can't be used afterwards."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._session.close()
+
+    def __enter__(self) -> "YepCodeHttpTransport":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -18,6 +18,25 @@ class ExecutionStatus(Enum):
     ERROR = "ERROR"
 
 
+class EndpointClass(Enum):
+    """Families of API endpoints, limited independently from each other."""
+
+    EXECUTE = "execute"
+    POLLING = "polling"
+    LOGS = "logs"
+    STORAGE = "storage"
+    OTHER = "other"
+
+
+@dataclass
+class RateLimit:
+    # Sustained requests per second, and how many can be sent at once
+    rate: Optional[float] = None
+    burst: Optional[int] = None
+    # Maximum number of concurrent requests
+    max_in_flight: Optional[int] = None
+
+
 @dataclass
 class YepCodeApiConfig:
     api_host: Optional[str] = None
@@ -27,6 +46,25 @@ class YepCodeApiConfig:
     client_id: Optional[str] = None
     client_secret: Optional[str] = None
     team_id: Optional[str] = None
+    # HTTP connection pooling
+    pool_connections: Optional[int] = None
+    pool_maxsize: Optional[int] = None
+    pool_block: Optional[bool] = None
+    keep_alive: Optional[bool] = None
+    # Seconds before its expiry the access token is refreshed in background
+    token_refresh_skew: Optional[float] = None
+    # Retries of failed requests
+    max_retries: Optional[int] = None
+    retry_backoff: Optional[float] = None
+    retry_max_backoff: Optional[float] = None
+    # Client-side limits per endpoint class ("execute", "polling", "logs",
+    # "storage" and "other"), shared by every API instance of the team
+    rate_limits: Optional[Dict[str, RateLimit]] = None
+    # Fail fast while the API is degraded. Set circuit_breaker to False to
+    # disable it
+    circuit_breaker: Optional[bool] = None
+    circuit_failure_rate: Optional[float] = None
+    circuit_reset_timeout: Optional[float] = None
 
 
 @dataclass
@@ -1,14 +1,20 @@
 import base64
 import json
-from typing import Optional, Dict, Any, List, Union
+import threading
+import time
+from contextlib import nullcontext
+from typing import Optional, Dict, Any, List, Union, Tuple
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import requests
-from urllib.parse import urljoin
+from urllib3.exceptions import NewConnectionError
+from urllib.parse import urljoin, quote
 import mimetypes
 import re
 
 from .types import (
     YepCodeApiConfig,
+    EndpointClass,
     Process,
     Execution,
     ExecutionId,
@@ -53,18 +59,62 @@ from .types import (
     CreateSandboxInput,
     UpdateSandboxInput,
 )
+from .circuit_breaker import CircuitBreaker
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .transport import YepCodeHttpTransport
+from ..utils.single_flight import SingleFlight
 
 
 class YepCodeApiError(Exception):
-    def __init__(self, message: str, status: int):
+    def __init__(self, message: str, status: int, retry_after: Optional[float] = None):
         super().__init__(message)
         self.status = status
+        # Seconds to wait before retrying, from the Retry-After header
+        self.retry_after = retry_after
         self.name = "YepCodeApiError"
 
 
-class YepCodeApi:
-    def __init__(self, config: YepCodeApiConfig = None):
+class YepCodeCircuitOpenError(YepCodeApiError):
+    """
+    Raised without sending the request while the circuit breaker considers
+    its endpoint class degraded. retry_after tells the seconds until probe
+    requests are let through again.
+    """
+
+    def __init__(self, endpoint_class: EndpointClass, retry_after: float):
+        super().__init__(
+            f"The YepCode API is failing for {endpoint_class.value} requests: "
+            f"failing fast for {retry_after:.1f}s",
+            503,
+            retry_after=retry_after,
+        )
+        self.endpoint_class = endpoint_class
+        self.name = "YepCodeCircuitOpenError"
+
+
+class BaseYepCodeApi:
+    """
+    Configuration and request building logic shared by the blocking
+    YepCodeApi and the asyncio based AsyncYepCodeApi.
+    """
+
+    # Response header identifying the execution of execute-sync calls. The
+    # "executionId" of error response bodies is used when it's missing
+    EXECUTION_ID_HEADER = "Yep-Execution-Id"
+
+    def __init__(
+        self,
+        config: YepCodeApiConfig = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
         config = config or YepCodeApiConfig()
+        self._config = config
+        self.retry_policy = retry_policy or RetryPolicy.from_config(config)
+        self.rate_limiter = rate_limiter or RateLimiter.from_option(config.rate_limits)
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.from_config(config)
         config_dict = (
             {k: v for k, v in config.__dict__.items() if v is not None}
             if config
@@ -73,6 +123,7 @@ class YepCodeApi:
         final_config = {
             "api_host": "https://cloud.yepcode.io",
             "timeout": 60000,
+            "token_refresh_skew": 60.0,
             **config_dict,
         }
 
@@ -120,6 +171,9 @@ class YepCodeApi:
         self.team_id = final_config.get("team_id")
         self.access_token = final_config.get("access_token")
         self.timeout = final_config.get("timeout")
+        self.token_refresh_skew = final_config.get("token_refresh_skew")
+        # Expiry of the last access token checked, parsed once per token
+        self._access_token_expiry: Tuple[Optional[str], Optional[float]] = (None, None)
         if not self.client_id and self.access_token:
             self.client_id = self._client_id_from_access_token()
         if not self.team_id and self.client_id:
@@ -166,105 +220,275 @@ class YepCodeApi:
     def _get_auth_url(self) -> str:
         return f"{self._get_base_url()}/auth/token"
 
-    def _get_access_token(self) -> str:
+    def _get_auth_api_token(self) -> str:
         if not self.api_token and (not self.client_id or not self.client_secret):
             raise ValueError(
                 "AccessToken has expired. Provide a new one or enable automatic refreshing by providing an apiToken or clientId and clientSecret."
             )
-        try:
-            credentials = f"{self.client_id}:{self.client_secret}"
-            api_token = (
-                self.api_token
-                or f"sk-{base64.b64encode(credentials.encode()).decode()}"
-            )
-
-            response = requests.post(
-                self._get_auth_url(),
-                headers={
-                    "x-api-token": api_token,
-                },
-                timeout=self.timeout,
-            )
-
-            if not response.ok:
-                raise ValueError(f"HTTP error! status: {response.status_code}")
-
-            data = response.json()
-            self.access_token = data["access_token"]
-            if not self.access_token:
-                raise ValueError("No access token received from server")
+        credentials = f"{self.client_id}:{self.client_secret}"
+        return (
+            self.api_token or f"sk-{base64.b64encode(credentials.encode()).decode()}"
+        )
 
-            return self.access_token
-
-        except Exception as error:
-            raise ValueError(f"Authentication failed: {str(error)}")
-
-    def _is_access_token_expired(self, access_token: str) -> bool:
-        token_payload = access_token.split(".")[1]
-        if not token_payload:
-            return True
+    def _can_refresh_access_token(self) -> bool:
+        return bool(self.api_token or (self.client_id and self.client_secret))
 
+    @staticmethod
+    def _parse_access_token_expiry(access_token: str) -> Optional[float]:
+        """
+        Expiration timestamp of a JWT access token, None if it has none or
+        it can't be read. Such tokens are neither renewed nor refreshed ahead
+        of time: they are used until the API rejects them with a 401.
+        """
         try:
+            token_payload = access_token.split(".")[1]
             token_payload += "=" * ((4 - len(token_payload) % 4) % 4)
-            decoded_token_payload = json.loads(base64.b64decode(token_payload).decode())
-            expiration_time = decoded_token_payload["exp"]
-            return (
-                expiration_time is not None
-                and expiration_time < datetime.now(timezone.utc).timestamp()
+            decoded_token_payload = json.loads(
+                base64.urlsafe_b64decode(token_payload).decode()
             )
-        except Exception as e:
-            return True
+            return decoded_token_payload.get("exp")
+        except Exception:
+            return None
 
-    def _request(
-        self, method: str, endpoint: str, options: Optional[Dict[str, Any]] = None
-    ) -> Any:
-        if options is None:
-            options = {}
+    def _get_access_token_expiry(self, access_token: str) -> Optional[float]:
+        token, expiry = self._access_token_expiry
+        if token != access_token:
+            expiry = self._parse_access_token_expiry(access_token)
+            self._access_token_expiry = (access_token, expiry)
+        return expiry
 
-        if not self.access_token or self._is_access_token_expired(self.access_token):
-            self._get_access_token()
+    def _is_access_token_expired(self, access_token: str) -> bool:
+        expiry = self._get_access_token_expiry(access_token)
+        return expiry is not None and expiry < time.time()
+
+    def _has_replaced_access_token(self, access_token: Optional[str]) -> bool:
+        """
+        Whether the current access token is a valid one other than
+        access_token, ie: it has been renewed since access_token was read.
+        """
+        return (
+            bool(self.access_token)
+            and self.access_token != access_token
+            and not self._is_access_token_expired(self.access_token)
+        )
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-            **(options.get("headers", {})),
-        }
+    def _should_refresh_access_token(self) -> bool:
+        """
+        Whether the access token, still valid, expires within
+        token_refresh_skew seconds and can be refreshed ahead of time.
+        """
+        expiry = self._get_access_token_expiry(self.access_token)
+        return (
+            expiry is not None
+            and expiry - self.token_refresh_skew < time.time()
+            and self._can_refresh_access_token()
+        )
 
-        endpoint = endpoint.lstrip("/")
-        url = urljoin(f"{self._get_base_url()}/", endpoint)
-        request_kwargs = {"headers": headers, "timeout": self.timeout / 1000}
+    def _build_request_kwargs(
+        self, options: Dict[str, Any], access_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        headers = {"Authorization": f"Bearer {access_token or self.access_token}"}
+        # Multipart uploads set their own content type
+        if not options.get("files"):
+            headers["Content-Type"] = "application/json"
+        headers.update(options.get("headers", {}))
+        timeout = options.get("timeout") or self.timeout
+        request_kwargs = {"headers": headers, "timeout": timeout / 1000}
 
         if data := options.get("data"):
             request_kwargs["json"] = data
 
+        if files := options.get("files"):
+            request_kwargs["files"] = files
+
+        if options.get("stream"):
+            request_kwargs["stream"] = True
+
         if params := options.get("params"):
             request_kwargs["params"] = {
                 k: str(v) for k, v in params.items() if v is not None
             }
+        return request_kwargs
 
-        response = requests.request(method, url, **request_kwargs)
+    @staticmethod
+    def _get_endpoint_class(endpoint: str) -> EndpointClass:
+        path = endpoint.lstrip("/").split("?")[0]
+        if path.startswith("storage/"):
+            return EndpointClass.STORAGE
+        if re.match(r"^(processes/[^/]+/execute(-sync)?|executions/[^/]+/rerun)$", path):
+            return EndpointClass.EXECUTE
+        if re.match(r"^executions/[^/]+/logs$", path):
+            return EndpointClass.LOGS
+        if re.match(r"^executions(/[^/]+)?$", path):
+            return EndpointClass.POLLING
+        return EndpointClass.OTHER
+
+    def _limit_request(self, endpoint_class: EndpointClass):
+        """Context manager waiting until a request can be sent (blocking)."""
+        if not self.rate_limiter:
+            return nullcontext()
+        return self.rate_limiter.limit(endpoint_class)
+
+    def _limit_async_request(self, endpoint_class: EndpointClass):
+        """Async context manager waiting until a request can be sent."""
+        if not self.rate_limiter:
+            return nullcontext()
+        return self.rate_limiter.limit_async(endpoint_class)
+
+    def _throttle_requests(self, endpoint_class: EndpointClass, response: Any) -> None:
+        """Hold back the requests to an endpoint class throttled by the API."""
+        if self.rate_limiter and response.status_code == 429:
+            self.rate_limiter.throttle(
+                endpoint_class, self._get_retry_after(response) or 0.0
+            )
 
-        if response.status_code == 401:
-            self._get_access_token()
-            return self._request(method, endpoint, options)
+    def _acquire_circuit(self, endpoint_class: EndpointClass) -> Optional[int]:
+        """
+        Raise YepCodeCircuitOpenError if requests to endpoint_class must fail
+        fast. Returns the probe token of the request, if it's a probe.
+        """
+        if not self.circuit_breaker:
+            return None
+        retry_after, probe = self.circuit_breaker.get_circuit(endpoint_class).acquire()
+        if retry_after is not None:
+            raise YepCodeCircuitOpenError(endpoint_class, retry_after)
+        return probe
 
-        if not response.ok:
-            try:
-                error_response = response.json()
-                message = error_response.get("message", response.reason)
-            except ValueError:
-                message = response.reason
+    def _record_circuit(
+        self,
+        endpoint_class: EndpointClass,
+        failed: Optional[bool],
+        probe: Optional[int] = None,
+    ) -> None:
+        if self.circuit_breaker:
+            self.circuit_breaker.get_circuit(endpoint_class).record(failed, probe)
+
+    @classmethod
+    def _is_api_failure(cls, response: Any) -> bool:
+        """
+        Whether a response tells the API is degraded, rather than the request
+        or the execution failed (ie: a 504 timeout of an execute-sync call).
+        """
+        return response.status_code in (502, 503, 504) and not response.headers.get(
+            cls.EXECUTION_ID_HEADER
+        )
 
-            raise YepCodeApiError(
-                f"HTTP error {response.status_code} in endpoint {method} {endpoint}: {message}",
-                response.status_code,
-            )
+    @staticmethod
+    def _is_sync_execution(endpoint: str) -> bool:
+        """
+        Whether endpoint runs an execution synchronously: its read timeouts
+        mean the execution is still running, not that the API is degraded.
+        """
+        path = endpoint.lstrip("/").split("?")[0]
+        return bool(re.match(r"^processes/[^/]+/execute-sync$", path))
+
+    def get_circuit_states(self) -> Dict[str, str]:
+        """
+        Circuit breaker state ("closed", "open" or "half_open") of every
+        endpoint class, ie: for health checks. Empty if it's disabled.
+        """
+        return self.circuit_breaker.get_states() if self.circuit_breaker else {}
+
+    def _is_idempotent_request(self, method: str, options: Dict[str, Any]) -> bool:
+        return options.get("idempotent", self.retry_policy.is_idempotent(method))
+
+    def _can_retry_auth(self, auth_retries: int, options: Dict[str, Any]) -> bool:
+        """Whether to retry a request rejected with 401 with a new access token."""
+        return (
+            options.get("retry", True)
+            and auth_retries < self.retry_policy.max_auth_retries
+        )
+
+    def _get_response_retry_delay(
+        self, response: Any, retries: int, idempotent: bool, options: Dict[str, Any]
+    ) -> Optional[float]:
+        """Seconds to wait before retrying a failed response, None to not retry it."""
+        if not options.get("retry", True) or not self.retry_policy.should_retry_status(
+            response.status_code, retries, idempotent
+        ):
+            return None
+        return self.retry_policy.get_delay(retries, self._get_retry_after(response))
 
+    def _get_error_retry_delay(
+        self,
+        retries: int,
+        idempotent: bool,
+        connect_error: bool,
+        options: Dict[str, Any],
+    ) -> Optional[float]:
+        """Seconds to wait before retrying a network error, None to not retry it."""
+        if not options.get("retry", True) or not self.retry_policy.should_retry_error(
+            retries, idempotent, connect_error
+        ):
+            return None
+        return self.retry_policy.get_delay(retries)
+
+    def _get_url(self, endpoint: str) -> str:
+        return urljoin(f"{self._get_base_url()}/", endpoint.lstrip("/"))
+
+    @staticmethod
+    def _get_response_error_message(response: Any) -> str:
+        reason = getattr(response, "reason", None) or getattr(
+            response, "reason_phrase", None
+        )
+        try:
+            error_response = response.json()
+            return error_response.get("message", reason)
+        except ValueError:
+            return reason
+
+    @staticmethod
+    def _build_execute_request(
+        parameters: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        headers = {}
+        if options and options.get("initiatedBy"):
+            headers["Yep-Initiated-By"] = options["initiatedBy"]
+
+        data = {
+            "parameters": json.dumps(parameters or {}),
+            "tag": options.get("tag") if options else None,
+            "comment": options.get("comment") if options else None,
+            "settings": options.get("settings") if options else None,
+        }
+        return {"data": data, "headers": headers}
+
+    @staticmethod
+    def _get_retry_after(response: Any) -> Optional[float]:
+        """Parse the Retry-After header, given in seconds or as an HTTP date."""
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def _get_response_body(response: Any) -> Any:
         try:
             return response.json()
         except ValueError:
             return response.text
 
+    @classmethod
+    def _build_sync_execution_response(
+        cls, status: int, headers: Any, data: Any
+    ) -> Dict[str, Any]:
+        execution_id = headers.get(cls.EXECUTION_ID_HEADER)
+        # Successful bodies are the return value, which can't be trusted for it
+        if not execution_id and status >= 400 and isinstance(data, dict):
+            execution_id = data.get("executionId")
+        return {"status": status, "executionId": execution_id, "data": data}
+
     @staticmethod
     def _sanitize_date_param(date: Union[datetime, str, None]) -> Optional[str]:
         if not date:
@@ -279,6 +503,242 @@ class YepCodeApi:
             )
         return date
 
+    @classmethod
+    def _sanitize_executions_params(
+        cls, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        if not params:
+            return {}
+        return {
+            **params,
+            "from": cls._sanitize_date_param(params.get("from")),
+            "to": cls._sanitize_date_param(params.get("to")),
+        }
+
+    @staticmethod
+    def _build_create_object_request(
+        data: CreateStorageObjectInput,
+    ) -> Dict[str, Any]:
+        if not data.file:
+            raise ValueError("File or stream is required")
+        # Detect content type
+        content_type, _ = mimetypes.guess_type(data.name)
+        return {
+            "endpoint": f"/storage/objects?name={quote(data.name)}",
+            "files": {
+                "file": (
+                    data.name,
+                    data.file,
+                    content_type or "application/octet-stream",
+                )
+            },
+            # Streams are consumed by the first attempt and can't be re-sent
+            "retry": isinstance(data.file, (bytes, str)),
+        }
+
+    @staticmethod
+    def _build_signed_url_body(data: CreateSignedUrlInput) -> Dict[str, Any]:
+        body: Dict[str, Any] = {"path": data.path}
+        if data.expires_in_seconds is not None:
+            body["expiresInSeconds"] = data.expires_in_seconds
+        return body
+
+
+class YepCodeApi(BaseYepCodeApi):
+    def __init__(
+        self,
+        config: YepCodeApiConfig = None,
+        transport: Optional[YepCodeHttpTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        super().__init__(config, retry_policy, rate_limiter, circuit_breaker)
+
+        # Transports provided from outside (ie: shared by YepCodeApiManager)
+        # are owned by the caller and are not closed by this instance
+        self._owns_transport = transport is None
+        self._transport = transport or self.create_transport(self._config)
+        self._token_refresh_lock = threading.Lock()
+        self._refreshing_token = False
+        self._access_token_calls = SingleFlight()
+
+    @staticmethod
+    def create_transport(config: YepCodeApiConfig) -> YepCodeHttpTransport:
+        return YepCodeHttpTransport(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=bool(config.pool_block),
+            keep_alive=config.keep_alive is not False,
+        )
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections owned by this instance."""
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> "YepCodeApi":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _get_access_token(self) -> str:
+        """
+        Get a new access token. Concurrent calls, from any thread, share a
+        single authentication request.
+        """
+        return self._access_token_calls.do("access_token", self._request_access_token)
+
+    def _renew_access_token(self, access_token: Optional[str]) -> None:
+        """Replace a missing, expired or rejected token, unless already replaced."""
+
+        def renew() -> str:
+            # Checked within the flight: a renewal may have just finished
+            if self._has_replaced_access_token(access_token):
+                return self.access_token
+            return self._request_access_token()
+
+        self._access_token_calls.do("access_token", renew)
+
+    def _request_access_token(self) -> str:
+        api_token = self._get_auth_api_token()
+        try:
+            response = self._transport.request(
+                "POST",
+                self._get_auth_url(),
+                headers={
+                    "x-api-token": api_token,
+                },
+                timeout=self.timeout / 1000,
+            )
+
+            if not response.ok:
+                raise ValueError(f"HTTP error! status: {response.status_code}")
+
+            data = response.json()
+            self.access_token = data["access_token"]
+            if not self.access_token:
+                raise ValueError("No access token received from server")
+
+            return self.access_token
+
+        except Exception as error:
+            raise ValueError(f"Authentication failed: {str(error)}")
+
+    def _ensure_access_token(self) -> None:
+        """
+        Get an access token if there is no valid one. A token about to expire
+        is refreshed in the background, so requests don't wait for it.
+        """
+        access_token = self.access_token
+        if not access_token or self._is_access_token_expired(access_token):
+            self._renew_access_token(access_token)
+        elif self._should_refresh_access_token():
+            self._refresh_access_token_in_background()
+
+    def _refresh_access_token_in_background(self) -> None:
+        with self._token_refresh_lock:
+            if self._refreshing_token:
+                return
+            self._refreshing_token = True
+
+        def refresh():
+            try:
+                self._get_access_token()
+            except Exception:
+                pass  # The current token is still valid: retried on next request
+            finally:
+                self._refreshing_token = False
+
+        threading.Thread(target=refresh, name="yepcode-token-refresh", daemon=True).start()
+
+    @staticmethod
+    def _is_connect_error(error: requests.RequestException) -> bool:
+        """Whether the request failed before a connection to the API was open."""
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
+    def _send(
+        self, method: str, endpoint: str, options: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """
+        Send an authenticated request, returning the raw response. Failed
+        requests are retried as allowed by the retry_policy.
+        """
+        if options is None:
+            options = {}
+
+        endpoint = endpoint.lstrip("/")
+        endpoint_class = self._get_endpoint_class(endpoint)
+        idempotent = self._is_idempotent_request(method, options)
+        retries = auth_retries = 0
+        while True:
+            self._ensure_access_token()
+            access_token = self.access_token
+            probe = self._acquire_circuit(endpoint_class)
+            try:
+                with self._limit_request(endpoint_class):
+                    response = self._transport.request(
+                        method,
+                        self._get_url(endpoint),
+                        **self._build_request_kwargs(options, access_token),
+                    )
+            except (requests.ConnectionError, requests.Timeout) as error:
+                self._record_circuit(
+                    endpoint_class,
+                    None
+                    if isinstance(error, requests.ReadTimeout)
+                    and self._is_sync_execution(endpoint)
+                    else True,
+                    probe,
+                )
+                delay = self._get_error_retry_delay(
+                    retries, idempotent, self._is_connect_error(error), options
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                self._record_circuit(endpoint_class, None, probe)
+                raise
+            else:
+                self._record_circuit(
+                    endpoint_class, self._is_api_failure(response), probe
+                )
+                if response.status_code == 401 and self._can_retry_auth(
+                    auth_retries, options
+                ):
+                    response.close()
+                    self._renew_access_token(access_token)
+                    auth_retries += 1
+                    continue
+                self._throttle_requests(endpoint_class, response)
+                delay = self._get_response_retry_delay(
+                    response, retries, idempotent, options
+                )
+                if delay is None:
+                    return response
+                response.close()
+
+            retries += 1
+            time.sleep(delay)
+
+    def _request(
+        self, method: str, endpoint: str, options: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        response = self._send(method, endpoint, options)
+
+        if not response.ok:
+            raise YepCodeApiError(
+                f"HTTP error {response.status_code} in endpoint {method} {endpoint.lstrip('/')}: {self._get_response_error_message(response)}",
+                response.status_code,
+                retry_after=self._get_retry_after(response),
+            )
+
+        return self._get_response_body(response)
+
     def create_process(self, data: CreateProcessInput) -> Process:
         return self._request("POST", "/processes", {"data": data})
 
@@ -332,21 +792,10 @@ class YepCodeApi:
         parameters: Optional[Dict[str, Any]] = None,
         options: Optional[Dict[str, Any]] = None,
     ) -> ExecutionId:
-        headers = {}
-        if options and options.get("initiatedBy"):
-            headers["Yep-Initiated-By"] = options["initiatedBy"]
-
-        data = {
-            "parameters": json.dumps(parameters or {}),
-            "tag": options.get("tag") if options else None,
-            "comment": options.get("comment") if options else None,
-            "settings": options.get("settings") if options else None,
-        }
-
         return self._request(
             "POST",
             f"/processes/{process_id_or_slug}/execute",
-            {"data": data, "headers": headers},
+            self._build_execute_request(parameters, options),
         )
 
     def execute_process_sync(
@@ -355,21 +804,33 @@ class YepCodeApi:
         parameters: Optional[Dict[str, Any]] = None,
         options: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        headers = {}
-        if options and options.get("initiatedBy"):
-            headers["Yep-Initiated-By"] = options["initiatedBy"]
-
-        data = {
-            "parameters": json.dumps(parameters or {}),
-            "tag": options.get("tag") if options else None,
-            "comment": options.get("comment") if options else None,
-            "settings": options.get("settings") if options else None,
-        }
-
         return self._request(
             "POST",
             f"/processes/{process_id_or_slug}/execute-sync",
-            {"data": data, "headers": headers},
+            self._build_execute_request(parameters, options),
+        )
+
+    def execute_process_sync_response(
+        self,
+        process_id_or_slug: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Like execute_process_sync(), but don't raise on error responses.
+
+        Returns:
+            Dict with the response "status" code, the "executionId" (if the
+            API identified the execution) and the response "data"
+        """
+        response = self._send(
+            "POST",
+            f"/processes/{process_id_or_slug}/execute-sync",
+            {**self._build_execute_request(parameters, options), "timeout": timeout},
+        )
+        return self._build_sync_execution_response(
+            response.status_code, response.headers, self._get_response_body(response)
         )
 
     def create_schedule(
@@ -382,15 +843,11 @@ class YepCodeApi:
     def get_executions(
         self, params: Optional[Dict[str, Any]] = None
     ) -> ExecutionsPaginatedResult:
-        if params:
-            sanitized_params = {
-                **params,
-                "from": self._sanitize_date_param(params.get("from")),
-                "to": self._sanitize_date_param(params.get("to")),
-            }
-        else:
-            sanitized_params = {}
-        return self._request("GET", "/executions", {"params": sanitized_params})
+        return self._request(
+            "GET",
+            "/executions",
+            {"params": self._sanitize_executions_params(params)},
+        )
 
     def get_execution(self, id: str) -> Execution:
         return self._request("GET", f"/executions/{id}")
@@ -568,73 +1025,20 @@ class YepCodeApi:
         return [StorageObject.from_dict(obj) for obj in response]
 
     def get_object(self, name: str) -> requests.Response:
-        if not self.access_token:
-            self._get_access_token()
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-        }
-        endpoint = f"/storage/objects/{name}"
-        url = urljoin(f"{self._get_base_url()}/", endpoint.lstrip("/"))
-        response = requests.get(
-            url, headers=headers, stream=True, timeout=self.timeout / 1000
-        )
+        response = self._send("GET", f"/storage/objects/{name}", {"stream": True})
         response.raise_for_status()
         return response
 
     def create_object(self, data: CreateStorageObjectInput) -> StorageObject:
-        if not data.file:
-            raise ValueError("File or stream is required")
-        if not self.access_token:
-            self._get_access_token()
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-        }
-        endpoint = f"/storage/objects?name={requests.utils.quote(data.name)}"
-        url = urljoin(f"{self._get_base_url()}/", endpoint.lstrip("/"))
-        # Detect content type
-        content_type, _ = mimetypes.guess_type(data.name)
-        files = {
-            "file": (data.name, data.file, content_type or "application/octet-stream")
-        }
-        response = requests.post(
-            url, headers=headers, files=files, timeout=self.timeout / 1000
-        )
-        if not response.ok:
-            try:
-                error_response = response.json()
-                message = error_response.get("message", response.reason)
-            except ValueError:
-                message = response.reason
-            raise YepCodeApiError(
-                f"HTTP error {response.status_code} in endpoint POST {endpoint}: {message}",
-                response.status_code,
-            )
-        return StorageObject.from_dict(response.json())
+        request = self._build_create_object_request(data)
+        response = self._request("POST", request.pop("endpoint"), request)
+        return StorageObject.from_dict(response)
 
     def delete_object(self, name: str) -> None:
-        if not self.access_token:
-            self._get_access_token()
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-        }
-        endpoint = f"/storage/objects/{requests.utils.quote(name)}"
-        url = urljoin(f"{self._get_base_url()}/", endpoint.lstrip("/"))
-        response = requests.delete(url, headers=headers, timeout=self.timeout / 1000)
-        if not response.ok:
-            try:
-                error_response = response.json()
-                message = error_response.get("message", response.reason)
-            except ValueError:
-                message = response.reason
-            raise YepCodeApiError(
-                f"HTTP error {response.status_code} in endpoint DELETE {endpoint}: {message}",
-                response.status_code,
-            )
-        return None
+        self._request("DELETE", f"/storage/objects/{quote(name)}")
 
     def create_signed_url(self, data: CreateSignedUrlInput) -> SignedUrl:
-        body: Dict[str, Any] = {"path": data.path}
-        if data.expires_in_seconds is not None:
-            body["expiresInSeconds"] = data.expires_in_seconds
-        response = self._request("POST", "/storage/signed-urls", {"data": body})
+        response = self._request(
+            "POST", "/storage/signed-urls", {"data": self._build_signed_url_body(data)}
+        )
         return SignedUrl.from_dict(response)
@@ -0,0 +1,102 @@
+from typing import List, Optional
+
+from ..api.api_manager import YepCodeApiManager
+from ..api.types import YepCodeApiConfig, TeamVariable
+from .yepcode_env import BaseYepCodeEnv, EnvVar
+
+
+class AsyncYepCodeEnv(BaseYepCodeEnv):
+    def __init__(self, config: YepCodeApiConfig = None):
+        """
+        Initialize AsyncYepCodeEnv with optional configuration.
+
+        Args:
+            config: YepCodeApiConfig instance for API configuration
+        """
+        if config is None:
+            config = YepCodeApiConfig()
+        self._yepcode_api = YepCodeApiManager.get_async_instance(config)
+
+    async def _get_variable(self, key: str) -> Optional[TeamVariable]:
+        """
+        Get a specific environment variable by key.
+
+        Args:
+            key: The environment variable key to look up
+
+        Returns:
+            TeamVariable if found, None otherwise
+        """
+        variables = await self._get_variables()
+        return next((v for v in variables if v.key == key), None)
+
+    async def _get_variables(self) -> List[TeamVariable]:
+        """
+        Get all environment variables.
+
+        Returns:
+            List of TeamVariable objects
+        """
+        page = 0
+        limit = 100
+        all_variables: List[TeamVariable] = []
+
+        while True:
+            response = await self._yepcode_api.get_variables(
+                {"page": page, "limit": limit}
+            )
+
+            variables = response.get("data", [])
+            if variables:
+                all_variables.extend(variables)
+
+            if not response.get("hasNextPage"):
+                break
+
+            page += 1
+
+        return self._to_team_variables(all_variables)
+
+    async def get_env_vars(self) -> List[EnvVar]:
+        """
+        Get all environment variables as EnvVar objects.
+
+        Returns:
+            List of EnvVar objects containing key-value pairs
+        """
+        variables = await self._get_variables()
+        return [EnvVar(key=var.key, value=var.value) for var in variables]
+
+    async def set_env_var(
+        self, key: str, value: str, is_sensitive: bool = True
+    ) -> None:
+        """
+        Set an environment variable.
+
+        Args:
+            key: Environment variable key
+            value: Environment variable value
+            is_sensitive: Whether the variable contains sensitive data
+        """
+        existing_var = await self._get_variable(key)
+
+        if existing_var:
+            await self._yepcode_api.update_variable(
+                existing_var.id, {"key": key, "value": value}
+            )
+        else:
+            await self._yepcode_api.create_variable(
+                {"key": key, "value": value, "isSensitive": is_sensitive}
+            )
+
+    async def del_env_var(self, key: str) -> None:
+        """
+        Delete an environment variable.
+
+        Args:
+            key: The key of the environment variable to delete
+        """
+        existing_var = await self._get_variable(key)
+
+        if existing_var:
+            await self._yepcode_api.delete_variable(existing_var.id)
@@ -12,7 +12,33 @@ class EnvVar:
     value: str
 
 
-class YepCodeEnv:
+class BaseYepCodeEnv:
+    """Response handling shared by YepCodeEnv and AsyncYepCodeEnv."""
+
+    def get_client_id(self) -> str:
+        return self._yepcode_api.get_client_id()
+
+    def get_team_id(self) -> str:
+        return self._yepcode_api.get_team_id()
+
+    @staticmethod
+    def _to_team_variables(all_variables: List[Dict]) -> List[TeamVariable]:
+        # Sort variables by key and extract required fields
+        return sorted(
+            [
+                TeamVariable(
+                    id=var["id"],
+                    key=var["key"],
+                    value=var["value"],
+                    is_sensitive=var["isSensitive"],
+                )
+                for var in all_variables
+            ],
+            key=lambda x: x.key,
+        )
+
+
+class YepCodeEnv(BaseYepCodeEnv):
     def __init__(self, config: YepCodeApiConfig = None):
         """
         Initialize YepCodeEnv with optional configuration.
@@ -24,12 +50,6 @@ class YepCodeEnv:
             config = YepCodeApiConfig()
         self._yepcode_api = YepCodeApiManager.get_instance(config)
 
-    def get_client_id(self) -> str:
-        return self._yepcode_api.get_client_id()
-
-    def get_team_id(self) -> str:
-        return self._yepcode_api.get_team_id()
-
     def _get_variable(self, key: str) -> Optional[TeamVariable]:
         """
         Get a specific environment variable by key.
@@ -66,19 +86,7 @@ class YepCodeEnv:
 
             page += 1
 
-        # Sort variables by key and extract required fields
-        return sorted(
-            [
-                TeamVariable(
-                    id=var["id"],
-                    key=var["key"],
-                    value=var["value"],
-                    is_sensitive=var["isSensitive"],
-                )
-                for var in all_variables
-            ],
-            key=lambda x: x.key,
-        )
+        return self._to_team_variables(all_variables)
 
     def get_env_vars(self) -> List[EnvVar]:
         """
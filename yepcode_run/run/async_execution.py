@@ -0,0 +1,281 @@
+import asyncio
+import inspect
+from typing import Optional, Any, List, Dict, Callable, AsyncIterator
+
+from ..api.async_yepcode_api import AsyncYepCodeApi
+from ..api.types import ExecutionStatus, Log
+from .execution import BaseExecution, _LOGS_END
+from .log_store import LogStore
+from .polling import PollingStrategy
+from .process_stats import ProcessStatsCollector
+
+
+class AsyncExecution(BaseExecution):
+    """
+    Asyncio counterpart of Execution.
+
+    Polling runs as a background task on the current event loop using
+    asyncio.sleep, so many executions can be tracked concurrently without
+    blocking. Event handlers may be plain functions or coroutine functions.
+    """
+
+    def __init__(
+        self,
+        yepcode_api: AsyncYepCodeApi,
+        execution_id: str,
+        events: Dict[str, Callable] = None,
+        timeout: Optional[float] = None,
+        max_polls: Optional[int] = None,
+        log_store: Optional[LogStore] = None,
+        poll_interval: Optional[float] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+        process_stats: Optional[ProcessStatsCollector] = None,
+        finished_data: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            yepcode_api,
+            execution_id,
+            events,
+            timeout,
+            max_polls,
+            log_store,
+            poll_interval,
+            polling_strategy,
+            process_stats,
+        )
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup = asyncio.Event()
+        self._cancel_requested = False
+        # Data of an execution known to be finished: it isn't polled
+        self._finished_data = finished_data
+
+    def init(self) -> None:
+        """Start polling the execution in the background. Requires a running loop."""
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._task = self._loop.create_task(
+                self._poll()
+                if self._finished_data is None
+                else self._run_finished(self._finished_data)
+            )
+            self._task.add_done_callback(self._on_task_cancelled)
+
+    def _on_task_cancelled(self, task: asyncio.Task) -> None:
+        # A task cancelled before its first step never runs its cleanup
+        if task.cancelled():
+            self._end_log_stream()
+            self._log_store.finish()
+
+    def _wake(self) -> None:
+        """
+        Poll the status right away instead of waiting for the next poll.
+        Safe to call from any thread.
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _emit(self, event_name: str, event_arg: Any) -> None:
+        if handler := self.events.get(event_name):
+            result = handler(event_arg)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _fetch_logs(self) -> List[Log]:
+        """Fetch the logs added since the previous call, oldest first."""
+        logs: List[Log] = []
+
+        while True:
+            response = await self.yepcode_api.get_execution_logs(
+                self.id, self._get_logs_page_params()
+            )
+            logs.extend(self._consume_logs_page(response))
+
+            if not response.get("hasNextPage"):
+                break
+
+        return self._sort_logs(logs)
+
+    def done(self) -> bool:
+        return self._task is not None and self._task.done()
+
+    async def wait_for_done(self) -> None:
+        self.init()
+        await asyncio.shield(self._task)
+
+    async def result(self) -> Any:
+        """
+        Wait for the execution to finish and return its return value.
+
+        Raises:
+            YepCodeExecutionError: If the execution ended with a failed status
+        """
+        await self.wait_for_done()
+        return self._get_result()
+
+    def add_done_callback(self, fn: Callable[["AsyncExecution"], Any]) -> None:
+        """Call fn with this execution once it's done."""
+        self.init()
+        self._task.add_done_callback(lambda _: fn(self))
+
+    async def cancel(self) -> bool:
+        """Kill the execution. Returns False if it had already finished."""
+        if self.done():
+            return False
+        await self.kill()
+        self._cancel_requested = True
+        return True
+
+    def cancelled(self) -> bool:
+        return self._cancel_requested and self.status == ExecutionStatus.KILLED
+
+    async def _poll_logs(self) -> bool:
+        """
+        Fetch and emit the new logs. Returns False, keeping the logs cursor,
+        if the API is throttling us.
+        """
+        cursor = self._log_page, self._log_page_offset
+        try:
+            logs = await self._fetch_logs()
+        except Exception as error:
+            if not self._is_throttled(error):
+                raise error
+            self._log_page, self._log_page_offset = cursor
+            return False
+        new_logs, subscribers = self._store_new_logs(logs)
+        for log in new_logs:
+            await self._emit("onLog", log)
+            for log_queue in subscribers:
+                await self._publish_log(log_queue, log)
+        return True
+
+    async def _publish_log(self, log_queue: asyncio.Queue, log: Log) -> None:
+        # Wait while the consumer is behind, unless it stops consuming
+        while log_queue in self._log_subscribers:
+            try:
+                await asyncio.wait_for(log_queue.put(log), 0.1)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+    def _end_log_stream(self) -> None:
+        for log_queue in self._close_logs():
+            try:
+                log_queue.put_nowait(_LOGS_END)
+            except asyncio.QueueFull:
+                pass  # The consumer stops once it drains the queue
+
+    async def iter_logs(self, max_buffer: int = 1000) -> AsyncIterator[Log]:
+        """
+        Iterate over the execution logs as they arrive, finishing once the
+        execution is done::
+
+            async for log in execution.iter_logs():
+                ...
+
+        Starts with the logs already kept by the execution (see the
+        logRetention run option). When the consumer falls more than
+        max_buffer logs behind, polling waits for it to catch up.
+        """
+        self.init()
+        log_queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+        try:
+            for log in self._subscribe_logs(log_queue):
+                yield log
+            while not (self._logs_closed and log_queue.empty()):
+                log = await log_queue.get()
+                if log is _LOGS_END:
+                    break
+                yield log
+        finally:
+            self._unsubscribe_logs(log_queue)
+
+        # The stream ends right before the polling task does
+        await asyncio.wait([self._task])
+        if not self._task.cancelled() and (error := self._task.exception()):
+            raise error
+
+    async def _fetch_execution_data(self) -> Optional[Dict[str, Any]]:
+        """Fetch the execution status, or None if the API is throttling us."""
+        try:
+            return await self.yepcode_api.get_execution(self.id)
+        except Exception as error:
+            if not self._is_throttled(error):
+                raise error
+            return None
+
+    async def _poll(self) -> None:
+        self.is_polling = True
+        self._start_polling_deadline()
+        try:
+            while True:
+                if execution_data := await self._fetch_execution_data():
+                    self._update_from_execution_data(execution_data)
+
+                    # Throttled log rounds are retried, up to the final logs
+                    logs_polled = (
+                        not self._should_poll_logs() or await self._poll_logs()
+                    )
+
+                    if self._is_done(self.status) and logs_polled:
+                        break
+
+                self.poll_attempts += 1
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), self._get_next_poll_delay()
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+            self._record_duration()
+            self._finish(execution_data)
+            await self._emit(*self._get_final_event())
+        finally:
+            self.is_polling = False
+            try:
+                self._record_stats()
+            finally:
+                self._end_log_stream()
+                self._log_store.finish()
+
+    async def _run_finished(self, execution_data: Dict[str, Any]) -> None:
+        self.is_polling = False
+        try:
+            self._update_from_execution_data(execution_data)
+            self._finish(execution_data)
+            await self._emit(*self._get_final_event())
+        finally:
+            self._end_log_stream()
+            self._log_store.finish()
+
+    async def kill(self) -> None:
+        try:
+            await self.yepcode_api.kill_execution(self.id)
+        except Exception as error:
+            if getattr(error, "status", None) == 404:
+                raise ValueError(f"Execution not found for id: {self.id}")
+            raise error
+
+    async def rerun(self) -> "AsyncExecution":
+        try:
+            execution_id = await self.yepcode_api.rerun_execution(self.id)
+            execution = AsyncExecution(
+                yepcode_api=self.yepcode_api,
+                execution_id=execution_id,
+                events=self.events,
+                timeout=self.timeout,
+                max_polls=self.max_polls,
+                log_store=self._log_store.empty_copy(),
+                poll_interval=self.poll_interval,
+                polling_strategy=self.polling_strategy,
+                process_stats=self.process_stats,
+            )
+            execution.process_id = self.process_id
+            execution.init()
+            return execution
+        except Exception as error:
+            if getattr(error, "status", None) == 404:
+                raise ValueError(f"Execution not found for id: {self.id}")
+            raise error
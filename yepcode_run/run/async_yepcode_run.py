@@ -0,0 +1,352 @@
+import asyncio
+import inspect
+from typing import Optional, Dict, Any, Union, Iterable, AsyncIterator, List, Set
+
+from ..api.api_manager import YepCodeApiManager
+from ..api.yepcode_api import YepCodeApiError
+from ..api.types import YepCodeApiConfig
+from ..utils.single_flight import AsyncSingleFlight
+from .async_execution import AsyncExecution
+from .callback_listener import ExecutionCallbackListener
+from .process_cache import ProcessCache
+from .polling import PollingStrategy, AdaptivePolling
+from .process_stats import ProcessStatsCollector
+from .result_cache import ResultCache, CachedResult
+from .log_store import LogStore
+from .batch import BatchResult, aiter_batch
+from .prewarm import PrewarmedProcess
+from .yepcode_run import BaseYepCodeRun
+
+
+class AsyncYepCodeRun(BaseYepCodeRun):
+    def __init__(
+        self,
+        config: Optional[YepCodeApiConfig] = None,
+        callback_listener: Optional[ExecutionCallbackListener] = None,
+        process_cache: Union[bool, str, ProcessCache, None] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+        result_cache: Union[bool, str, ResultCache, None] = None,
+    ):
+        """
+        Initialize AsyncYepCodeRun with optional configuration.
+
+        Args:
+            config: API configuration. Read from the environment by default
+            callback_listener: Complete executions when YepCode calls back
+                this listener, polling only as a safety net
+            process_cache: Cache of the processes created for each code.
+                In memory by default; a path persists it to a JSON file and
+                False disables it
+            polling_strategy: Decides the wait between status polls of the
+                executions. AdaptivePolling by default, which waits for the
+                median duration of each process in process_stats
+            result_cache: Cache of the return values of runs with the same
+                code and parameters. See YepCodeRun
+        """
+        self.yepcode_api = YepCodeApiManager.get_async_instance(config)
+        self.process_cache = ProcessCache.from_option(process_cache)
+        self.result_cache = ResultCache.from_option(result_cache)
+        self._revalidations: Dict[str, asyncio.Task] = {}
+        self._prewarm_tasks: Set[asyncio.Task] = set()
+        self.process_stats = ProcessStatsCollector()
+        self.polling_strategy = polling_strategy or AdaptivePolling(
+            stats=self.process_stats
+        )
+        self._create_process_calls = AsyncSingleFlight()
+        self.callback_listener = callback_listener
+
+    async def create_process(
+        self, code: str, language: str, manifest: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Create a new process or return existing one.
+
+        Concurrent calls for the same code share a single lookup and
+        creation request.
+        """
+        process_slug = self._get_code_process_slug(code, language)
+        if process_id := self._get_cached_process_id(code, language, manifest):
+            return process_id
+
+        return await self._create_process_calls.do(
+            self._get_process_cache_key(code, language, manifest),
+            lambda: self._get_or_create_process(process_slug, code, language, manifest),
+        )
+
+    async def _get_or_create_process(
+        self,
+        process_slug: str,
+        code: str,
+        language: str,
+        manifest: Optional[Dict[str, Any]],
+    ) -> str:
+        try:
+            existing_process = await self.yepcode_api.get_process(process_slug)
+            if existing_process:
+                self._cache_process_id(code, language, manifest, existing_process["id"])
+                return existing_process["id"]
+        except YepCodeApiError as error:
+            if error.status != 404:
+                raise error
+
+        try:
+            process = await self.yepcode_api.create_process(
+                self._get_create_process_data(process_slug, code, language, manifest)
+            )
+        except YepCodeApiError as error:
+            # Created meanwhile by another client
+            if error.status != 409:
+                raise error
+            process = await self.yepcode_api.get_process(process_slug)
+        self._cache_process_id(code, language, manifest, process["id"])
+        return process["id"]
+
+    async def run(self, code: str, options: Dict[str, Any] = None) -> AsyncExecution:
+        """
+        Run code with specified options.
+
+        Returns as soon as the execution has been started. Use
+        ``await execution.wait_for_done()`` to wait for it to finish.
+        The sync mode isn't supported, and "auto" always runs asynchronously.
+        """
+        if options is None:
+            options = {}
+
+        run_options = self._get_run_options(code, options)
+        self._check_mode(run_options["mode"])
+        if run_options["mode"] == "sync":
+            raise ValueError("AsyncYepCodeRun doesn't support the sync mode")
+
+        result_key = self._get_result_key(code, run_options, options)
+        if result_key and (result := self.result_cache.get(result_key)):
+            if self.result_cache.is_stale(result):
+                self._revalidate(result_key, code, options)
+            return self._get_cached_execution(result, options)
+
+        process_id = await self.create_process(
+            code=code,
+            language=run_options["language"],
+            manifest=run_options["manifest"],
+        )
+
+        execute_options = options
+        if self.callback_listener:
+            callback_token, callback_url = self.callback_listener.new_callback()
+            execute_options = self._with_callback_url(options, callback_url)
+
+        try:
+            try:
+                execution_response = await self.yepcode_api.execute_process_async(
+                    process_id, run_options["parameters"], execute_options
+                )
+            except YepCodeApiError as error:
+                # The cached process may have been deleted: look it up again
+                if error.status != 404 or not self._forget_process(process_id):
+                    raise error
+                process_id = await self.create_process(
+                    code=code,
+                    language=run_options["language"],
+                    manifest=run_options["manifest"],
+                )
+                execution_response = await self.yepcode_api.execute_process_async(
+                    process_id, run_options["parameters"], execute_options
+                )
+        except BaseException:
+            if self.callback_listener:
+                self.callback_listener.release(callback_token)
+            raise
+
+        events = {
+            "onLog": options.get("onLog"),
+            "onFinish": options.get("onFinish"),
+            "onError": options.get("onError"),
+        }
+
+        if run_options["remove_on_done"]:
+
+            def remove_on_done(event_name: str):
+                async def wrapped(event_arg):
+                    self._forget_process(process_id)
+                    await self.yepcode_api.delete_process(process_id)
+                    if handler := options.get(event_name):
+                        result = handler(event_arg)
+                        if inspect.isawaitable(result):
+                            await result
+
+                return wrapped
+
+            events["onFinish"] = remove_on_done("onFinish")
+            events["onError"] = remove_on_done("onError")
+
+        if result_key:
+            events["onFinish"] = self._caching_result(
+                result_key,
+                execution_response["executionId"],
+                process_id,
+                events["onFinish"],
+            )
+
+        execution = AsyncExecution(
+            yepcode_api=self.yepcode_api,
+            execution_id=execution_response["executionId"],
+            events=events,
+            timeout=run_options["timeout"],
+            max_polls=run_options["max_polls"],
+            log_store=LogStore.from_option(options.get("logRetention")),
+            poll_interval=(
+                self.callback_listener.safety_poll_interval
+                if self.callback_listener
+                else None
+            ),
+            polling_strategy=self.polling_strategy,
+            process_stats=self.process_stats,
+        )
+        execution.init()
+        if self.callback_listener:
+            self.callback_listener.bind(callback_token, execution)
+        return execution
+
+    def _get_cached_execution(
+        self, result: CachedResult, options: Dict[str, Any]
+    ) -> AsyncExecution:
+        """Finished AsyncExecution returning a cached result, without logs."""
+        execution = AsyncExecution(
+            yepcode_api=self.yepcode_api,
+            execution_id=result.execution_id,
+            events={
+                "onLog": options.get("onLog"),
+                "onFinish": options.get("onFinish"),
+                "onError": options.get("onError"),
+            },
+            log_store=LogStore.from_option(options.get("logRetention")),
+            finished_data=self._get_cached_execution_data(result),
+        )
+        execution.init()
+        return execution
+
+    def _revalidate(self, result_key: str, code: str, options: Dict[str, Any]) -> None:
+        """Run the code again in a background task to refresh a stale result."""
+        if result_key in self._revalidations:
+            return
+
+        async def revalidate():
+            try:
+                execution = await self.run(code, self._get_revalidation_options(options))
+                await execution.wait_for_done()
+                self._cache_result(result_key, execution)
+            except Exception:
+                pass  # The stale result is served until it expires
+
+        task = self._revalidations[result_key] = asyncio.create_task(revalidate())
+        task.add_done_callback(lambda _: self._revalidations.pop(result_key, None))
+
+    async def run_many(
+        self,
+        code: str,
+        parameters: Iterable[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None,
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Run code once per parameters dict, keeping at most concurrency
+        executions running at a time. See YepCodeRun.run_many()::
+
+            async for result in runner.run_many(code, parameters):
+                ...
+        """
+        options = options or {}
+        run_options = self._get_run_options(code, options)
+        process_id = await self.create_process(
+            code=code,
+            language=run_options["language"],
+            manifest=run_options["manifest"],
+        )
+
+        try:
+            async for result in aiter_batch(
+                lambda item_parameters: self.run(
+                    code, self._get_batch_item_options(options, item_parameters)
+                ),
+                parameters,
+                concurrency,
+                ordered,
+            ):
+                yield result
+        finally:
+            if run_options["remove_on_done"]:
+                self._forget_process(process_id)
+                await self.yepcode_api.delete_process(process_id)
+
+    async def map(
+        self,
+        code: str,
+        parameters: Iterable[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None,
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Any]:
+        """
+        Like run_many(), but yield the return values in input order. See
+        YepCodeRun.map().
+        """
+        async for result in self.run_many(
+            code, parameters, options, concurrency=concurrency, ordered=True
+        ):
+            if result.error is None:
+                yield result.return_value
+            elif return_exceptions:
+                yield result.error
+            else:
+                raise result.error
+
+    async def prewarm(
+        self,
+        snippets: Iterable[Union[str, Dict[str, Any]]],
+        execute: bool = False,
+        concurrency: int = 4,
+        wait: bool = False,
+    ) -> List[PrewarmedProcess]:
+        """
+        Create the processes of the given snippets in background tasks. See
+        YepCodeRun.prewarm().
+        """
+        items = self._get_prewarm_items(snippets)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def prewarm_process(item: PrewarmedProcess) -> None:
+            async with semaphore:
+                try:
+                    item.process_id = await self.create_process(
+                        item.code, item.language, item.manifest
+                    )
+                    if execute:
+                        execution = await self.run(item.code, item.get_run_options())
+                        await execution.wait_for_done()
+                except Exception as error:
+                    item.error = error
+                finally:
+                    item.done = True
+
+        tasks = [asyncio.create_task(prewarm_process(item)) for item in items]
+        for task in tasks:
+            # Keep a reference, the loop only keeps weak ones
+            self._prewarm_tasks.add(task)
+            task.add_done_callback(self._prewarm_tasks.discard)
+        if wait:
+            await asyncio.gather(*tasks)
+        return items
+
+    async def get_execution(self, execution_id: str) -> AsyncExecution:
+        """Get an existing execution by ID."""
+        if not execution_id:
+            raise ValueError("executionId is required")
+
+        execution = AsyncExecution(
+            yepcode_api=self.yepcode_api,
+            execution_id=execution_id,
+            polling_strategy=self.polling_strategy,
+            process_stats=self.process_stats,
+        )
+        execution.init()
+        return execution
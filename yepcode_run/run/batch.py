@@ -0,0 +1,155 @@
+import asyncio
+import queue
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one item of YepCodeRun.run_many()."""
+
+    index: int
+    parameters: Dict[str, Any]
+    execution: Optional[Any] = None
+    return_value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _reorder(
+    results: Iterator[BatchResult], ordered: bool
+) -> Iterator[BatchResult]:
+    if not ordered:
+        yield from results
+        return
+    pending: Dict[int, BatchResult] = {}
+    next_index = 0
+    for result in results:
+        pending[result.index] = result
+        while next_index in pending:
+            yield pending.pop(next_index)
+            next_index += 1
+
+
+def iter_batch(
+    start: Callable[[Dict[str, Any]], Any],
+    parameters: Iterable[Dict[str, Any]],
+    concurrency: int,
+    ordered: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Start an execution per parameters with start(), keeping at most
+    concurrency of them running, and yield their results as they finish
+    (or in input order). Failures are reported in the results.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive number")
+
+    def results() -> Iterator[BatchResult]:
+        done: "queue.Queue[Tuple[BatchResult, Any]]" = queue.Queue()
+        items = enumerate(parameters)
+        in_flight = 0
+        exhausted = False
+
+        while True:
+            while not exhausted and in_flight < concurrency:
+                try:
+                    index, item_parameters = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                result = BatchResult(index=index, parameters=item_parameters)
+                try:
+                    result.execution = start(item_parameters)
+                except Exception as error:
+                    result.error = error
+                    yield result
+                    continue
+                in_flight += 1
+                result.execution.add_done_callback(
+                    lambda execution, result=result: done.put(result)
+                )
+
+            if in_flight == 0:
+                return
+            result = done.get()
+            in_flight -= 1
+            result.error = result.execution.exception()
+            if result.error is None:
+                result.return_value = result.execution.return_value
+            yield result
+
+    return _reorder(results(), ordered)
+
+
+async def aiter_batch(
+    start: Callable[[Dict[str, Any]], Awaitable[Any]],
+    parameters: Iterable[Dict[str, Any]],
+    concurrency: int,
+    ordered: bool = False,
+) -> AsyncIterator[BatchResult]:
+    """asyncio version of iter_batch(), for AsyncYepCodeRun."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive number")
+
+    done: asyncio.Queue = asyncio.Queue()
+    items = enumerate(parameters)
+    in_flight = 0
+    exhausted = False
+    pending: Dict[int, BatchResult] = {}
+    next_index = 0
+
+    while True:
+        finished = []
+        while not exhausted and in_flight < concurrency:
+            try:
+                index, item_parameters = next(items)
+            except StopIteration:
+                exhausted = True
+                break
+            result = BatchResult(index=index, parameters=item_parameters)
+            try:
+                result.execution = await start(item_parameters)
+            except Exception as error:
+                result.error = error
+                finished.append(result)
+                continue
+            in_flight += 1
+            result.execution.add_done_callback(
+                lambda execution, result=result: done.put_nowait(result)
+            )
+
+        if not finished:
+            if in_flight == 0:
+                return
+            result = await done.get()
+            in_flight -= 1
+            try:
+                await result.execution.result()
+            except Exception as error:
+                result.error = error
+            else:
+                result.return_value = result.execution.return_value
+            finished.append(result)
+
+        for result in finished:
+            if not ordered:
+                yield result
+                continue
+            pending[result.index] = result
+            while next_index in pending:
+                yield pending.pop(next_index)
+                next_index += 1
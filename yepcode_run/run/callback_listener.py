@@ -0,0 +1,167 @@
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+class ExecutionCallbackListener:
+    """
+    Complete executions from YepCode callbacks instead of polling.
+
+    Every execution started through a YepCodeRun using this listener gets a
+    unique callback URL (``settings.callbackUrl``). When YepCode calls it, the
+    execution is fetched right away and its handle resolved. The callback
+    body is not trusted: it only triggers the fetch. Executions keep polling
+    every ``safety_poll_interval`` seconds in case a callback is lost.
+
+    The callbacks can be received by an embedded HTTP server (``start()``)
+    or by an existing web app, mounting ``wsgi_app`` or ``asgi_app`` under
+    ``public_url``. Either way, ``public_url`` must be reachable by YepCode:
+    otherwise every execution waits for its safety poll.
+    """
+
+    def __init__(
+        self,
+        public_url: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        safety_poll_interval: float = 60.0,
+    ):
+        """
+        Args:
+            public_url: Base URL YepCode can reach the callbacks at
+            host: Interface the embedded server listens on. Only the local
+                one by default: use "0.0.0.0" to listen on every interface
+            port: Port of the embedded server. A free one by default
+            safety_poll_interval: Seconds between status polls while waiting
+                for the callback
+        """
+        if not public_url:
+            raise ValueError("public_url is required to receive callbacks")
+        self.public_url = public_url
+        self.host = host
+        self.port = port
+        self.safety_poll_interval = safety_poll_interval
+        # Callback token -> execution, None until the execution is started
+        self._executions: Dict[str, Any] = {}
+        # Tokens called back before their execution was bound
+        self._early_callbacks: set = set()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> "ExecutionCallbackListener":
+        """Start the embedded HTTP server in a background thread."""
+        if self._server is None:
+            listener = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_POST(self):
+                    self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                    self.send_response(listener.handle_callback(self.path))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+
+                def log_message(self, format, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+            self._server.daemon_threads = True
+            self.port = self._server.server_address[1]
+            threading.Thread(
+                target=self._server.serve_forever,
+                name="yepcode-callback-listener",
+                daemon=True,
+            ).start()
+        return self
+
+    def close(self) -> None:
+        """Stop the embedded HTTP server, if started."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "ExecutionCallbackListener":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_base_url(self) -> str:
+        return self.public_url.rstrip("/")
+
+    def new_callback(self) -> Tuple[str, str]:
+        """Reserve a callback, returning its token and URL."""
+        token = secrets.token_urlsafe(24)
+        with self._lock:
+            self._executions[token] = None
+        return token, f"{self.get_base_url()}/{token}"
+
+    def bind(self, token: str, execution: Any) -> None:
+        """
+        Resolve the execution when the callback with the given token arrives.
+        The callback is released once the execution is done.
+        """
+        with self._lock:
+            if token not in self._executions:
+                raise ValueError(f"Unknown callback token: {token}")
+            self._executions[token] = execution
+            called_back = token in self._early_callbacks
+            self._early_callbacks.discard(token)
+        execution.add_done_callback(lambda _: self.release(token))
+        if called_back:
+            execution._wake()
+
+    def release(self, token: str) -> None:
+        with self._lock:
+            self._executions.pop(token, None)
+            self._early_callbacks.discard(token)
+
+    def handle_callback(self, path: str) -> int:
+        """
+        Handle a callback request to the given path, returning the HTTP
+        status to respond with.
+        """
+        token = path.split("?")[0].rstrip("/").rsplit("/", 1)[-1]
+        with self._lock:
+            if token not in self._executions:
+                return 404
+            execution = self._executions[token]
+            if execution is None:
+                self._early_callbacks.add(token)
+        if execution is not None:
+            execution._wake()
+        return 204
+
+    def wsgi_app(
+        self, environ: Dict[str, Any], start_response: Callable
+    ) -> Iterable[bytes]:
+        """WSGI app receiving the callbacks, to mount under public_url."""
+        if environ.get("REQUEST_METHOD") != "POST":
+            status = 405
+        else:
+            status = self.handle_callback(environ.get("PATH_INFO", ""))
+        reason = {204: "No Content", 404: "Not Found", 405: "Method Not Allowed"}
+        start_response(f"{status} {reason[status]}", [("Content-Length", "0")])
+        return [b""]
+
+    async def asgi_app(self, scope: Dict[str, Any], receive: Callable, send: Callable):
+        """ASGI app receiving the callbacks, to mount under public_url."""
+        if scope["type"] != "http":
+            return
+        more_body = True
+        while more_body:
+            message = await receive()
+            more_body = message.get("more_body", False)
+        if scope.get("method") != "POST":
+            status = 405
+        else:
+            status = self.handle_callback(scope.get("path", ""))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-length", b"0")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
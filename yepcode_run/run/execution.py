@@ -1,27 +1,110 @@
 import json
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Optional, Any, List, Dict, Callable
+from typing import Optional, Any, List, Dict, Callable, Set, Tuple, Iterator, TYPE_CHECKING
 import time
 
 from ..api.yepcode_api import YepCodeApi
 from ..api.types import ExecutionStatus, Log, TimelineEvent
+from .log_store import LogStore
+from .polling import PollingStrategy, AdaptivePolling, FixedPolling
+from .process_stats import ProcessStatsCollector
 
+if TYPE_CHECKING:
+    from .execution_tracker import ExecutionTracker
+
+
+# Marks the end of the logs stream in iter_logs() queues
+_LOGS_END = object()
+
+
+class YepCodeExecutionError(Exception):
+    """Raised by Execution.result() when the execution ends with a failed status."""
+
+    def __init__(self, execution: "BaseExecution"):
+        super().__init__(
+            f"Execution {execution.id} finished with status "
+            f"{execution.status.value if execution.status else None}: {execution.error}"
+        )
+        self.execution = execution
+        self.status = execution.status
+        self.name = "YepCodeExecutionError"
+
+
+class YepCodeExecutionTimeoutError(TimeoutError):
+    """
+    Raised when an execution is still running after the polling deadline or
+    the maximum number of polls. The execution itself keeps running.
+    """
+
+    def __init__(self, execution: Optional["BaseExecution"], reason: str):
+        if execution is None:
+            # The execution was started but couldn't be identified
+            super().__init__(f"Execution couldn't be tracked: {reason}")
+        else:
+            super().__init__(
+                f"Execution {execution.id} is still "
+                f"{execution.status.value if execution.status else 'pending'}: {reason}"
+            )
+        self.execution = execution
+        self.name = "YepCodeExecutionTimeoutError"
+
+
+class BaseExecution:
+    """
+    Execution state handling shared by the blocking Execution and the
+    asyncio based AsyncExecution. Subclasses only implement the I/O.
+    """
+
+    LOGS_PAGE_LIMIT = 100
+    # Logs cursor never goes back more than a page, so de-duplicating against
+    # the last few pages is enough
+    LOG_KEYS_WINDOW = 1000
 
-class Execution:
     def __init__(
         self,
-        yepcode_api: YepCodeApi,
+        yepcode_api: Any,
         execution_id: str,
         events: Dict[str, Callable] = None,
+        timeout: Optional[float] = None,
+        max_polls: Optional[int] = None,
+        log_store: Optional[LogStore] = None,
+        poll_interval: Optional[float] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+        process_stats: Optional[ProcessStatsCollector] = None,
     ):
         self.yepcode_api = yepcode_api
         self.id = execution_id
         self.events = events or {}
+        self.timeout = timeout
+        self.max_polls = max_polls
+        self.poll_interval = poll_interval
+        if poll_interval is not None:
+            polling_strategy = FixedPolling(poll_interval)
+        self.polling_strategy = polling_strategy or AdaptivePolling()
+        self.process_stats = process_stats
+        self._deadline: Optional[float] = None
+        self._polling_started_at: Optional[float] = None
+        # Wait requested by the API (Retry-After) before the next poll
+        self._retry_after: Optional[float] = None
 
         self.is_polling = True
         self.poll_attempts = 0
 
-        self.logs: List[Log] = []
+        self._log_store = log_store if log_store is not None else LogStore()
+        self._last_error_log: Optional[Log] = None
+        # Index of the (timestamp, message) of the last received logs
+        self._log_keys: Set[Tuple[str, str]] = set()
+        self._log_keys_order: deque = deque()
+        # Queues of the active iter_logs() consumers
+        self._log_subscribers: List[Any] = []
+        self._logs_closed = False
+        self._log_lock = threading.Lock()
+        # Logs received so far, including the ones not retained
+        self.log_count = 0
         self.process_id: Optional[str] = None
         self.status: Optional[ExecutionStatus] = None
         self.return_value: Any = None
@@ -33,93 +116,95 @@ class Execution:
         self.last_log_poll = 0
         self.LOG_POLL_INTERVAL = 2000  # Poll logs every 2 seconds
 
-        self._poll()
-
-    def init(self) -> None:
-        pass  # No longer needed as _poll is called in __init__
-
-    def _fetch_logs(self) -> List[Log]:
-        page = 0
-        limit = 100
-        logs: List[Log] = []
-
-        while True:
-            response = self.yepcode_api.get_execution_logs(
-                self.id, {"page": page, "limit": limit}
-            )
-
-            if log_entries := response.get("data"):
-                logs.extend([Log(**log) for log in log_entries])
-
-            if not response.get("hasNextPage"):
-                break
-
-            page += 1
+        # Logs cursor: page to resume from and logs of that page already seen
+        self._log_page = 0
+        self._log_page_offset = 0
 
-        return sorted(logs, key=lambda x: datetime.fromisoformat(x.timestamp))
+    @property
+    def logs(self) -> List[Log]:
+        """Logs kept by the execution log retention policy."""
+        return self._log_store.get_logs()
 
     def is_done(self) -> bool:
         return self._is_done(self.status)
 
-    def wait_for_done(self) -> None:
-        while not self.is_done():
-            time.sleep(self._get_polling_interval())
-            self._poll()
+    @staticmethod
+    def _sort_logs(logs: List[Log]) -> List[Log]:
+        return sorted(logs, key=lambda x: datetime.fromisoformat(x.timestamp))
 
-    def _poll_logs(self) -> None:
-        current_logs = self._fetch_logs()
+    def _get_logs_page_params(self) -> Dict[str, int]:
+        return {"page": self._log_page, "limit": self.LOGS_PAGE_LIMIT}
+
+    def _consume_logs_page(self, response: Dict[str, Any]) -> List[Log]:
+        """
+        Return the logs of a logs page not returned before and advance the
+        cursor, so the next fetch resumes from where this one stopped.
+        """
+        log_entries = response.get("data") or []
+        new_entries = log_entries[self._log_page_offset :]
+
+        # A page followed by another one is complete and won't get new logs
+        if response.get("hasNextPage"):
+            self._log_page += 1
+            self._log_page_offset = 0
+        else:
+            self._log_page_offset = max(self._log_page_offset, len(log_entries))
+
+        return [Log(**log) for log in new_entries]
+
+    def _update_from_execution_data(self, execution_data: Dict[str, Any]) -> None:
+        self.process_id = execution_data.get("processId")
+        self.status = ExecutionStatus(execution_data.get("status"))
+        self.timeline = [
+            TimelineEvent(**event)
+            for event in (execution_data.get("timeline", {}).get("events") or [])
+        ]
+        self.parameters = execution_data.get("parameters")
+        self.comment = execution_data.get("comment")
+
+    def _should_poll_logs(self) -> bool:
+        now = time.time() * 1000
+        if now - self.last_log_poll >= self.LOG_POLL_INTERVAL or self._is_done(
+            self.status
+        ):
+            self.last_log_poll = now
+            return True
+        return False
+
+    def _add_new_logs(self, current_logs: List[Log]) -> List[Log]:
+        """Store the logs not seen yet and return them."""
+        new_logs = []
         for log in current_logs:
             if not self._log_already_processed(log):
-                self.logs.append(log)
-                if on_log := self.events.get("onLog"):
-                    on_log(log)
-
-    def _poll(self) -> None:
-        self.is_polling = True
-        try:
-            execution_data = self.yepcode_api.get_execution(self.id)
-
-            self.process_id = execution_data.get("processId")
-            self.status = ExecutionStatus(execution_data.get("status"))
-            self.timeline = [
-                TimelineEvent(**event)
-                for event in (execution_data.get("timeline", {}).get("events") or [])
-            ]
-            self.parameters = execution_data.get("parameters")
-            self.comment = execution_data.get("comment")
-
-            now = time.time() * 1000
-            if now - self.last_log_poll >= self.LOG_POLL_INTERVAL or self._is_done(
-                self.status
-            ):
-                self._poll_logs()
-                self.last_log_poll = now
-
-            if not self._is_done(self.status):
-                self.poll_attempts += 1
-                time.sleep(self._get_polling_interval())
-                self._poll()
-                return
-
-            if return_value := execution_data.get("returnValue"):
-                try:
-                    self.return_value = json.loads(return_value)
-                except json.JSONDecodeError:
-                    self.return_value = return_value
-
-            if self._is_failed(self.status):
-                self.error = self._get_error_message()
-                if on_error := self.events.get("onError"):
-                    on_error({"message": self.error})
-            else:
-                if on_finish := self.events.get("onFinish"):
-                    on_finish(self.return_value)
-
-            self.is_polling = False
-
-        except Exception as e:
-            self.is_polling = False
-            raise e
+                self._log_store.append(log)
+                self._remember_log_key(self._get_log_key(log))
+                self.log_count += 1
+                if log.level == "ERROR":
+                    self._last_error_log = log
+                new_logs.append(log)
+        return new_logs
+
+    def _finish(self, execution_data: Dict[str, Any]) -> None:
+        """Store the final result of a terminated execution."""
+        if return_value := execution_data.get("returnValue"):
+            try:
+                self.return_value = json.loads(return_value)
+            except json.JSONDecodeError:
+                self.return_value = return_value
+
+        if self._is_failed(self.status):
+            self.error = self._get_error_message()
+
+    def _get_final_event(self):
+        """Return the (event name, event argument) to emit once finished."""
+        if self._is_failed(self.status):
+            return "onError", {"message": self.error}
+        return "onFinish", self.return_value
+
+    def _get_result(self) -> Any:
+        if self._is_failed(self.status):
+            raise YepCodeExecutionError(self)
+        return self.return_value
 
     def _is_done(self, status: Optional[ExecutionStatus] = None) -> bool:
         return status not in [ExecutionStatus.CREATED, ExecutionStatus.RUNNING]
@@ -132,26 +217,421 @@ class Execution:
         ]
 
     def _get_polling_interval(self) -> float:
-        if self.poll_attempts < 4:
-            return 0.25
-        elif self.poll_attempts < 12:
-            return 0.5
-        return 1.0
+        return self.polling_strategy.get_delay(
+            self.process_id, self.poll_attempts, self._get_polling_elapsed()
+        )
 
-    def _log_already_processed(self, log: Log) -> bool:
-        return any(
-            l.timestamp == log.timestamp and l.message == log.message for l in self.logs
+    def _start_polling_deadline(self) -> None:
+        if self._polling_started_at is not None:
+            return  # Already started, e.g. by an ExecutionTracker
+        self._polling_started_at = time.monotonic()
+        if self.timeout is not None:
+            self._deadline = self._polling_started_at + self.timeout
+
+    def _get_polling_elapsed(self) -> float:
+        if self._polling_started_at is None:
+            return 0.0
+        return time.monotonic() - self._polling_started_at
+
+    def _record_duration(self) -> None:
+        """Let the polling strategy learn how long the execution took."""
+        self.polling_strategy.record_duration(
+            self.process_id, self._get_polling_elapsed()
         )
 
+    def _record_stats(self) -> None:
+        """Add the execution, once finished, to the process runtime statistics."""
+        if self.process_stats is not None:
+            self.process_stats.record_execution(self)
+
+    def _is_throttled(self, error: Exception) -> bool:
+        """
+        Whether a polling error means the API asks to slow down, in which
+        case the next poll waits for at least its Retry-After.
+        """
+        if getattr(error, "status", None) not in (429, 503):
+            return False
+        self._retry_after = getattr(error, "retry_after", None) or 0.0
+        return True
+
+    def _get_next_poll_delay(self) -> float:
+        """
+        Return how long to wait before the next poll, raising
+        YepCodeExecutionTimeoutError once the deadline or max polls is reached.
+        """
+        if self.max_polls is not None and self.poll_attempts >= self.max_polls:
+            raise YepCodeExecutionTimeoutError(
+                self, f"reached the maximum of {self.max_polls} polls"
+            )
+        interval = self._get_polling_interval()
+        if self._retry_after is not None:
+            interval = max(interval, self._retry_after)
+            self._retry_after = None
+        if self._deadline is None:
+            return interval
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise YepCodeExecutionTimeoutError(
+                self, f"not finished after {self.timeout} seconds"
+            )
+        return min(interval, remaining)
+
+    @staticmethod
+    def _get_log_key(log: Log) -> Tuple[str, str]:
+        return log.timestamp, log.message
+
+    def _store_new_logs(self, current_logs: List[Log]) -> Tuple[List[Log], List[Any]]:
+        """
+        Store the logs not seen yet, returning them with the log subscribers
+        they have to be published to.
+        """
+        with self._log_lock:
+            return self._add_new_logs(current_logs), list(self._log_subscribers)
+
+    def _subscribe_logs(self, log_queue: Any) -> List[Log]:
+        """Register a log consumer queue and return the logs already kept."""
+        with self._log_lock:
+            self._log_subscribers.append(log_queue)
+            return list(self._log_store.get_logs())
+
+    def _unsubscribe_logs(self, log_queue: Any) -> None:
+        with self._log_lock:
+            if log_queue in self._log_subscribers:
+                self._log_subscribers.remove(log_queue)
+
+    def _close_logs(self) -> List[Any]:
+        """Mark the logs stream as finished and return the subscribers to notify."""
+        with self._log_lock:
+            self._logs_closed = True
+            return list(self._log_subscribers)
+
+    def _remember_log_key(self, key: Tuple[str, str]) -> None:
+        self._log_keys.add(key)
+        self._log_keys_order.append(key)
+        if len(self._log_keys_order) > self.LOG_KEYS_WINDOW:
+            self._log_keys.discard(self._log_keys_order.popleft())
+
+    def _log_already_processed(self, log: Log) -> bool:
+        return self._get_log_key(log) in self._log_keys
+
     def _get_error_message(self) -> str:
         return next(
             (e.explanation for e in (self.timeline or []) if e.status == self.status),
-            next(
-                (log.message for log in reversed(self.logs) if log.level == "ERROR"),
-                None,
-            ),
+            self._last_error_log.message if self._last_error_log else None,
         )
 
+
+class Execution(BaseExecution):
+    """
+    Handle to a running execution.
+
+    Polling happens in a background thread started on creation, so the
+    handle is returned right away and behaves like a future: use done(),
+    result(), add_done_callback() or cancel(). Event handlers are called from
+    the polling thread.
+    """
+
+    def __init__(
+        self,
+        yepcode_api: YepCodeApi,
+        execution_id: str,
+        events: Dict[str, Callable] = None,
+        timeout: Optional[float] = None,
+        max_polls: Optional[int] = None,
+        log_store: Optional[LogStore] = None,
+        tracker: Optional["ExecutionTracker"] = None,
+        process_id: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+        finished_data: Optional[Dict[str, Any]] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+        process_stats: Optional[ProcessStatsCollector] = None,
+    ):
+        """
+        Args:
+            yepcode_api: API instance used to poll the execution
+            execution_id: Id of the execution to track
+            events: onLog, onFinish and onError handlers
+            timeout: Seconds to keep polling before giving up with
+                YepCodeExecutionTimeoutError. Unlimited by default
+            max_polls: Maximum number of status polls before giving up
+            log_store: Retention policy for execution.logs. Keeps every log
+                by default
+            tracker: ExecutionTracker refreshing the status in bulk, instead
+                of a polling thread per execution
+            process_id: Id of the execution process, if known. Lets the
+                tracker find the execution in the bulk queries
+            poll_interval: Fixed seconds between status polls, instead of
+                the default backoff
+            finished_data: Data of an execution known to be finished, like
+                one run through execute-sync. It isn't polled and its logs
+                are fetched on first access
+            polling_strategy: Decides the wait between status polls.
+                AdaptivePolling by default
+            process_stats: Runtime statistics to add the execution to once
+                finished
+        """
+        super().__init__(
+            yepcode_api,
+            execution_id,
+            events,
+            timeout,
+            max_polls,
+            log_store,
+            poll_interval,
+            polling_strategy,
+            process_stats,
+        )
+        self.process_id = process_id
+        self._tracker = tracker
+        self._wakeup = threading.Event()
+        self._finished_data = finished_data
+        self._logs_pending = False
+        self._logs_pending_lock = threading.Lock()
+
+        self._future: Future = Future()
+        self._future.set_running_or_notify_cancel()
+        self._cancel_requested = False
+        self._start()
+
+    @property
+    def logs(self) -> List[Log]:
+        """Logs kept by the execution log retention policy."""
+        self._fetch_pending_logs()
+        return self._log_store.get_logs()
+
+    def init(self) -> None:
+        pass  # No longer needed as polling starts in __init__
+
+    def _start(self) -> None:
+        if self._finished_data is not None:
+            self._run_finished(self._finished_data)
+        elif self._tracker is not None:
+            self._tracker.track(self)
+        else:
+            self._start_polling_thread()
+
+    def _start_polling_thread(self) -> None:
+        threading.Thread(
+            target=self._run_polling,
+            name=f"yepcode-execution-{self.id}",
+            daemon=True,
+        ).start()
+
+    def _run_finished(self, execution_data: Dict[str, Any]) -> None:
+        self.is_polling = False
+        self._logs_pending = self.id is not None
+        try:
+            self._update_from_execution_data(execution_data)
+            self._finish(execution_data)
+            self._emit_final_event()
+        except BaseException as error:
+            self._set_done(error)
+        else:
+            self._set_done()
+
+    def _fetch_pending_logs(self) -> None:
+        """Fetch the logs of an execution created already finished."""
+        if not self._logs_pending:
+            return
+        with self._logs_pending_lock:
+            # Retried on next access if the API is throttling us
+            if self._logs_pending and self._poll_logs():
+                self._logs_pending = False
+                self._log_store.finish()
+
+    def _emit_final_event(self) -> None:
+        event_name, event_arg = self._get_final_event()
+        if handler := self.events.get(event_name):
+            handler(event_arg)
+
+    def _run_polling(self) -> None:
+        try:
+            self._poll()
+        except BaseException as error:
+            self._set_done(error)
+        else:
+            self._set_done()
+
+    def _wake(self) -> None:
+        """Poll the status right away instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    def _set_done(self, error: Optional[BaseException] = None) -> None:
+        self.is_polling = False
+        try:
+            self._record_stats()
+            self._log_store.finish()
+        finally:
+            # Resolve the future first: log consumers check it once the
+            # stream ends
+            if error is None:
+                self._future.set_result(None)
+            else:
+                self._future.set_exception(error)
+            self._end_log_stream()
+
+    def _end_log_stream(self) -> None:
+        for log_queue in self._close_logs():
+            try:
+                log_queue.put_nowait(_LOGS_END)
+            except queue.Full:
+                pass  # The consumer stops once it drains the queue
+
+    def _publish_log(self, log_queue: queue.Queue, log: Log) -> None:
+        # Block while the consumer is behind, unless it stops consuming
+        while log_queue in self._log_subscribers:
+            try:
+                log_queue.put(log, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def iter_logs(self, max_buffer: int = 1000) -> Iterator[Log]:
+        """
+        Iterate over the execution logs as they arrive, finishing once the
+        execution is done.
+
+        Starts with the logs already kept by the execution (see the
+        logRetention run option). When the consumer falls more than
+        max_buffer logs behind, polling waits for it to catch up.
+
+        Raises the polling error, if any, once the logs are exhausted.
+        """
+        self._fetch_pending_logs()
+        log_queue: queue.Queue = queue.Queue(maxsize=max_buffer)
+        try:
+            yield from self._subscribe_logs(log_queue)
+            while not (self._logs_closed and log_queue.empty()):
+                log = log_queue.get()
+                if log is _LOGS_END:
+                    break
+                yield log
+        finally:
+            self._unsubscribe_logs(log_queue)
+
+        if error := self._future.exception(0):
+            raise error
+
+    def done(self) -> bool:
+        """Return True once the execution has finished and events have been emitted."""
+        return self._future.done()
+
+    def wait_for_done(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until the execution finishes.
+
+        Args:
+            timeout: Maximum number of seconds to wait. Raises
+                concurrent.futures.TimeoutError if exceeded; the execution
+                keeps being tracked.
+        """
+        self._future.result(timeout)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the execution to finish and return its return value.
+
+        Raises:
+            YepCodeExecutionError: If the execution ended with a failed status
+            concurrent.futures.TimeoutError: If timeout seconds elapse first
+        """
+        self.wait_for_done(timeout)
+        return self._get_result()
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Wait for the execution and return the error result() would raise, if any."""
+        if error := self._future.exception(timeout):
+            return error
+        if self._is_failed(self.status):
+            return YepCodeExecutionError(self)
+        return None
+
+    def add_done_callback(self, fn: Callable[["Execution"], Any]) -> None:
+        """Call fn with this execution once it's done (immediately if it already is)."""
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def cancel(self) -> bool:
+        """
+        Kill the execution. Returns False if it had already finished.
+        """
+        if self.done():
+            return False
+        self.kill()
+        self._cancel_requested = True
+        return True
+
+    def cancelled(self) -> bool:
+        return self._cancel_requested and self.status == ExecutionStatus.KILLED
+
+    def _fetch_logs(self) -> List[Log]:
+        """Fetch the logs added since the previous call, oldest first."""
+        logs: List[Log] = []
+
+        while True:
+            response = self.yepcode_api.get_execution_logs(
+                self.id, self._get_logs_page_params()
+            )
+            logs.extend(self._consume_logs_page(response))
+
+            if not response.get("hasNextPage"):
+                break
+
+        return self._sort_logs(logs)
+
+    def _poll_logs(self) -> bool:
+        """
+        Fetch and emit the new logs. Returns False, keeping the logs cursor,
+        if the API is throttling us.
+        """
+        cursor = self._log_page, self._log_page_offset
+        try:
+            logs = self._fetch_logs()
+        except Exception as error:
+            if not self._is_throttled(error):
+                raise error
+            self._log_page, self._log_page_offset = cursor
+            return False
+        new_logs, subscribers = self._store_new_logs(logs)
+        for log in new_logs:
+            if on_log := self.events.get("onLog"):
+                on_log(log)
+            for log_queue in subscribers:
+                self._publish_log(log_queue, log)
+        return True
+
+    def _fetch_execution_data(self) -> Optional[Dict[str, Any]]:
+        """Fetch the execution status, or None if the API is throttling us."""
+        try:
+            return self.yepcode_api.get_execution(self.id)
+        except Exception as error:
+            if not self._is_throttled(error):
+                raise error
+            return None
+
+    def _poll(self) -> None:
+        self.is_polling = True
+        self._start_polling_deadline()
+        try:
+            while True:
+                if execution_data := self._fetch_execution_data():
+                    self._update_from_execution_data(execution_data)
+
+                    # Throttled log rounds are retried, up to the final logs
+                    logs_polled = not self._should_poll_logs() or self._poll_logs()
+
+                    if self._is_done(self.status) and logs_polled:
+                        break
+
+                self.poll_attempts += 1
+                if self._wakeup.wait(self._get_next_poll_delay()):
+                    self._wakeup.clear()
+
+            self._record_duration()
+            self._finish(execution_data)
+            self._emit_final_event()
+        finally:
+            self.is_polling = False
+
     def kill(self) -> None:
         try:
             self.yepcode_api.kill_execution(self.id)
@@ -167,6 +647,14 @@ class Execution:
                 yepcode_api=self.yepcode_api,
                 execution_id=execution_id,
                 events=self.events,
+                timeout=self.timeout,
+                max_polls=self.max_polls,
+                log_store=self._log_store.empty_copy(),
+                tracker=self._tracker,
+                process_id=self.process_id,
+                poll_interval=self.poll_interval,
+                polling_strategy=self.polling_strategy,
+                process_stats=self.process_stats,
             )
         except Exception as error:
             if getattr(error, "status", None) == 404:
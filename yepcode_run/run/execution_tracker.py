@@ -0,0 +1,190 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from ..api.yepcode_api import YepCodeApi
+from .execution import Execution, YepCodeExecutionTimeoutError
+
+
+class ExecutionTracker:
+    """
+    Track many executions from a single background thread.
+
+    Instead of every Execution polling ``GET /executions/{id}`` on its own,
+    tracked executions are refreshed in bulk with one paginated
+    ``get_executions`` query per process, filtered to the time window they
+    were started in. Only once an execution reaches a terminal status are its
+    details and logs fetched by id, from a small pool of worker threads, and
+    its handle resolved.
+
+    Executions that don't show up in the bulk results (or whose process is
+    unknown) are polled by id, so no handle is left unresolved.
+    """
+
+    PAGE_LIMIT = 100
+    # Margin for clock skew between the SDK host and the API
+    WINDOW_MARGIN = timedelta(minutes=5)
+
+    def __init__(
+        self,
+        yepcode_api: YepCodeApi,
+        poll_interval: float = 1.0,
+        max_workers: int = 8,
+    ):
+        """
+        Args:
+            yepcode_api: API instance used to query the executions
+            poll_interval: Seconds between bulk status refreshes
+            max_workers: Threads used to fetch the details and logs of
+                finished executions
+        """
+        self.yepcode_api = yepcode_api
+        self.poll_interval = poll_interval
+        self._executions: Dict[str, Execution] = {}
+        self._tracked_since: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._finishers = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="yepcode-tracker"
+        )
+
+    def track(self, execution: Execution) -> None:
+        """Start tracking an execution until it finishes."""
+        if self._closed.is_set():
+            raise RuntimeError("ExecutionTracker is closed")
+        execution._start_polling_deadline()
+        with self._lock:
+            self._executions[execution.id] = execution
+            self._tracked_since[execution.id] = datetime.now(timezone.utc)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="yepcode-execution-tracker", daemon=True
+                )
+                self._thread.start()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._executions)
+
+    def close(self) -> None:
+        """
+        Stop the tracker. Executions still running are handed over to their
+        own polling threads.
+        """
+        self._closed.set()
+        with self._lock:
+            remaining = list(self._executions.values())
+            self._executions.clear()
+            self._tracked_since.clear()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._finishers.shutdown(wait=True)
+        for execution in remaining:
+            execution._start_polling_thread()
+
+    def __enter__(self) -> "ExecutionTracker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            with self._lock:
+                if not self._executions:
+                    self._thread = None
+                    return
+                executions = dict(self._executions)
+                since = min(self._tracked_since.values())
+
+            retry_after = self._refresh(executions, since)
+            self._closed.wait(max(self.poll_interval, retry_after or 0))
+
+    def _refresh(
+        self, executions: Dict[str, Execution], since: datetime
+    ) -> Optional[float]:
+        """
+        Refresh the status of the executions. Returns the seconds to wait
+        if the API asked to slow down.
+        """
+        by_process: Dict[Optional[str], List[str]] = {}
+        for execution in executions.values():
+            by_process.setdefault(execution.process_id, []).append(execution.id)
+
+        found: Dict[str, Dict[str, Any]] = {}
+        for process_id, execution_ids in by_process.items():
+            if process_id is None:
+                continue
+            try:
+                found.update(self._fetch_executions(process_id, execution_ids, since))
+            except Exception as error:
+                if getattr(error, "status", None) in (429, 503):
+                    # Polling by id would only make it worse: skip this round
+                    return getattr(error, "retry_after", None)
+                # Otherwise fall back to per-id polling for this round
+
+        for execution_id, execution in executions.items():
+            execution_data = found.get(execution_id)
+            if execution_data is None:
+                try:
+                    execution_data = self.yepcode_api.get_execution(execution_id)
+                except Exception as error:
+                    if getattr(error, "status", None) in (429, 503):
+                        return getattr(error, "retry_after", None)
+                    self._resolve(execution, error)
+                    continue
+            self._update(execution, execution_data)
+        return None
+
+    def _fetch_executions(
+        self, process_id: str, execution_ids: List[str], since: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """Page through the executions of a process until all ids are found."""
+        pending = set(execution_ids)
+        found: Dict[str, Dict[str, Any]] = {}
+        page = 0
+
+        while pending:
+            response = self.yepcode_api.get_executions(
+                {
+                    "processId": process_id,
+                    "from": (since - self.WINDOW_MARGIN).replace(tzinfo=None),
+                    "page": page,
+                    "limit": self.PAGE_LIMIT,
+                }
+            )
+            for execution_data in response.get("data") or []:
+                if execution_data.get("id") in pending:
+                    pending.discard(execution_data["id"])
+                    found[execution_data["id"]] = execution_data
+            if not response.get("hasNextPage"):
+                break
+            page += 1
+
+        return found
+
+    def _update(self, execution: Execution, execution_data: Dict[str, Any]) -> None:
+        execution._update_from_execution_data(execution_data)
+        if execution._is_done(execution.status):
+            self._untrack(execution)
+            # Final details, logs and events are fetched by the execution
+            self._finishers.submit(execution._run_polling)
+            return
+
+        execution.poll_attempts += 1
+        try:
+            execution._get_next_poll_delay()
+        except YepCodeExecutionTimeoutError as error:
+            self._resolve(execution, error)
+
+    def _resolve(self, execution: Execution, error: BaseException) -> None:
+        self._untrack(execution)
+        execution._set_done(error)
+
+    def _untrack(self, execution: Execution) -> None:
+        with self._lock:
+            self._executions.pop(execution.id, None)
+            self._tracked_since.pop(execution.id, None)
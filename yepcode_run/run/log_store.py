@@ -0,0 +1,167 @@
+import json
+import os
+import tempfile
+import threading
+import weakref
+from collections import deque
+from dataclasses import asdict
+from typing import Iterable, List, Optional, TextIO, Union
+
+from ..api.types import Log
+
+
+class LogStore:
+    """
+    Retention policy for the logs received by an execution.
+
+    Event handlers always see every log line; the store only decides which
+    ones are kept in Execution.logs afterwards. The base class keeps them all.
+    """
+
+    def __init__(self):
+        self._logs: List[Log] = []
+
+    def append(self, log: Log) -> None:
+        self._logs.append(log)
+
+    def get_logs(self) -> List[Log]:
+        return self._logs
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+    def finish(self) -> None:
+        """Called once the execution is done and no more logs are expected."""
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def empty_copy(self) -> "LogStore":
+        """
+        A new, empty store with the same retention policy, ie: for a rerun.
+        Subclasses taking constructor arguments must override it.
+        """
+        return type(self)()
+
+    @staticmethod
+    def from_option(
+        retention: Union[None, str, int, "LogStore"] = None
+    ) -> "LogStore":
+        """
+        Build a store from the ``logRetention`` run option:
+
+        - ``None`` or ``"all"``: keep every log (default)
+        - ``int``: keep only the last N logs
+        - ``"errors"``: keep only ERROR and WARN logs
+        - ``"none"``: don't keep any log, only stream them to onLog
+        - ``"file"``: spill logs to a temporary file instead of memory
+        - a LogStore instance, used as is
+        """
+        if isinstance(retention, LogStore):
+            return retention
+        if retention is None or retention == "all":
+            return LogStore()
+        if isinstance(retention, int) and not isinstance(retention, bool):
+            return RingLogStore(retention)
+        if retention == "errors":
+            return LevelLogStore()
+        if retention == "none":
+            return NullLogStore()
+        if retention == "file":
+            return FileLogStore()
+        raise ValueError(f"Invalid logRetention value: {retention}")
+
+
+class RingLogStore(LogStore):
+    """Keep only the last max_logs logs."""
+
+    def __init__(self, max_logs: int):
+        if max_logs < 1:
+            raise ValueError("max_logs must be a positive number")
+        self._logs = deque(maxlen=max_logs)
+
+    def empty_copy(self) -> "RingLogStore":
+        return RingLogStore(self._logs.maxlen)
+
+    def get_logs(self) -> List[Log]:
+        return list(self._logs)
+
+
+class LevelLogStore(LogStore):
+    """Keep only the logs with the given levels."""
+
+    def __init__(self, levels: Iterable[str] = ("ERROR", "WARN")):
+        super().__init__()
+        self.levels = {level.upper() for level in levels}
+
+    def empty_copy(self) -> "LevelLogStore":
+        return LevelLogStore(self.levels)
+
+    def append(self, log: Log) -> None:
+        if (log.level or "").upper() in self.levels:
+            self._logs.append(log)
+
+
+class NullLogStore(LogStore):
+    """Don't keep any log."""
+
+    def append(self, log: Log) -> None:
+        pass
+
+
+class FileLogStore(LogStore):
+    """
+    Spill logs to a temporary JSON lines file, which is removed when the
+    store is closed or garbage collected. get_logs() reads them back.
+
+    The file is only kept open while logs are being appended: finish(),
+    called once the execution is done, releases it.
+    """
+
+    def __init__(self, dir: Optional[str] = None):
+        self.dir = dir
+        fd, self.path = tempfile.mkstemp(
+            prefix="yepcode-logs-", suffix=".jsonl", dir=dir
+        )
+        self._file: Optional[TextIO] = os.fdopen(fd, "w", encoding="utf-8")
+        self._count = 0
+        self._lock = threading.Lock()
+        self._remove_file = weakref.finalize(self, FileLogStore._remove, self.path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def append(self, log: Log) -> None:
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(json.dumps(asdict(log)) + "\n")
+            self._count += 1
+
+    def get_logs(self) -> List[Log]:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            with open(self.path, encoding="utf-8") as file:
+                return [Log(**json.loads(line)) for line in file]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def empty_copy(self) -> "FileLogStore":
+        return FileLogStore(self.dir)
+
+    def finish(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def close(self) -> None:
+        self.finish()
+        self._remove_file()
@@ -0,0 +1,128 @@
+import random
+import threading
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .process_stats import ProcessStatsCollector
+
+
+class PollingStrategy:
+    """
+    Decides how long an execution waits between status polls.
+
+    Subclasses implement get_delay(). Strategies are shared by every
+    execution of a YepCodeRun, so they may learn from finished executions
+    through record_duration().
+    """
+
+    def get_delay(self, key: Optional[str], attempt: int, elapsed: float) -> float:
+        """
+        Args:
+            key: Process of the execution, if known
+            attempt: Number of polls done so far
+            elapsed: Seconds since the execution started being polled
+
+        Returns:
+            Seconds to wait before the next poll
+        """
+        raise NotImplementedError
+
+    def record_duration(self, key: Optional[str], duration: float) -> None:
+        """Called with the seconds an execution of the key process took."""
+
+
+class FixedPolling(PollingStrategy):
+    """Poll every interval seconds."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+
+    def get_delay(self, key: Optional[str], attempt: int, elapsed: float) -> float:
+        return self.interval
+
+
+class LadderPolling(PollingStrategy):
+    """Previous default: 0.25s for 4 polls, 0.5s for 8 more, then every second."""
+
+    def get_delay(self, key: Optional[str], attempt: int, elapsed: float) -> float:
+        if attempt < 4:
+            return 0.25
+        elif attempt < 12:
+            return 0.5
+        return 1.0
+
+
+class AdaptivePolling(PollingStrategy):
+    """
+    Exponential backoff with jitter that learns how long each process takes.
+
+    The delay grows with the time already waited (each poll waits
+    ``factor - 1`` times the time elapsed so far), between min_delay and
+    max_delay, so short runs resolve fast and long runs cost few requests.
+    When the process has run before, the first poll waits until close to its
+    usual duration (its median one, if given the ProcessStatsCollector of the
+    runner) and the backoff starts from there. Every delay is spread
+    by +/- jitter to avoid synchronized bursts of polls.
+    """
+
+    def __init__(
+        self,
+        min_delay: float = 0.2,
+        max_delay: float = 10.0,
+        factor: float = 1.5,
+        jitter: float = 0.2,
+        learning_rate: float = 0.3,
+        stats: Optional["ProcessStatsCollector"] = None,
+    ):
+        """
+        Args:
+            min_delay: Shortest wait between polls, in seconds
+            max_delay: Longest wait between polls, in seconds
+            factor: Growth of the delay from one poll to the next
+            jitter: Fraction of the delay randomly added or removed
+            learning_rate: Weight of the last duration in the moving
+                average of each process duration
+            stats: Runtime statistics to take the expected duration of each
+                process from, before the moving average
+        """
+        if min_delay <= 0 or max_delay < min_delay:
+            raise ValueError("0 < min_delay <= max_delay is required")
+        if factor <= 1:
+            raise ValueError("factor must be greater than 1")
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self.learning_rate = learning_rate
+        self.stats = stats
+        self._durations: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get_expected_duration(self, key: Optional[str]) -> Optional[float]:
+        if self.stats is not None and (
+            duration := self.stats.get_expected_duration(key)
+        ) is not None:
+            return duration
+        with self._lock:
+            return self._durations.get(key) if key else None
+
+    def get_delay(self, key: Optional[str], attempt: int, elapsed: float) -> float:
+        expected = self.get_expected_duration(key) or 0.0
+        overdue = elapsed - expected
+        if overdue < 0:
+            delay = -overdue
+        else:
+            delay = overdue * (self.factor - 1)
+        delay = min(max(delay, self.min_delay), self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def record_duration(self, key: Optional[str], duration: float) -> None:
+        if not key:
+            return
+        with self._lock:
+            previous = self._durations.get(key)
+            self._durations[key] = (
+                duration
+                if previous is None
+                else previous + self.learning_rate * (duration - previous)
+            )
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+from ..utils.language_detector import LanguageDetector
+
+
+@dataclass
+class PrewarmedProcess:
+    """Warm-up state of the process of a snippet passed to YepCodeRun.prewarm()."""
+
+    code: str
+    language: str
+    manifest: Optional[Dict[str, Any]] = None
+    parameters: Optional[Dict[str, Any]] = None
+    process_id: Optional[str] = None
+    error: Optional[BaseException] = None
+    done: bool = False
+
+    @property
+    def ready(self) -> bool:
+        """Whether the process exists (and ran its warm-up execution, if asked)."""
+        return self.done and self.error is None
+
+    @staticmethod
+    def from_snippet(snippet: Union[str, Dict[str, Any]]) -> "PrewarmedProcess":
+        """
+        Args:
+            snippet: Source code, or a dict with its ``code`` and optionally
+                its ``language``, ``manifest`` and warm-up ``parameters``
+        """
+        if isinstance(snippet, str):
+            snippet = {"code": snippet}
+        code = snippet.get("code")
+        if not code:
+            raise ValueError("Every snippet to prewarm requires its code")
+        return PrewarmedProcess(
+            code=code,
+            language=snippet.get("language") or LanguageDetector.detect_language(code),
+            manifest=snippet.get("manifest"),
+            parameters=snippet.get("parameters"),
+        )
+
+    def get_run_options(self) -> Dict[str, Any]:
+        """Options of the warm-up execution."""
+        return {
+            "language": self.language,
+            "manifest": self.manifest,
+            "parameters": self.parameters or {},
+            "memoize": False,
+        }
@@ -0,0 +1,236 @@
+import hashlib
+import json
+import os
+import tempfile
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+
+class ProcessCache:
+    """
+    LRU map from code hash + manifest + language to the id of the process
+    running that code, so repeated runs don't look the process up again.
+
+    Kept in memory by default. When a path is given, entries are loaded from
+    and saved to that JSON file, so they survive restarts.
+    """
+
+    def __init__(self, max_size: int = 1024, path: Optional[str] = None):
+        """
+        Args:
+            max_size: Maximum number of processes to remember
+            path: JSON file to persist the cache to
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive number")
+        self.max_size = max_size
+        self.path = path
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        if path:
+            self._load()
+
+    @staticmethod
+    def get_key(
+        code: str,
+        language: str,
+        manifest: Optional[Dict[str, Any]] = None,
+        team_id: Optional[str] = None,
+    ) -> str:
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "code": code,
+                    "language": language,
+                    "manifest": manifest,
+                    "team": team_id,
+                },
+                sort_keys=True,
+                default=repr,
+            ).encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            process_id = self._entries.get(key)
+            if process_id is not None:
+                self._entries.move_to_end(key)
+            return process_id
+
+    def set(self, key: str, process_id: str) -> None:
+        with self._lock:
+            self._entries[key] = process_id
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._save()
+
+    def invalidate_process(self, process_id: str) -> None:
+        """Forget every entry pointing to the given process."""
+        with self._lock:
+            keys = [key for key, value in self._entries.items() if value == process_id]
+            for key in keys:
+                del self._entries[key]
+            if keys:
+                self._save()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return  # Missing or corrupted cache files start empty
+        if isinstance(entries, dict):
+            for key, process_id in list(entries.items())[-self.max_size :]:
+                self._entries[key] = process_id
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so readers never see partial data
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".yepcode-processes-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(dict(self._entries), file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def from_option(
+        process_cache: Union[None, bool, str, "ProcessCache"] = None
+    ) -> Optional["ProcessCache"]:
+        """
+        Build a cache from the ``process_cache`` argument of YepCodeRun:
+
+        - ``None`` or ``True``: in-memory cache (default)
+        - ``False``: no cache, look the process up on every run
+        - ``str``: cache persisted to the given JSON file
+        - a ProcessCache instance, like a SqliteProcessRegistry, used as is
+        """
+        if isinstance(process_cache, ProcessCache):
+            return process_cache
+        if process_cache is None or process_cache is True:
+            return ProcessCache()
+        if process_cache is False:
+            return None
+        if isinstance(process_cache, str):
+            return ProcessCache(path=process_cache)
+        raise ValueError(f"Invalid process_cache value: {process_cache}")
+
+
+class SqliteProcessRegistry(ProcessCache):
+    """
+    Process cache backed by a SQLite database shared by every process on
+    the host, so workers started cold find the processes created by the
+    others. An in-memory LRU sits in front of the database.
+
+    SQLite handles the locking between processes; the database uses WAL
+    journaling so readers don't block the writer.
+    """
+
+    DB_NAME = "processes.sqlite3"
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = 1024):
+        """
+        Args:
+            cache_dir: Directory of the registry database. Defaults to
+                $YEPCODE_CACHE_DIR, or yepcode-run under the user cache dir
+            max_size: Maximum number of processes kept in memory
+        """
+        super().__init__(max_size=max_size)
+        self.cache_dir = cache_dir or self.get_default_cache_dir()
+        self.db_path = os.path.join(self.cache_dir, self.DB_NAME)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        with self._lock:
+            self._execute(
+                "CREATE TABLE IF NOT EXISTS processes ("
+                "key TEXT PRIMARY KEY, process_id TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def get_default_cache_dir() -> str:
+        if cache_dir := os.getenv("YEPCODE_CACHE_DIR"):
+            return cache_dir
+        base_dir = os.getenv("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        return os.path.join(base_dir, "yepcode-run")
+
+    def get(self, key: str) -> Optional[str]:
+        if process_id := super().get(key):
+            return process_id
+        with self._lock:
+            row = self._execute(
+                "SELECT process_id FROM processes WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        super().set(key, row[0])
+        return row[0]
+
+    def set(self, key: str, process_id: str) -> None:
+        super().set(key, process_id)
+        with self._lock:
+            self._execute(
+                "INSERT INTO processes (key, process_id, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "process_id = excluded.process_id, updated_at = excluded.updated_at",
+                (key, process_id, time.time()),
+            )
+
+    def invalidate(self, key: str) -> None:
+        super().invalidate(key)
+        with self._lock:
+            self._execute("DELETE FROM processes WHERE key = ?", (key,))
+
+    def invalidate_process(self, process_id: str) -> None:
+        super().invalidate_process(process_id)
+        with self._lock:
+            self._execute("DELETE FROM processes WHERE process_id = ?", (process_id,))
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._execute("DELETE FROM processes")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # Connections can't be shared with forked workers: reopen in children
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.db_path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        return self._get_connection().execute(sql, params)
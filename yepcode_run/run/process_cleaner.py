@@ -0,0 +1,166 @@
+import atexit
+import threading
+import time
+import weakref
+from typing import Callable, Dict, List, Optional, Set
+
+from ..api.yepcode_api import YepCodeApi
+
+# Cleaners not closed yet, closed on interpreter exit. Weak references, so
+# that unused cleaners can still be garbage collected
+_open_cleaners: "weakref.WeakSet[ProcessCleaner]" = weakref.WeakSet()
+
+
+def _close_open_cleaners() -> None:
+    for cleaner in list(_open_cleaners):
+        cleaner.close()
+
+
+atexit.register(_close_open_cleaners)
+
+
+class ProcessCleaner:
+    """
+    Deferred, batched deletion of the processes of removeOnDone runs.
+
+    Instead of deleting the process from the completion handler of each run,
+    runs release it here once done. A process is deleted only after it has
+    been unreferenced for grace_period seconds, so the next identical run
+    can reuse it, and never while a run is using it. A background thread
+    deletes every process due each interval seconds, in one batch.
+
+    Pending deletions are flushed by close(), which is also called on
+    interpreter exit for the cleaners still open.
+    """
+
+    def __init__(
+        self,
+        yepcode_api: YepCodeApi,
+        grace_period: float = 30.0,
+        interval: float = 5.0,
+    ):
+        """
+        Args:
+            yepcode_api: API instance used to delete the processes
+            grace_period: Seconds a process is kept after its last run, in
+                case another run needs it
+            interval: Seconds between deletion batches
+        """
+        self.yepcode_api = yepcode_api
+        self.grace_period = grace_period
+        self.interval = interval
+        self._in_use: Dict[str, int] = {}
+        self._marked: Set[str] = set()
+        # Unreferenced marked processes, with the time they can be deleted at
+        self._pending: Dict[str, float] = {}
+        self._delete_callbacks: List[Callable[[str], None]] = []
+        # Processes whose DELETE request is in flight
+        self._deleting: Set[str] = set()
+        self._lock = threading.Lock()
+        self._deleted = threading.Condition(self._lock)
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        _open_cleaners.add(self)
+
+    def acquire(self, process_id: str) -> None:
+        """
+        Mark a process as used by a run, cancelling its pending deletion.
+        Waits for the deletion of the process if it's already in flight, so
+        that the run finds it deleted rather than loses it while running.
+        """
+        with self._lock:
+            while process_id in self._deleting:
+                self._deleted.wait()
+            self._in_use[process_id] = self._in_use.get(process_id, 0) + 1
+            self._pending.pop(process_id, None)
+
+    def release(self, process_id: str, remove: bool = False) -> None:
+        """
+        Mark a run as done with a process. If remove is True, the process
+        is deleted once no run uses it for grace_period seconds.
+        """
+        with self._lock:
+            in_use = self._in_use.get(process_id, 0) - 1
+            if in_use > 0:
+                self._in_use[process_id] = in_use
+            else:
+                self._in_use.pop(process_id, None)
+            if remove:
+                self._marked.add(process_id)
+            if in_use > 0 or process_id not in self._marked:
+                return
+            self._pending[process_id] = time.monotonic() + self.grace_period
+            if self._thread is None and not self._closed.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name="yepcode-process-cleaner", daemon=True
+                )
+                self._thread.start()
+
+    def add_delete_callback(self, fn: Callable[[str], None]) -> None:
+        """Call fn with the id of each process right before deleting it."""
+        self._delete_callbacks.append(fn)
+
+    def __len__(self) -> int:
+        """Number of processes waiting to be deleted."""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> None:
+        """Delete every pending process now, skipping the grace period."""
+        self._delete(self._pop_due(force=True))
+
+    def close(self) -> None:
+        """Stop the background thread and flush the pending deletions."""
+        self._closed.set()
+        _open_cleaners.discard(self)
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+    def __enter__(self) -> "ProcessCleaner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.interval):
+            self._delete(self._pop_due())
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+
+    def _pop_due(self, force: bool = False) -> List[str]:
+        now = time.monotonic()
+        with self._lock:
+            due = [
+                process_id
+                for process_id, deadline in self._pending.items()
+                if force or deadline <= now
+            ]
+            for process_id in due:
+                del self._pending[process_id]
+                self._marked.discard(process_id)
+            return due
+
+    def _delete(self, process_ids: List[str]) -> None:
+        for process_id in process_ids:
+            # Forget it first, so that no new run picks it up
+            for callback in self._delete_callbacks:
+                callback(process_id)
+            with self._lock:
+                # Acquired again since it was due
+                if self._in_use.get(process_id):
+                    continue
+                self._deleting.add(process_id)
+            try:
+                self.yepcode_api.delete_process(process_id)
+            except Exception:
+                pass  # Best effort: already deleted or the API is unavailable
+            finally:
+                with self._lock:
+                    self._deleting.discard(process_id)
+                    self._deleted.notify_all()
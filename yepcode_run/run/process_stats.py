@@ -0,0 +1,117 @@
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+
+@dataclass
+class ProcessStats:
+    """Runtime statistics of the last executions of a process."""
+
+    process_id: str
+    executions: int
+    failures: int
+    p50_duration: Optional[float] = None
+    p95_duration: Optional[float] = None
+    mean_log_lines: Optional[float] = None
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.executions if self.executions else 0.0
+
+
+@dataclass
+class _ExecutionSample:
+    duration: Optional[float]
+    failed: bool
+    log_lines: Optional[int]
+
+
+class ProcessStatsCollector:
+    """
+    Rolling runtime statistics per process id, over its last window
+    finished executions.
+
+    Durations come from the execution timeline (first event to the terminal
+    one), so they measure the time spent in YepCode rather than the polling
+    granularity.
+    """
+
+    def __init__(self, window: int = 100):
+        if window <= 0:
+            raise ValueError("window must be a positive number")
+        self.window = window
+        self._samples: Dict[str, Deque[_ExecutionSample]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        process_id: str,
+        duration: Optional[float],
+        failed: bool,
+        log_lines: Optional[int] = None,
+    ) -> None:
+        with self._lock:
+            samples = self._samples.setdefault(process_id, deque(maxlen=self.window))
+            samples.append(_ExecutionSample(duration, failed, log_lines))
+
+    def record_execution(self, execution: Any) -> None:
+        """Record a finished Execution or AsyncExecution. Others are ignored."""
+        if not execution.process_id or not execution.is_done():
+            return
+        self.record(
+            execution.process_id,
+            self.get_timeline_duration(execution.timeline),
+            execution._is_failed(execution.status),
+            None if getattr(execution, "_logs_pending", False) else execution.log_count,
+        )
+
+    @staticmethod
+    def get_timeline_duration(timeline: Optional[List[Any]]) -> Optional[float]:
+        """Seconds from the first to the last event of an execution timeline."""
+        if not timeline or len(timeline) < 2:
+            return None
+        try:
+            timestamps = [datetime.fromisoformat(event.timestamp) for event in timeline]
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (max(timestamps) - min(timestamps)).total_seconds())
+
+    def get(self, process_id: str) -> Optional[ProcessStats]:
+        with self._lock:
+            samples = list(self._samples.get(process_id) or [])
+        if not samples:
+            return None
+
+        durations = sorted(s.duration for s in samples if s.duration is not None)
+        log_lines = [s.log_lines for s in samples if s.log_lines is not None]
+        return ProcessStats(
+            process_id=process_id,
+            executions=len(samples),
+            failures=sum(1 for s in samples if s.failed),
+            p50_duration=self._percentile(durations, 50),
+            p95_duration=self._percentile(durations, 95),
+            mean_log_lines=sum(log_lines) / len(log_lines) if log_lines else None,
+        )
+
+    def get_all(self) -> Dict[str, ProcessStats]:
+        with self._lock:
+            process_ids = list(self._samples)
+        return {process_id: self.get(process_id) for process_id in process_ids}
+
+    def get_expected_duration(self, process_id: Optional[str]) -> Optional[float]:
+        """Median duration of the process executions, if known."""
+        if not process_id:
+            return None
+        stats = self.get(process_id)
+        return stats.p50_duration if stats else None
+
+    @staticmethod
+    def _percentile(values: List[float], percentile: float) -> Optional[float]:
+        # Nearest-rank percentile of sorted values
+        if not values:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(values)))
+        return values[rank - 1]
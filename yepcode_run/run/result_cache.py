@@ -0,0 +1,273 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Union
+
+
+@dataclass
+class CachedResult:
+    """Return value of a finished execution, as stored in a ResultCache."""
+
+    return_value: Any
+    execution_id: Optional[str] = None
+    process_id: Optional[str] = None
+    stored_at: float = 0.0
+
+    def get_age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class ResultCache:
+    """
+    Cache of the return values of runs, keyed by code, language, manifest
+    and parameters, for scripts that are pure functions of their parameters.
+
+    Results are fresh for ttl seconds. For stale_ttl more seconds they are
+    still returned, while the runner runs the code again in the background
+    to refresh them (stale-while-revalidate). Older ones are dropped.
+
+    Subclasses implement the storage: _load(), _store(), _delete(),
+    _clear() and __len__().
+    """
+
+    def __init__(self, ttl: float = 300.0, stale_ttl: float = 0.0, max_size: int = 1024):
+        """
+        Args:
+            ttl: Seconds a result is returned without running the code again
+            stale_ttl: Seconds after ttl a result is still returned while
+                it's refreshed in the background
+            max_size: Maximum number of results to keep. The least recently
+                used ones are evicted first
+        """
+        if ttl <= 0 or stale_ttl < 0:
+            raise ValueError("ttl must be positive and stale_ttl not negative")
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive number")
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+
+    @staticmethod
+    def get_key(
+        code: str,
+        language: str,
+        manifest: Optional[Dict[str, Any]] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        team_id: Optional[str] = None,
+    ) -> str:
+        # Canonical JSON: the same parameters in any order share a key
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "code": code,
+                    "language": language,
+                    "manifest": manifest,
+                    "parameters": parameters or {},
+                    "team": team_id,
+                },
+                sort_keys=True,
+                separators=(",", ":"),
+                default=repr,
+            ).encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """Return the cached result, fresh or stale, or None if there is none."""
+        result = self._load(key)
+        if result is None:
+            return None
+        if result.get_age() > self.ttl + self.stale_ttl:
+            self._delete(key)
+            return None
+        return result
+
+    def is_stale(self, result: CachedResult) -> bool:
+        return result.get_age() > self.ttl
+
+    def set(
+        self,
+        key: str,
+        return_value: Any,
+        execution_id: Optional[str] = None,
+        process_id: Optional[str] = None,
+    ) -> None:
+        self._store(
+            key,
+            CachedResult(
+                return_value=return_value,
+                execution_id=execution_id,
+                process_id=process_id,
+                stored_at=time.time(),
+            ),
+        )
+
+    def invalidate(self, key: str) -> None:
+        self._delete(key)
+
+    def clear(self) -> None:
+        self._clear()
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def _load(self, key: str) -> Optional[CachedResult]:
+        raise NotImplementedError
+
+    def _store(self, key: str, result: CachedResult) -> None:
+        raise NotImplementedError
+
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def _clear(self) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def from_option(
+        result_cache: Union[None, bool, str, "ResultCache"] = None
+    ) -> Optional["ResultCache"]:
+        """
+        Build a cache from the ``result_cache`` argument of YepCodeRun:
+
+        - ``None`` or ``False``: no cache, every run executes the code (default)
+        - ``True``: in-memory cache
+        - ``str``: cache persisted to files in the given directory
+        - a ResultCache instance, used as is
+        """
+        if isinstance(result_cache, ResultCache):
+            return result_cache
+        if result_cache is None or result_cache is False:
+            return None
+        if result_cache is True:
+            return MemoryResultCache()
+        if isinstance(result_cache, str):
+            return FileResultCache(result_cache)
+        raise ValueError(f"Invalid result_cache value: {result_cache}")
+
+
+class MemoryResultCache(ResultCache):
+    """ResultCache kept in memory, as an LRU."""
+
+    def __init__(self, ttl: float = 300.0, stale_ttl: float = 0.0, max_size: int = 1024):
+        super().__init__(ttl, stale_ttl, max_size)
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self, key: str) -> Optional[CachedResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def _store(self, key: str, result: CachedResult) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileResultCache(ResultCache):
+    """
+    ResultCache persisted as one JSON file per result in a directory, so
+    results survive restarts and are shared by the processes using it.
+    Return values must be JSON serializable, as they come from YepCode.
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: float = 300.0,
+        stale_ttl: float = 0.0,
+        max_size: int = 1024,
+    ):
+        super().__init__(ttl, stale_ttl, max_size)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._list_files())
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.SUFFIX}")
+
+    def _list_files(self):
+        try:
+            return [
+                os.path.join(self.directory, name)
+                for name in os.listdir(self.directory)
+                if name.endswith(self.SUFFIX)
+            ]
+        except OSError:
+            return []
+
+    def _load(self, key: str) -> Optional[CachedResult]:
+        path = self._get_path(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                result = CachedResult(**json.load(file))
+            os.utime(path)  # Recently used files are evicted last
+        except (OSError, ValueError, TypeError):
+            return None  # Missing, being replaced or corrupted
+        return result
+
+    def _store(self, key: str, result: CachedResult) -> None:
+        # Write to a temporary file first so readers never see partial data
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".yepcode-result-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(asdict(result), file)
+            os.replace(tmp_path, self._get_path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        files = self._list_files()
+        if len(files) <= self.max_size:
+            return
+        files.sort(key=self._get_mtime)
+        for path in files[: len(files) - self.max_size]:
+            self._remove(path)
+
+    @staticmethod
+    def _get_mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass  # Removed meanwhile by another process
+
+    def _delete(self, key: str) -> None:
+        self._remove(self._get_path(key))
+
+    def _clear(self) -> None:
+        for path in self._list_files():
+            self._remove(path)
@@ -1,118 +1,837 @@
 import hashlib
-from typing import Optional, Dict, Any
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Union, Iterable, Iterator, Callable, List
+
+import requests
 
 from ..api.api_manager import YepCodeApiManager
 from ..api.yepcode_api import YepCodeApi, YepCodeApiError
-from ..api.types import YepCodeApiConfig
+from ..api.types import YepCodeApiConfig, ExecutionStatus
 from ..utils.language_detector import LanguageDetector
-from .execution import Execution
+from ..utils.single_flight import SingleFlight
+from .execution import Execution, YepCodeExecutionTimeoutError
+from .execution_tracker import ExecutionTracker
+from .callback_listener import ExecutionCallbackListener
+from .process_cache import ProcessCache
+from .process_cleaner import ProcessCleaner
+from .polling import PollingStrategy, AdaptivePolling
+from .process_stats import ProcessStats, ProcessStatsCollector
+from .result_cache import ResultCache, CachedResult
+from .log_store import LogStore
+from .batch import BatchResult, iter_batch
+from .prewarm import PrewarmedProcess
 
 
-class YepCodeRun:
-    def __init__(self, config: Optional[YepCodeApiConfig] = None):
-        """Initialize YepCodeRun with optional configuration."""
-        self.yepcode_api = YepCodeApiManager.get_instance(config)
-        self.PROCESS_NAME_PREFIX = "yepcode-run-"
+class BaseYepCodeRun:
+    """Process naming and payload building shared by YepCodeRun and AsyncYepCodeRun."""
+
+    PROCESS_NAME_PREFIX = "yepcode-run-"
+    RUN_MODES = ("async", "sync", "auto")
+    # "auto" mode runs through execute-sync the processes whose median
+    # duration is known to be at most these seconds
+    AUTO_SYNC_MAX_DURATION = 5.0
+    # Execution ids claimed by the runs kept to look up lost sync executions
+    CLAIMED_EXECUTIONS_WINDOW = 10000
+
+    process_cache: Optional[ProcessCache] = None
+    process_stats: Optional[ProcessStatsCollector] = None
+    result_cache: Optional[ResultCache] = None
 
     def get_client_id(self) -> str:
-        return self._yepcode_api.get_client_id()
+        return self.yepcode_api.get_client_id()
 
     def get_team_id(self) -> str:
-        return self._yepcode_api.get_team_id()
+        return self.yepcode_api.get_team_id()
+
+    def get_process_stats(
+        self, process_id: Optional[str] = None
+    ) -> Union[ProcessStats, Dict[str, ProcessStats], None]:
+        """
+        Runtime statistics of the executions run or fetched by this runner.
+
+        Args:
+            process_id: Process to get the statistics of. All of them by default
+
+        Returns:
+            ProcessStats of the process (None if it hasn't finished any
+            execution yet), or a dict of them by process id
+        """
+        if process_id is None:
+            return self.process_stats.get_all()
+        return self.process_stats.get(process_id)
 
     def _get_process_slug(self, hash_value: str) -> str:
         """Generate a process slug from a hash value."""
         return f"{self.PROCESS_NAME_PREFIX}{hash_value}"
 
+    def _get_code_process_slug(self, code: str, language: str) -> str:
+        if not language or not code:
+            raise ValueError("language and code are required")
+        return self._get_process_slug(hashlib.sha256(code.encode()).hexdigest())
+
+    @staticmethod
+    def _get_create_process_data(
+        process_slug: str,
+        code: str,
+        language: str,
+        manifest: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "name": process_slug,
+            "script": {
+                "programmingLanguage": language.upper(),
+                "sourceCode": code,
+            },
+            "tags": ["yc-run"],
+            **(
+                {"manifest": manifest}
+                if manifest
+                else {
+                    "settings": {
+                        "dependencies": {
+                            "scopedToProcess": True,
+                            "autoDetect": True,
+                        }
+                    }
+                }
+            ),
+        }
+
+    @staticmethod
+    def _get_run_options(code: str, options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if options is None:
+            options = {}
+        return {
+            "language": options.get("language", LanguageDetector.detect_language(code)),
+            "remove_on_done": options.get("removeOnDone", False),
+            "manifest": options.get("manifest"),
+            "parameters": options.get("parameters", {}),
+            # "timeout" is given in milliseconds, like YepCodeApiConfig.timeout
+            "timeout": (
+                options["timeout"] / 1000 if options.get("timeout") is not None else None
+            ),
+            "max_polls": options.get("maxPolls"),
+            "mode": options.get("mode", "async"),
+        }
+
+    def _check_mode(self, mode: str) -> None:
+        if mode not in self.RUN_MODES:
+            raise ValueError(f"Invalid mode: {mode}. It must be one of {self.RUN_MODES}")
+
+    def _use_sync_mode(
+        self, mode: str, options: Dict[str, Any], process_id: Optional[str] = None
+    ) -> bool:
+        """
+        Whether to run through the execute-sync endpoint. In "auto" mode,
+        only for processes known to be short, when no log streaming or
+        callback completion is requested.
+        """
+        self._check_mode(mode)
+        if mode == "auto":
+            if options.get("onLog") or self.callback_listener:
+                return False
+            expected_duration = (
+                self.process_stats.get_expected_duration(process_id)
+                if self.process_stats is not None
+                else None
+            )
+            return (
+                expected_duration is not None
+                and expected_duration <= self.AUTO_SYNC_MAX_DURATION
+            )
+        return mode == "sync"
+
+    @staticmethod
+    def _get_sync_timeout(run_options: Dict[str, Any]) -> Optional[int]:
+        # The request lasts as long as the execution: use the run timeout
+        if run_options["timeout"] is None:
+            return None
+        return int(run_options["timeout"] * 1000)
+
+    @staticmethod
+    def _get_remaining_timeout(
+        run_options: Dict[str, Any], started_at: float
+    ) -> Optional[float]:
+        """Run timeout left after the time spent in the execute request."""
+        if run_options["timeout"] is None:
+            return None
+        return max(0.0, run_options["timeout"] - (time.monotonic() - started_at))
+
+    @staticmethod
+    def _check_sync_response(response: Dict[str, Any], process_id: str) -> None:
+        """
+        Raise for execute-sync responses that don't identify an execution.
+        Identified errors are tracked like async executions.
+        """
+        if response["executionId"]:
+            return
+        if response["status"] < 400:
+            raise YepCodeApiError(
+                f"Endpoint POST processes/{process_id}/execute-sync didn't identify "
+                f"the execution: missing {YepCodeApi.EXECUTION_ID_HEADER} header",
+                response["status"],
+            )
+        data = response["data"]
+        message = data.get("message") if isinstance(data, dict) else data
+        raise YepCodeApiError(
+            f"HTTP error {response['status']} in endpoint POST processes/{process_id}/execute-sync: {message}",
+            response["status"],
+        )
+
+    @staticmethod
+    def _get_sync_finished_data(
+        execution_response: Dict[str, Any], process_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Execution data of a successful execute-sync call, None otherwise."""
+        if execution_response.get("status", 500) >= 400:
+            return None
+        return {
+            "id": execution_response["executionId"],
+            "processId": process_id,
+            "status": "FINISHED",
+            "returnValue": json.dumps(execution_response["data"]),
+        }
+
+    def _get_cached_process_id(
+        self, code: str, language: str, manifest: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        if self.process_cache is None:
+            return None
+        return self.process_cache.get(self._get_process_cache_key(code, language, manifest))
+
+    def _cache_process_id(
+        self,
+        code: str,
+        language: str,
+        manifest: Optional[Dict[str, Any]],
+        process_id: str,
+    ) -> None:
+        if self.process_cache is not None:
+            self.process_cache.set(
+                self._get_process_cache_key(code, language, manifest), process_id
+            )
+
+    def _get_process_cache_key(
+        self, code: str, language: str, manifest: Optional[Dict[str, Any]]
+    ) -> str:
+        # Processes belong to a team: keep caches shared by teams apart
+        return ProcessCache.get_key(
+            code, language, manifest, getattr(self.yepcode_api, "team_id", None)
+        )
+
+    def _forget_process(self, process_id: str) -> bool:
+        """Drop a process from the cache. Returns whether there is a cache."""
+        if self.process_cache is None:
+            return False
+        self.process_cache.invalidate_process(process_id)
+        return True
+
+    def _get_result_key(
+        self, code: str, run_options: Dict[str, Any], options: Dict[str, Any]
+    ) -> Optional[str]:
+        """Key of the run in the result cache, or None if it isn't memoized."""
+        if self.result_cache is None or not options.get("memoize", True):
+            return None
+        return ResultCache.get_key(
+            code,
+            run_options["language"],
+            run_options["manifest"],
+            run_options["parameters"],
+            getattr(self.yepcode_api, "team_id", None),
+        )
+
+    @staticmethod
+    def _get_cached_execution_data(result: CachedResult) -> Dict[str, Any]:
+        return {
+            "id": result.execution_id,
+            "processId": result.process_id,
+            "status": "FINISHED",
+            "returnValue": json.dumps(result.return_value),
+        }
+
+    def _caching_result(
+        self,
+        result_key: str,
+        execution_id: Optional[str],
+        process_id: str,
+        on_finish: Optional[Callable[[Any], Any]],
+    ) -> Callable[[Any], Any]:
+        """Wrap an onFinish handler to store the return value first."""
+
+        def wrapped_on_finish(return_value):
+            self.result_cache.set(result_key, return_value, execution_id, process_id)
+            if on_finish:
+                return on_finish(return_value)
+
+        return wrapped_on_finish
+
+    def _cache_result(self, result_key: str, execution: Any) -> None:
+        if execution.status == ExecutionStatus.FINISHED:
+            self.result_cache.set(
+                result_key, execution.return_value, execution.id, execution.process_id
+            )
+
+    @staticmethod
+    def _get_revalidation_options(options: Dict[str, Any]) -> Dict[str, Any]:
+        # Background refreshes neither call the handlers nor read the cache
+        return {
+            **{
+                key: value
+                for key, value in options.items()
+                if key not in ("onLog", "onFinish", "onError")
+            },
+            "memoize": False,
+        }
+
+    def _get_prewarm_items(
+        self, snippets: Iterable[Union[str, Dict[str, Any]]]
+    ) -> List[PrewarmedProcess]:
+        # Runs find the prewarmed processes through the process cache
+        if self.process_cache is None:
+            raise ValueError("prewarm() requires the process cache")
+        return [PrewarmedProcess.from_snippet(snippet) for snippet in snippets]
+
+    @staticmethod
+    def _get_batch_item_options(
+        options: Dict[str, Any], parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # The process is removed once, after the whole batch. Items run in
+        # async mode, as a sync run would block the batch until it finishes
+        item_options = {**options, "parameters": parameters, "mode": "async"}
+        item_options.pop("removeOnDone", None)
+        return item_options
+
+    @staticmethod
+    def _with_callback_url(options: Dict[str, Any], callback_url: str) -> Dict[str, Any]:
+        """Return the execute options asking YepCode to call callback_url when done."""
+        return {
+            **options,
+            "settings": {**(options.get("settings") or {}), "callbackUrl": callback_url},
+        }
+
+
+class YepCodeRun(BaseYepCodeRun):
+    def __init__(
+        self,
+        config: Optional[YepCodeApiConfig] = None,
+        tracker: Union[bool, ExecutionTracker, None] = None,
+        callback_listener: Optional[ExecutionCallbackListener] = None,
+        process_cache: Union[bool, str, ProcessCache, None] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+        result_cache: Union[bool, str, ResultCache, None] = None,
+        process_cleaner: Union[bool, ProcessCleaner, None] = None,
+    ):
+        """
+        Initialize YepCodeRun with optional configuration.
+
+        Args:
+            config: API configuration. Read from the environment by default
+            tracker: ExecutionTracker used to refresh the executions status
+                in bulk, or True to create one. By default each execution
+                polls its own status
+            callback_listener: Complete executions when YepCode calls back
+                this listener, polling only as a safety net. Takes
+                precedence over the tracker
+            process_cache: Cache of the processes created for each code.
+                In memory by default; a path persists it to a JSON file and
+                False disables it
+            polling_strategy: Decides the wait between status polls of the
+                executions. AdaptivePolling by default, which waits for the
+                median duration of each process in process_stats
+            result_cache: Cache of the return values of runs with the same
+                code and parameters, for pure scripts. True keeps it in
+                memory and a path persists it to that directory. Disabled by
+                default; runs with the memoize option set to False skip it
+            process_cleaner: ProcessCleaner deleting the processes of
+                removeOnDone runs in the background once unused for a grace
+                period, or True to create one. By default they are deleted
+                by the run completion handlers
+        """
+        self.yepcode_api = YepCodeApiManager.get_instance(config)
+        self.process_cache = ProcessCache.from_option(process_cache)
+        self.result_cache = ResultCache.from_option(result_cache)
+        self._revalidations: set = set()
+        self._revalidations_lock = threading.Lock()
+        self.process_stats = ProcessStatsCollector()
+        self.polling_strategy = polling_strategy or AdaptivePolling(
+            stats=self.process_stats
+        )
+        self._create_process_calls = SingleFlight()
+        # Ids of the executions started by the runs, to tell apart the one of
+        # an execute-sync request whose response was lost
+        self._claimed_execution_ids: OrderedDict = OrderedDict()
+        self._claimed_execution_ids_lock = threading.Lock()
+        if tracker is True:
+            tracker = ExecutionTracker(self.yepcode_api)
+        self.tracker: Optional[ExecutionTracker] = tracker if tracker is not False else None
+        self.callback_listener = callback_listener
+        if process_cleaner is True:
+            process_cleaner = ProcessCleaner(self.yepcode_api)
+        self.process_cleaner: Optional[ProcessCleaner] = (
+            process_cleaner if process_cleaner is not False else None
+        )
+        if self.process_cleaner is not None:
+            self.process_cleaner.add_delete_callback(self._forget_process)
+
     def create_process(
         self, code: str, language: str, manifest: Optional[Dict[str, Any]] = None
     ) -> str:
-        """Create a new process or return existing one."""
-        if not language or not code:
-            raise ValueError("language and code are required")
+        """
+        Create a new process or return existing one.
+
+        Concurrent calls for the same code share a single lookup and
+        creation request.
+        """
+        process_slug = self._get_code_process_slug(code, language)
+        if process_id := self._get_cached_process_id(code, language, manifest):
+            return process_id
 
-        process_slug = self._get_process_slug(hashlib.sha256(code.encode()).hexdigest())
+        return self._create_process_calls.do(
+            self._get_process_cache_key(code, language, manifest),
+            lambda: self._get_or_create_process(process_slug, code, language, manifest),
+        )
 
+    def _get_or_create_process(
+        self,
+        process_slug: str,
+        code: str,
+        language: str,
+        manifest: Optional[Dict[str, Any]],
+    ) -> str:
         try:
             existing_process = self.yepcode_api.get_process(process_slug)
             if existing_process:
+                self._cache_process_id(code, language, manifest, existing_process["id"])
                 return existing_process["id"]
         except YepCodeApiError as error:
             if error.status != 404:
                 raise error
 
-        process = self.yepcode_api.create_process(
-            {
-                "name": process_slug,
-                "script": {
-                    "programmingLanguage": language.upper(),
-                    "sourceCode": code,
-                },
-                "tags": ["yc-run"],
-                **(
-                    {"manifest": manifest}
-                    if manifest
-                    else {
-                        "settings": {
-                            "dependencies": {
-                                "scopedToProcess": True,
-                                "autoDetect": True,
-                            }
-                        }
-                    }
-                ),
-            }
-        )
+        try:
+            process = self.yepcode_api.create_process(
+                self._get_create_process_data(process_slug, code, language, manifest)
+            )
+        except YepCodeApiError as error:
+            # Created meanwhile by another client
+            if error.status != 409:
+                raise error
+            process = self.yepcode_api.get_process(process_slug)
+        self._cache_process_id(code, language, manifest, process["id"])
         return process["id"]
 
     def run(self, code: str, options: Dict[str, Any] = None) -> Execution:
-        """Run code with specified options."""
+        """
+        Run code with specified options.
+
+        Returns as soon as the execution has been started. The returned
+        Execution is tracked in the background; use wait_for_done() or
+        result() to wait for it to finish.
+        """
         if options is None:
             options = {}
 
-        language = options.get("language", LanguageDetector.detect_language(code))
-        remove_on_done = options.get("removeOnDone", False)
-        manifest = options.get("manifest")
-        parameters = options.get("parameters", {})
+        run_options = self._get_run_options(code, options)
+
+        result_key = self._get_result_key(code, run_options, options)
+        if result_key and (result := self.result_cache.get(result_key)):
+            if self.result_cache.is_stale(result):
+                self._revalidate(result_key, code, options)
+            return self._get_cached_execution(result, options)
 
         process_id = self.create_process(
-            code=code, language=language, manifest=manifest
+            code=code,
+            language=run_options["language"],
+            manifest=run_options["manifest"],
         )
 
-        execution_response = self.yepcode_api.execute_process_async(
-            process_id, parameters, options
-        )
+        sync = self._use_sync_mode(run_options["mode"], options, process_id)
+        execute_options = options
+        callback_token = None
+        if self.callback_listener and not sync:
+            callback_token, callback_url = self.callback_listener.new_callback()
+            execute_options = self._with_callback_url(options, callback_url)
 
-        if remove_on_done:
+        self._acquire_process(process_id)
+        execute_started_at = time.monotonic()
+        try:
+            try:
+                execution_response = self._execute(
+                    process_id, run_options, execute_options, sync
+                )
+            except YepCodeApiError as error:
+                # The cached process may have been deleted: look it up again
+                if error.status != 404 or not self._forget_process(process_id):
+                    raise error
+                new_process_id = self.create_process(
+                    code=code,
+                    language=run_options["language"],
+                    manifest=run_options["manifest"],
+                )
+                self._acquire_process(new_process_id)
+                self._release_process(process_id)
+                process_id = new_process_id
+                execution_response = self._execute(
+                    process_id, run_options, execute_options, sync
+                )
+        except BaseException:
+            self._release_process(process_id)
+            if callback_token:
+                self.callback_listener.release(callback_token)
+            raise
+
+        if run_options["remove_on_done"] and self.process_cleaner is None:
             original_on_finish = options.get("onFinish", lambda x: None)
             original_on_error = options.get("onError", lambda x: None)
 
             def wrapped_on_finish(return_value):
+                self._forget_process(process_id)
                 self.yepcode_api.delete_process(process_id)
                 original_on_finish(return_value)
 
             def wrapped_on_error(error):
+                self._forget_process(process_id)
                 self.yepcode_api.delete_process(process_id)
                 original_on_error(error)
 
             options["onFinish"] = wrapped_on_finish
             options["onError"] = wrapped_on_error
 
+        on_finish = options.get("onFinish", lambda x: None)
+        if result_key:
+            on_finish = self._caching_result(
+                result_key, execution_response.get("executionId"), process_id, on_finish
+            )
+
         execution = Execution(
             yepcode_api=self.yepcode_api,
-            execution_id=execution_response["executionId"],
+            execution_id=execution_response.get("executionId"),
             events={
                 "onLog": options.get("onLog", lambda x: None),
-                "onFinish": options.get("onFinish", lambda x: None),
+                "onFinish": on_finish,
                 "onError": options.get("onError", lambda x: None),
             },
+            timeout=(
+                self._get_remaining_timeout(run_options, execute_started_at)
+                if sync
+                else run_options["timeout"]
+            ),
+            max_polls=run_options["max_polls"],
+            log_store=LogStore.from_option(options.get("logRetention")),
+            tracker=None if self.callback_listener else self.tracker,
+            process_id=process_id,
+            poll_interval=(
+                self.callback_listener.safety_poll_interval
+                if self.callback_listener and not sync
+                else None
+            ),
+            finished_data=self._get_sync_finished_data(execution_response, process_id),
+            polling_strategy=self.polling_strategy,
+            process_stats=self.process_stats,
         )
+        if self.process_cleaner is not None:
+            execution.add_done_callback(
+                lambda _: self._release_process(
+                    process_id, run_options["remove_on_done"]
+                )
+            )
+        if self.callback_listener and not sync:
+            self.callback_listener.bind(callback_token, execution)
         return execution
 
+    def _acquire_process(self, process_id: str) -> None:
+        if self.process_cleaner is not None:
+            self.process_cleaner.acquire(process_id)
+
+    def _release_process(self, process_id: str, remove: bool = False) -> None:
+        if self.process_cleaner is not None:
+            self.process_cleaner.release(process_id, remove)
+
+    def _get_cached_execution(
+        self, result: CachedResult, options: Dict[str, Any]
+    ) -> Execution:
+        """Finished Execution returning a cached result, with the logs of its run."""
+        return Execution(
+            yepcode_api=self.yepcode_api,
+            execution_id=result.execution_id,
+            events={
+                "onLog": options.get("onLog", lambda x: None),
+                "onFinish": options.get("onFinish", lambda x: None),
+                "onError": options.get("onError", lambda x: None),
+            },
+            log_store=LogStore.from_option(options.get("logRetention")),
+            process_id=result.process_id,
+            finished_data=self._get_cached_execution_data(result),
+        )
+
+    def _revalidate(self, result_key: str, code: str, options: Dict[str, Any]) -> None:
+        """Run the code again in the background to refresh a stale result."""
+        with self._revalidations_lock:
+            if result_key in self._revalidations:
+                return
+            self._revalidations.add(result_key)
+
+        def revalidate():
+            try:
+                execution = self.run(code, self._get_revalidation_options(options))
+                execution.wait_for_done()
+                self._cache_result(result_key, execution)
+            except Exception:
+                pass  # The stale result is served until it expires
+            finally:
+                with self._revalidations_lock:
+                    self._revalidations.discard(result_key)
+
+        threading.Thread(
+            target=revalidate, name="yepcode-revalidate", daemon=True
+        ).start()
+
+    def _execute(
+        self,
+        process_id: str,
+        run_options: Dict[str, Any],
+        execute_options: Dict[str, Any],
+        sync: bool,
+    ) -> Dict[str, Any]:
+        if not sync:
+            response = self.yepcode_api.execute_process_async(
+                process_id, run_options["parameters"], execute_options
+            )
+            self._claim_execution_id(response.get("executionId"))
+            return response
+
+        sync_options = self._with_correlation_comment(execute_options)
+        started_at = datetime.now(timezone.utc)
+        try:
+            response = self.yepcode_api.execute_process_sync_response(
+                process_id,
+                run_options["parameters"],
+                sync_options,
+                timeout=self._get_sync_timeout(run_options),
+            )
+        except (requests.ConnectionError, requests.Timeout) as error:
+            # The request never reached the API: nothing is running yet
+            if YepCodeApi._is_connect_error(error):
+                return self._execute(process_id, run_options, execute_options, False)
+            # Timed out or dropped while running: track it by polling
+            execution_id = self._find_execution_id(
+                process_id, run_options["parameters"], sync_options, started_at
+            )
+            if execution_id is None:
+                raise YepCodeExecutionTimeoutError(
+                    None,
+                    f"the execute-sync request of process {process_id} failed "
+                    f"({error}) and its execution wasn't found",
+                ) from error
+            return {"executionId": execution_id}
+        # Unidentified responses, unless the request was rejected (4xx)
+        if not response["executionId"] and not 400 <= response["status"] < 500:
+            response["executionId"] = self._find_execution_id(
+                process_id, run_options["parameters"], sync_options, started_at
+            )
+        self._check_sync_response(response, process_id)
+        self._claim_execution_id(response.get("executionId"))
+        return response
+
+    def _claim_execution_id(self, execution_id: Optional[str]) -> bool:
+        """Mark an execution as started by a run, returning False if it already was."""
+        if not execution_id:
+            return False
+        with self._claimed_execution_ids_lock:
+            if execution_id in self._claimed_execution_ids:
+                return False
+            self._claimed_execution_ids[execution_id] = None
+            while len(self._claimed_execution_ids) > self.CLAIMED_EXECUTIONS_WINDOW:
+                self._claimed_execution_ids.popitem(last=False)
+            return True
+
+    @staticmethod
+    def _with_correlation_comment(options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Give execute-sync requests without a comment a unique one, so that
+        their execution can be told apart from the ones of other runs.
+        """
+        if options.get("comment"):
+            return options
+        return {**options, "comment": f"yepcode-run:{uuid.uuid4().hex}"}
+
+    @staticmethod
+    def _parse_execution_parameters(parameters: Any) -> Any:
+        if isinstance(parameters, str):
+            try:
+                return json.loads(parameters)
+            except ValueError:
+                return parameters
+        return parameters or {}
+
+    def _find_execution_id(
+        self,
+        process_id: str,
+        parameters: Optional[Dict[str, Any]],
+        options: Dict[str, Any],
+        since: datetime,
+    ) -> Optional[str]:
+        """
+        Look up the execution started by an execute-sync request whose
+        response was lost: an execution of the process started since then
+        with the same comment and parameters, that no other run of this
+        runner has claimed. Processes are shared by every runner of the
+        team, so nothing else identifies it reliably.
+        """
+        response = self.yepcode_api.get_executions(
+            {
+                "processId": process_id,
+                "from": (since - ExecutionTracker.WINDOW_MARGIN).replace(tzinfo=None),
+                "limit": ExecutionTracker.PAGE_LIMIT,
+            }
+        )
+        for execution_data in response.get("data") or []:
+            if (
+                execution_data.get("comment") == options.get("comment")
+                and self._parse_execution_parameters(execution_data.get("parameters"))
+                == (parameters or {})
+                and self._claim_execution_id(execution_data.get("id"))
+            ):
+                return execution_data["id"]
+        return None
+
+    def run_many(
+        self,
+        code: str,
+        parameters: Iterable[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None,
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Run code once per parameters dict, keeping at most concurrency
+        executions running at a time.
+
+        The process is created once, before the first execution. Results are
+        yielded as executions finish, or in input order if ordered is True.
+        A failed item is reported in its BatchResult.error and doesn't stop
+        the batch.
+
+        Args:
+            code: Source code to run
+            parameters: Parameters of each execution. Consumed lazily
+            options: Same options as run(), shared by every execution. Items
+                always run in async mode
+            concurrency: Maximum number of executions running at once
+            ordered: Yield the results in input order
+
+        Returns:
+            Iterator of BatchResult
+        """
+        options = options or {}
+        run_options = self._get_run_options(code, options)
+        process_id = self.create_process(
+            code=code,
+            language=run_options["language"],
+            manifest=run_options["manifest"],
+        )
+
+        self._acquire_process(process_id)
+        try:
+            yield from iter_batch(
+                lambda item_parameters: self.run(
+                    code, self._get_batch_item_options(options, item_parameters)
+                ),
+                parameters,
+                concurrency,
+                ordered,
+            )
+        finally:
+            if self.process_cleaner is not None:
+                self._release_process(process_id, run_options["remove_on_done"])
+            elif run_options["remove_on_done"]:
+                self._forget_process(process_id)
+                self.yepcode_api.delete_process(process_id)
+
+    def map(
+        self,
+        code: str,
+        parameters: Iterable[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None,
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Like run_many(), but yield the return values in input order.
+
+        A failed item raises its error when reached, unless return_exceptions
+        is True, in which case the error is yielded in its place.
+        """
+        for result in self.run_many(
+            code, parameters, options, concurrency=concurrency, ordered=True
+        ):
+            if result.error is None:
+                yield result.return_value
+            elif return_exceptions:
+                yield result.error
+            else:
+                raise result.error
+
+    def prewarm(
+        self,
+        snippets: Iterable[Union[str, Dict[str, Any]]],
+        execute: bool = False,
+        concurrency: int = 4,
+        wait: bool = False,
+    ) -> List[PrewarmedProcess]:
+        """
+        Create the processes of the given snippets in the background, so the
+        first runs of that code don't wait for it.
+
+        Runs of a snippet use its process once ready, and wait for its
+        creation (instead of starting another one) while it's in progress.
+
+        Args:
+            snippets: Source code strings, or dicts with the ``code`` and
+                optionally its ``language``, ``manifest`` and ``parameters``
+            execute: Also run each snippet once, with its parameters, so
+                its dependencies are installed before the first real run
+            concurrency: Maximum number of snippets warmed up at once
+            wait: Block until every snippet is warmed up
+
+        Returns:
+            PrewarmedProcess of each snippet, updated as they get ready.
+            Failures are reported in their error
+        """
+        items = self._get_prewarm_items(snippets)
+        pool = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="yepcode-prewarm"
+        )
+        for item in items:
+            pool.submit(self._prewarm_process, item, execute)
+        pool.shutdown(wait=wait)
+        return items
+
+    def _prewarm_process(self, item: PrewarmedProcess, execute: bool) -> None:
+        try:
+            item.process_id = self.create_process(item.code, item.language, item.manifest)
+            if execute:
+                self.run(item.code, item.get_run_options()).wait_for_done()
+        except Exception as error:
+            item.error = error
+        finally:
+            item.done = True
+
     def get_execution(self, execution_id: str) -> Execution:
         """Get an existing execution by ID."""
         if not execution_id:
             raise ValueError("executionId is required")
 
-        execution = Execution(yepcode_api=self.yepcode_api, execution_id=execution_id)
+        execution = Execution(
+            yepcode_api=self.yepcode_api,
+            execution_id=execution_id,
+            tracker=self.tracker,
+            polling_strategy=self.polling_strategy,
+            process_stats=self.process_stats,
+        )
         return execution
@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from ..api.api_manager import YepCodeApiManager
+from ..api.types import (
+    CreateSignedUrlInput,
+    CreateStorageObjectInput,
+    SignedUrl,
+    StorageObject,
+    YepCodeApiConfig,
+)
+
+
+class AsyncYepCodeStorage:
+    def __init__(self, config: YepCodeApiConfig = None):
+        """
+        Initialize AsyncYepCodeStorage with optional configuration.
+
+        Args:
+            config: YepCodeApiConfig instance for API configuration
+        """
+        self._api = YepCodeApiManager.get_async_instance(config)
+
+    async def download(self, name: str) -> bytes:
+        return (await self._api.get_object(name)).content
+
+    async def upload(self, name: str, file: bytes) -> StorageObject:
+        return await self._api.create_object(
+            CreateStorageObjectInput(name=name, file=file)
+        )
+
+    async def delete(self, name: str) -> None:
+        return await self._api.delete_object(name)
+
+    async def list(self, **kwargs) -> List[StorageObject]:
+        return await self._api.get_objects(kwargs if kwargs else None)
+
+    async def create_signed_url(
+        self, name: str, expires_in_seconds: Optional[int] = None
+    ) -> SignedUrl:
+        return await self._api.create_signed_url(
+            CreateSignedUrlInput(path=name, expires_in_seconds=expires_in_seconds)
+        )
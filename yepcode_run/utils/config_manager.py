@@ -1,6 +1,8 @@
+import json
 import os
 import re
-from typing import Dict, Any
+from dataclasses import fields, is_dataclass
+from typing import Dict, Any, get_type_hints, get_origin, get_args, Union
 from dotenv import load_dotenv
 from ..api.types import YepCodeApiConfig
 
@@ -19,4 +21,53 @@ class ConfigManager:
                 env_config[config_key] = value
 
         # Create and return YepCodeApiConfig instance
-        return YepCodeApiConfig(**env_config)
+        return YepCodeApiConfig(**ConfigManager._coerce_env_values(env_config))
+
+    @staticmethod
+    def _coerce_env_values(env_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert string values read from the environment to the type declared
+        in YepCodeApiConfig (int, float or bool). Dict fields are read as JSON
+        objects, ie: YEPCODE_RATE_LIMITS='{"polling": {"rate": 10}}'.
+        """
+        type_hints = get_type_hints(YepCodeApiConfig)
+        coerced: Dict[str, Any] = {}
+        for field in fields(YepCodeApiConfig):
+            if field.name not in env_config:
+                continue
+            value = env_config[field.name]
+            field_type = type_hints[field.name]
+            if get_origin(field_type) is Union:
+                field_type = next(
+                    (arg for arg in get_args(field_type) if arg is not type(None)),
+                    str,
+                )
+            if field_type is bool:
+                value = value.strip().lower() in ("1", "true", "yes", "on")
+            elif field_type is int:
+                value = int(value)
+            elif field_type is float:
+                value = float(value)
+            elif get_origin(field_type) is dict:
+                value = ConfigManager._parse_env_dict(field.name, value, field_type)
+            coerced[field.name] = value
+        # Keep unknown keys so that misconfigurations keep surfacing as before
+        coerced.update({k: v for k, v in env_config.items() if k not in coerced})
+        return coerced
+
+    @staticmethod
+    def _parse_env_dict(name: str, value: str, field_type: Any) -> Dict[str, Any]:
+        env_name = f"YEPCODE_{name.upper()}"
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{env_name} must be a JSON object: {error}") from None
+        if not isinstance(parsed, dict):
+            raise ValueError(f"{env_name} must be a JSON object")
+        value_type = get_args(field_type)[1]
+        if not is_dataclass(value_type):
+            return parsed
+        try:
+            return {key: value_type(**item) for key, item in parsed.items()}
+        except TypeError as error:
+            raise ValueError(f"Invalid {env_name} entry: {error}") from None